@@ -0,0 +1,26 @@
+"""Optional Numba-accelerated kernels for loss auditing.
+
+Importing this module never requires numba: when numba is unavailable the
+module exposes ``nondefault_mask = None`` and callers fall back to plain
+NumPy expressions. When numba *is* installed (hepconduit[numba]), the
+jitted kernel fuses the two comparisons of the non-default rule into a
+single pass, avoiding the intermediate boolean temporaries that
+``(arr != 0) & (arr != 9.0)`` allocates.
+"""
+from __future__ import annotations
+
+try:
+    import numba
+    import numpy as np
+
+    @numba.njit(cache=True)
+    def nondefault_mask(col):  # pragma: no cover - exercised only with numba
+        """Boolean mask of entries that are neither 0 nor the 9.0 sentinel."""
+        out = np.empty(col.shape[0], dtype=np.bool_)
+        for i in range(col.shape[0]):
+            v = col[i]
+            out[i] = v != 0 and v != 9.0
+        return out
+
+except ImportError:  # numba (or numpy) not installed
+    nondefault_mask = None
@@ -0,0 +1,46 @@
+"""Optional Numba-accelerated kinematics kernels.
+
+Importing this module never requires numba: when numba is unavailable
+every kernel is ``None`` and ``Event.kinematics_arrays`` falls back to
+plain NumPy expressions. When numba *is* installed (hepconduit[numba]),
+the ``@vectorize`` kernels compile to SIMD loops over the transcendental
+math, with the same degenerate-case handling as the scalar Particle
+properties.
+"""
+from __future__ import annotations
+
+import math
+
+try:
+    import numba
+
+    @numba.vectorize(["float64(float64, float64)"], cache=True)
+    def pt(px, py):  # pragma: no cover - exercised only with numba
+        return math.sqrt(px * px + py * py)
+
+    @numba.vectorize(["float64(float64, float64, float64)"], cache=True)
+    def eta(px, py, pz):  # pragma: no cover - exercised only with numba
+        p = math.sqrt(px * px + py * py + pz * pz)
+        if p == abs(pz):
+            return math.inf if pz >= 0 else -math.inf
+        return 0.5 * math.log((p + pz) / (p - pz))
+
+    @numba.vectorize(["float64(float64, float64)"], cache=True)
+    def phi(py, px):  # pragma: no cover - exercised only with numba
+        return math.atan2(py, px)
+
+    @numba.vectorize(["float64(float64, float64)"], cache=True)
+    def rapidity(e, pz):  # pragma: no cover - exercised only with numba
+        if e == abs(pz):
+            return math.inf if pz >= 0 else -math.inf
+        return 0.5 * math.log((e + pz) / (e - pz))
+
+    @numba.vectorize(["float64(float64, float64, float64, float64)"], cache=True)
+    def mass(e, px, py, pz):  # pragma: no cover - exercised only with numba
+        m2 = e * e - (px * px + (py * py + pz * pz))
+        if m2 < 0 and -m2 < 1e-8:
+            m2 = 0.0
+        return math.sqrt(m2) if m2 >= 0 else -math.sqrt(-m2)
+
+except ImportError:  # numba not installed
+    pt = eta = phi = rapidity = mass = None
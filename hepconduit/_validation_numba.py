@@ -0,0 +1,76 @@
+"""Optional Numba-accelerated validation kernel.
+
+Importing this module never requires numba: when numba is unavailable
+``validate_particles`` is ``None`` and ``validate_event`` uses its NumPy
+expressions instead. When numba *is* installed (hepconduit[numba]), the
+``@njit`` kernel runs the energy, mass-consistency and momentum-sum
+checks as one native loop over the particle columns, returning only the
+flagged indices and the four-momentum sums; Python then builds the
+ValidationIssue objects. The arithmetic (including the computed-mass
+tiny-negative clamp) matches the scalar checks exactly.
+"""
+from __future__ import annotations
+
+import math
+
+try:
+    import numba
+    import numpy as np
+
+    @numba.njit(cache=True)
+    def validate_particles(px, py, pz, e, mass, status, mass_tol):  # pragma: no cover - exercised only with numba
+        """One-pass energy/mass/momentum checks over particle columns.
+
+        Returns ``(bad_energy, bad_mass, computed, rel, sum_in, sum_out,
+        n_in, n_out)``: indices of negative-energy particles, indices of
+        mass-inconsistent particles with their computed mass and relative
+        difference, and the status-(-1)/status-1 four-momentum sums with
+        the corresponding particle counts.
+        """
+        n = px.shape[0]
+        bad_e = np.empty(n, np.int64)
+        ne = 0
+        bad_m = np.empty(n, np.int64)
+        comp = np.empty(n, np.float64)
+        rel = np.empty(n, np.float64)
+        nm = 0
+        sum_in = np.zeros(4, np.float64)
+        sum_out = np.zeros(4, np.float64)
+        n_in = 0
+        n_out = 0
+        for i in range(n):
+            if e[i] < 0:
+                bad_e[ne] = i
+                ne += 1
+            m = mass[i]
+            if abs(m) >= 1e-3:
+                m2 = e[i] * e[i] - (px[i] * px[i] + (py[i] * py[i] + pz[i] * pz[i]))
+                if -1e-8 < m2 < 0.0:
+                    m2 = 0.0
+                c = math.sqrt(m2) if m2 >= 0 else -math.sqrt(-m2)
+                r = abs(c - m) / max(abs(m), 1e-12)
+                if r > mass_tol:
+                    bad_m[nm] = i
+                    comp[nm] = c
+                    rel[nm] = r
+                    nm += 1
+            s = status[i]
+            if s == -1:
+                sum_in[0] += px[i]
+                sum_in[1] += py[i]
+                sum_in[2] += pz[i]
+                sum_in[3] += e[i]
+                n_in += 1
+            elif s == 1:
+                sum_out[0] += px[i]
+                sum_out[1] += py[i]
+                sum_out[2] += pz[i]
+                sum_out[3] += e[i]
+                n_out += 1
+        return (
+            bad_e[:ne].copy(), bad_m[:nm].copy(), comp[:nm].copy(), rel[:nm].copy(),
+            sum_in, sum_out, n_in, n_out,
+        )
+
+except ImportError:  # numba not installed
+    validate_particles = None
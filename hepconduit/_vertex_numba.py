@@ -0,0 +1,75 @@
+"""Optional Numba-accelerated vertex grouping kernel.
+
+Importing this module never requires numba: when numba is unavailable
+``group_mothers`` is ``None`` and the parquet vertex builder falls back
+to its NumPy / scalar paths. When numba *is* installed
+(hepconduit[numba]), the ``@njit`` kernel runs the whole integer loop --
+dedup of canonicalized (mother1, mother2) pairs plus the scatter of
+incoming/outgoing barcodes -- as native code, returning flat arrays from
+which Python only has to construct the Vertex objects.
+"""
+from __future__ import annotations
+
+try:
+    import numba
+    import numpy as np
+    from numba import int64
+    from numba.typed import Dict
+
+    @numba.njit(cache=True)
+    def group_mothers(m1, m2, barcode):  # pragma: no cover - exercised only with numba
+        """Group particles by canonical mother pair, in first-encounter order.
+
+        Returns ``(vtx_of, end_vtx_of, out_flat, out_offsets, in_flat,
+        in_offsets)`` where ``vtx_of[i]`` is the production-vertex rank of
+        particle ``i``, ``end_vtx_of[j]`` the (negative) end-vertex barcode
+        of mother ``j`` or 0, and the flat/offsets pairs hold each rank's
+        outgoing and incoming particle barcodes in particle order.
+        """
+        n = m1.shape[0]
+        key2vtx = Dict.empty(key_type=int64, value_type=int64)
+        vtx_of = np.empty(n, np.int64)
+        nv = 0
+        for i in range(n):
+            a, b = m1[i], m2[i]
+            lo, hi = (a, b) if a <= b else (b, a)
+            # Sorted-pair key packed into one int64 for O(1) dict probes.
+            key = (hi << 32) | (lo & 0xFFFFFFFF)
+            if key in key2vtx:
+                vtx_of[i] = key2vtx[key]
+            else:
+                key2vtx[key] = nv
+                vtx_of[i] = nv
+                nv += 1
+
+        out_offsets = np.zeros(nv + 1, np.int64)
+        in_offsets = np.zeros(nv + 1, np.int64)
+        for i in range(n):
+            r = vtx_of[i]
+            out_offsets[r + 1] += 1
+            if 1 <= m1[i] <= n:
+                in_offsets[r + 1] += 1
+            if 1 <= m2[i] <= n:
+                in_offsets[r + 1] += 1
+        for r in range(nv):
+            out_offsets[r + 1] += out_offsets[r]
+            in_offsets[r + 1] += in_offsets[r]
+
+        out_flat = np.empty(n, np.int64)
+        in_flat = np.empty(in_offsets[nv], np.int64)
+        end_vtx_of = np.zeros(n, np.int64)
+        out_cur = out_offsets[:-1].copy()
+        in_cur = in_offsets[:-1].copy()
+        for i in range(n):
+            r = vtx_of[i]
+            out_flat[out_cur[r]] = barcode[i]
+            out_cur[r] += 1
+            for m in (m1[i], m2[i]):
+                if 1 <= m <= n:
+                    in_flat[in_cur[r]] = barcode[m - 1]
+                    in_cur[r] += 1
+                    end_vtx_of[m - 1] = -1 - r
+        return vtx_of, end_vtx_of, out_flat, out_offsets, in_flat, in_offsets
+
+except ImportError:  # numba not installed
+    group_mothers = None
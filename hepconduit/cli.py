@@ -14,7 +14,24 @@ import json
 import sys
 from pathlib import Path
 
-import hepconduit
+
+def _version() -> str:
+    """Package version without importing the full hepconduit package.
+
+    Importing hepconduit pulls in every format module (and scans plugin
+    entry points), which dominates CLI startup time. Prefer the installed
+    distribution metadata and fall back to the package import only when
+    running from an uninstalled checkout.
+    """
+    try:
+        from importlib.metadata import version
+
+        return version("hepconduit")
+    except Exception:
+        import hepconduit
+
+        return hepconduit.__version__
+
 
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -23,7 +40,7 @@ def _build_parser() -> argparse.ArgumentParser:
         "Like pandoc for particle physics.",
     )
     parser.add_argument(
-        "--version", action="version", version=f"%(prog)s {hepconduit.__version__}"
+        "--version", action="version", version=f"%(prog)s {_version()}"
     )
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
@@ -65,6 +82,15 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Suppress progress output",
     )
 
+    convert_parser.add_argument(
+        "--passthrough", action="store_true",
+        help=(
+            "Copy bytes directly when input and output formats match "
+            "(honouring .gz), skipping event parsing. Incompatible with "
+            "--filter/--max-events/--validate."
+        ),
+    )
+
     convert_parser.add_argument(
         "--report",
         default="auto",
@@ -213,6 +239,30 @@ def _build_parser() -> argparse.ArgumentParser:
 def _cmd_convert(args: argparse.Namespace) -> int:
     from .convert import convert
 
+    if args.passthrough:
+        from .io.registry import detect_format, get_writer
+
+        if args.filter_expr or args.max_events >= 0 or args.validate:
+            print(
+                "Error: --passthrough cannot be combined with --filter/--max-events/--validate",
+                file=sys.stderr,
+            )
+            return 1
+        in_fmt = args.input_format or detect_format(args.input)
+        out_fmt = args.output_format or detect_format(args.output)
+        if in_fmt != out_fmt:
+            print(
+                f"Error: --passthrough requires matching formats (got {in_fmt} -> {out_fmt})",
+                file=sys.stderr,
+            )
+            return 1
+        try:
+            get_writer(out_fmt).passthrough(args.input, args.output)
+        except (ValueError, FileNotFoundError, OSError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        return 0
+
     writer_kwargs = {}
     if args.columnar:
         writer_kwargs["columnar"] = True
@@ -413,8 +463,17 @@ def _cmd_validate(args: argparse.Namespace) -> int:
 
 def main(argv: list[str] | None = None) -> int:
     """Main CLI entry point."""
+    raw_args = sys.argv[1:] if argv is None else list(argv)
+
+    # Fast path: `hepconduit --version` is common in CI wrappers, and
+    # building the full subparser tree (8 subcommands, ~40 arguments)
+    # costs tens of milliseconds it doesn't need.
+    if raw_args == ["--version"]:
+        print(f"hepconduit {_version()}")
+        return 0
+
     parser = _build_parser()
-    args = parser.parse_args(argv)
+    args = parser.parse_args(raw_args)
 
     if args.command is None:
         parser.print_help()
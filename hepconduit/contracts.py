@@ -1,6 +1,9 @@
 from __future__ import annotations
-from .contract_packs import PACKS as EXTRA_PACKS, EXTRA_CONTRACTS
+from .contract_packs import PACKS as EXTRA_PACKS, EXTRA_CONTRACTS, _parallel_contracts_enabled
 
+import copy
+import inspect
+import io
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
@@ -9,7 +12,7 @@ from typing import Any, Dict, List, Optional
 import hepconduit
 
 from .convert import convert, read
-from .fingerprint import FingerprintConfig, fingerprint_event
+from .fingerprint import DEFAULT_CFG, FingerprintConfig, fingerprint_event
 from .validation import validate
 
 
@@ -39,10 +42,61 @@ _BUILTIN_PACKS.update(EXTRA_PACKS)
 
 
 
+# Memoized parses/fingerprints keyed on (abspath, mtime_ns, size[, cfg]):
+# packs run several contracts against the same input, and re-parsing it for
+# each one doubles (or worse) the I/O. The stat key invalidates naturally
+# when the file changes; a small cap keeps memory bounded.
+_READ_CACHE: Dict[tuple, Any] = {}
+_CACHE_MAX = 8
+
+
+def _path_key(path: str, fmt: Optional[str]) -> tuple:
+    import os
+
+    p = os.path.abspath(str(path))
+    st = os.stat(p)
+    return (p, st.st_mtime_ns, st.st_size, fmt)
+
+
+def _cached_read(path: str, fmt: Optional[str] = None):
+    key = _path_key(path, fmt)
+    ef = _READ_CACHE.get(key)
+    if ef is None:
+        ef = read(path, format=fmt) if fmt else read(path)
+        _READ_CACHE[key] = ef
+        while len(_READ_CACHE) > _CACHE_MAX:
+            _READ_CACHE.pop(next(iter(_READ_CACHE)))
+    return ef
+
+
+def _fingerprint_streams_differ(events_a, events_b, cfg: FingerprintConfig) -> bool:
+    """Pairwise-compare two event streams by fingerprint, in O(1) memory.
+
+    Events are hashed one pair at a time and the comparison bails on the
+    first mismatch, so no fingerprint list is materialised and the tail of
+    a diverged stream is never hashed. A length difference is a mismatch.
+    """
+    from itertools import zip_longest
+
+    for a, b in zip_longest(events_a, events_b, fillvalue=None):
+        if a is None or b is None:
+            return True
+        if fingerprint_event(a, cfg=cfg) != fingerprint_event(b, cfg=cfg):
+            return True
+    return False
+
+
+# Membership set built once at import; available_contracts() keeps returning
+# a sorted list for the public API. hepmc3_roundtrip_fidelity_v1 lives in
+# EXTRA_CONTRACTS (contract_packs), which the dispatch below checks first.
+_AVAILABLE_CONTRACTS = frozenset(
+    {"roundtrip_v1", "validate_only_v1"}
+) | frozenset(EXTRA_CONTRACTS)
+
+
 def available_contracts() -> List[str]:
     # Builtin contracts implemented in this module, plus plugin/extra contracts.
-    builtins = ["roundtrip_v1", "validate_only_v1", "hepmc3_roundtrip_fidelity_v1"]
-    return sorted(set(builtins) | set(EXTRA_CONTRACTS.keys()))
+    return sorted(_AVAILABLE_CONTRACTS)
 
 
 def available_packs() -> List[str]:
@@ -58,7 +112,19 @@ def run_contract(
 ) -> ContractResult:
     # Extra/plugin contracts dispatch
     if contract in EXTRA_CONTRACTS:
-        r = EXTRA_CONTRACTS[contract](input_path)
+        fn = EXTRA_CONTRACTS[contract]
+        # External contracts registered via plugins may predate the strict
+        # keyword; probe the signature rather than catching TypeError
+        # around the call, which would silently re-run a contract whose
+        # body raised TypeError for its own reasons.
+        try:
+            params = inspect.signature(fn).parameters
+            takes_strict = "strict" in params or any(
+                p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+            )
+        except (TypeError, ValueError):  # builtins/C callables: assume current API
+            takes_strict = True
+        r = fn(input_path, strict=strict) if takes_strict else fn(input_path)
         # Accept either this module's ContractResult or external (name/passed/message)
         if isinstance(r, ContractResult):
             return r
@@ -66,14 +132,14 @@ def run_contract(
             return ContractResult(contract=r.name, ok=bool(r.passed), details={'message': getattr(r, 'message', '')})
         return ContractResult(contract=contract, ok=bool(getattr(r, 'passed', False)), details={'result': str(r)})
 
-    if contract not in set(available_contracts()):
+    if contract not in _AVAILABLE_CONTRACTS:
         raise ValueError(f"Unknown contract: {contract}. Available: {', '.join(available_contracts())}")
 
     mom_tol = 1e-6 if strict else 1e-4
     mass_tol = 1e-4 if strict else 1e-2
 
     if contract == "validate_only_v1":
-        ef = read(input_path)
+        ef = _cached_read(input_path)
         rep = validate(ef, momentum_tolerance=mom_tol, mass_tolerance=mass_tol)
         ok = rep.is_valid
         return ContractResult(
@@ -82,69 +148,40 @@ def run_contract(
             details={"validation": rep.to_dict() if hasattr(rep, "to_dict") else str(rep)},
         )
 
-    if contract == "hepmc3_roundtrip_fidelity_v1":
-        ef_in = read(input_path, format="hepmc3")
-        cfg = FingerprintConfig(include_graph=True, include_weights=True)
-        fp_in = [fingerprint_event(ev, cfg=cfg) for ev in ef_in.events]
-        run_in = ef_in.run_info
-
-        with tempfile.TemporaryDirectory(prefix="hepconduit_contract_") as td:
-            td_path = Path(td)
-            outp = td_path / "out.hepmc"
-            convert(input_path, outp, input_format="hepmc3", output_format="hepmc3", quiet=True, report="none", provenance="none")
-            ef_out = read(outp, format="hepmc3")
-
-        run_out = ef_out.run_info
-        fp_out = [fingerprint_event(ev, cfg=cfg) for ev in ef_out.events]
-
-        ok = True
-        reasons = []
-
-        # Run-level: units + weight names
-        if (run_in.extra or {}).get("units") != (run_out.extra or {}).get("units"):
-            ok = False
-            reasons.append("units_changed")
-        if list(run_in.weight_names or []) != list(run_out.weight_names or []):
-            ok = False
-            reasons.append("weight_names_changed")
-
-        # Event-level: counts, weights, graph stable fingerprints
-        if len(ef_in.events) != len(ef_out.events):
-            ok = False
-            reasons.append("event_count_changed")
-        if fp_in != fp_out:
-            ok = False
-            reasons.append("event_fingerprints_changed")
-
-        return ContractResult(
-            contract=contract,
-            ok=ok,
-            details={
-                "tool": {"name": "hepconduit", "version": hepconduit.__version__},
-                "reasons": reasons,
-                "n_events": {"input": len(ef_in.events), "out": len(ef_out.events)},
-                "run": {"input": {"units": (run_in.extra or {}).get("units"), "weight_names": run_in.weight_names},
-                        "out": {"units": (run_out.extra or {}).get("units"), "weight_names": run_out.weight_names}},
-            },
-        )
-
     # roundtrip_v1: parse -> validate -> convert -> reparse -> invariants
-    ef_in = read(input_path)
+    ef_in = _cached_read(input_path)
     rep_in = validate(ef_in, momentum_tolerance=mom_tol, mass_tolerance=mass_tol)
-    cfg = FingerprintConfig()
-    fp_in = [fingerprint_event(ev, cfg=cfg) for ev in ef_in.events]
-
-    with tempfile.TemporaryDirectory(prefix="hepconduit_contract_") as td:
-        td_path = Path(td)
-        mid = td_path / f"mid.{to_format}"
-        back = td_path / "back.lhe"
+    cfg = DEFAULT_CFG
+
+    if to_format == "hepmc3":
+        # Default path: both hops are text formats, so the roundtrip stays
+        # in StringIO buffers with no temp files.
+        from .io.hepmc3 import HepMC3Writer, read_hepmc3
+        from .io.lhe import LHEReader, LHEWriter
+
+        mid_buf = io.StringIO()
+        # Writers mutate events in place (vertex building assigns
+        # barcodes and fills ev.vertices); the memoized EventFile must
+        # keep what the reader produced, so hand the writer a deep copy.
+        HepMC3Writer().write(mid_buf, copy.deepcopy(ef_in.events), ef_in.run_info)
+        ef_mid = read_hepmc3(io.StringIO(mid_buf.getvalue()))
+
+        back_buf = io.StringIO()
+        LHEWriter().write(back_buf, ef_mid.events, ef_mid.run_info)
+        ef_back = LHEReader().read(io.StringIO(back_buf.getvalue()))
+    else:
+        # Binary intermediates (e.g. Parquet) go through real files.
+        with tempfile.TemporaryDirectory(prefix="hepconduit_contract_") as td:
+            td_path = Path(td)
+            mid = td_path / f"mid.{to_format}"
+            back = td_path / "back.lhe"
 
-        convert(input_path, mid, output_format=to_format, quiet=True, report="none", provenance="none")
-        convert(mid, back, output_format="lhe", quiet=True, report="none", provenance="none")
+            convert(input_path, mid, output_format=to_format, quiet=True, report="none", provenance="none")
+            convert(mid, back, output_format="lhe", quiet=True, report="none", provenance="none")
+            ef_back = read(back)
 
-        ef_back = read(back)
-        rep_back = validate(ef_back, momentum_tolerance=mom_tol, mass_tolerance=mass_tol)
-        fp_back = [fingerprint_event(ev, cfg=cfg) for ev in ef_back.events]
+    rep_back = validate(ef_back, momentum_tolerance=mom_tol, mass_tolerance=mass_tol)
+    fp_changed = _fingerprint_streams_differ(ef_in.events, ef_back.events, cfg)
 
     ok = True
     reasons = []
@@ -157,7 +194,7 @@ def run_contract(
     if len(ef_in.events) != len(ef_back.events):
         ok = False
         reasons.append("event_count_changed")
-    if fp_in != fp_back:
+    if fp_changed:
         ok = False
         reasons.append("fingerprints_changed")
 
@@ -183,22 +220,36 @@ def run_contract_pack(
     pack: str,
     to_format: str = "hepmc3",
     strict: bool = False,
+    parallel: Optional[bool] = None,
 ) -> ContractPackResult:
     if pack not in _BUILTIN_PACKS:
         raise ValueError(f"Unknown pack: {pack}. Available: {', '.join(available_packs())}")
 
-    results: List[ContractResult] = []
-    ok = True
-    for c in _BUILTIN_PACKS[pack]:
-        # hepmc3 fidelity contract doesn't use to_format; others do.
-        if c == "hepmc3_roundtrip_fidelity_v1":
-            r = run_contract(input_path, contract=c, strict=strict)
-        else:
-            r = run_contract(input_path, contract=c, to_format=to_format, strict=strict)
-        results.append(r)
-        if not r.ok:
-            ok = False
-
+    contracts = _BUILTIN_PACKS[pack]
+    # Per-contract kwargs; the hepmc3 fidelity contract doesn't use to_format.
+    calls = [
+        {"contract": c, "strict": strict} if c == "hepmc3_roundtrip_fidelity_v1"
+        else {"contract": c, "to_format": to_format, "strict": strict}
+        for c in contracts
+    ]
+
+    if parallel is None:
+        parallel = _parallel_contracts_enabled()
+
+    if parallel and len(calls) > 1:
+        # Contracts within a pack are independent and each one re-parses
+        # and roundtrips the input, so they scale across worker processes.
+        # Single-contract packs skip pool startup entirely.
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(len(calls), os.cpu_count() or 1)) as ex:
+            futures = [ex.submit(run_contract, input_path, **kw) for kw in calls]
+            results = [f.result() for f in futures]
+    else:
+        results = [run_contract(input_path, **kw) for kw in calls]
+
+    ok = all(r.ok for r in results)
     return ContractPackResult(pack=pack, ok=ok, results=results)
 
 
@@ -92,21 +92,20 @@ def convert(
     if not quiet:
         print(f"Reading {input_format}: {input_path}", file=sys.stderr)
 
-    # Count input events with a separate pass (best-effort). This keeps the main
-    # conversion pipeline streaming.
-    n_input = -1
-    try:
-        base_iter = reader.iter_events(str(input_path))
-        if max_events >= 0:
-            base_iter = itertools.islice(base_iter, max_events)
-        n_input = sum(1 for _ in base_iter)
-    except Exception:
-        n_input = -1
+    # Build the streaming pipeline. Input events are counted in-line at the
+    # head of the pipeline rather than with a separate parsing pass.
+    n_input = 0
+
+    def _in_counting(it):
+        nonlocal n_input
+        for ev in it:
+            n_input += 1
+            yield ev
 
-    # Build the streaming pipeline
     ev_iter = reader.iter_events(str(input_path))
     if max_events >= 0:
         ev_iter = itertools.islice(ev_iter, max_events)
+    ev_iter = _in_counting(ev_iter)
 
     if filter_expr:
         if not quiet:
@@ -167,8 +166,9 @@ def convert(
         "provenance": prov,
     }
 
-    # Embed provenance/metadata where supported (currently Parquet only)
-    if provenance != "none":
+    # Embed provenance/metadata where supported (currently Parquet only).
+    # Writers without metadata support skip the serialization entirely.
+    if provenance != "none" and getattr(writer, "supports_metadata", False):
         md = writer_kwargs.get("metadata", {}) or {}
         # Keep metadata keys short-ish for Parquet KV store.
         md["hepconduit_provenance"] = stable_json_dumps(prov)
@@ -236,22 +236,26 @@ def info(filepath: Union[str, Path], format: Optional[str] = None) -> dict:
     except Exception:
         run_info = None
 
+    from collections import Counter
+
     n_events = 0
     total_particles = 0
-    pdg_counts: dict[int, int] = {}
-    status_counts: dict[int, int] = {}
+    pdg_counts: Counter[int] = Counter()
+    status_counts: Counter[int] = Counter()
 
     for ev in reader.iter_events(str(filepath)):
         n_events += 1
-        total_particles += len(ev.particles)
-        for p in ev.particles:
-            pdg_counts[p.pdg_id] = pdg_counts.get(p.pdg_id, 0) + 1
-            status_counts[p.status] = status_counts.get(p.status, 0) + 1
+        parts = ev.particles
+        total_particles += len(parts)
+        # One C-level Counter.update per event instead of two dict
+        # get-and-store operations per particle.
+        pdg_counts.update(p.pdg_id for p in parts)
+        status_counts.update(p.status for p in parts)
 
     from .pdg import name as pdg_name
 
-    top_pdg = sorted(pdg_counts.items(), key=lambda x: -x[1])[:20]
-    top_named = [(pdg_name(pid), count) for pid, count in top_pdg]
+    # most_common uses a heap: O(N log 20) rather than a full sort.
+    top_named = [(pdg_name(pid), count) for pid, count in pdg_counts.most_common(20)]
 
     beam_pdg_id = (0, 0)
     beam_energy = (0.0, 0.0)
@@ -21,6 +21,15 @@ from typing import Any, Callable, Iterable, Iterator, Mapping
 
 from .models import Event
 
+try:  # optional: vectorized variable computation for large events (hepconduit[numpy])
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Below this many particles the plain loop wins; array setup overhead
+# dominates for small events.
+_VECTORIZE_MIN_PARTICLES = 32
+
 ALLOWED_FUNCS: dict[str, Callable[..., Any]] = {
     "abs": abs,
     "min": min,
@@ -70,6 +79,8 @@ class UnsafeFilterExpression(ValueError):
 class CompiledFilter:
     expr: str
     tree: ast.Expression
+    code: Any = None
+    used_vars: frozenset[str] = frozenset()
 
 
 def _validate_ast(tree: ast.AST) -> None:
@@ -85,53 +96,115 @@ def _validate_ast(tree: ast.AST) -> None:
                 raise UnsafeFilterExpression(f"Function not allowed: {node.func.id}")
 
 
+# Compiled filters keyed by expression text; conversions frequently reuse
+# the same handful of expressions, so repeat calls skip parse + validation.
+_COMPILED_CACHE: dict[str, CompiledFilter] = {}
+
+
 def compile_filter(expr: str) -> CompiledFilter:
+    cached = _COMPILED_CACHE.get(expr)
+    if cached is not None:
+        return cached
     try:
         tree = ast.parse(expr, mode="eval")
     except SyntaxError as e:
         raise UnsafeFilterExpression(str(e)) from e
     _validate_ast(tree)
-    return CompiledFilter(expr=expr, tree=tree)  # type: ignore[arg-type]
-
-
-def _compute_filter_variables(event: Event) -> dict[str, Any]:
-    final = event.final_particles
-    incoming = event.incoming_particles
-
-    n_jets = 0
-    n_leptons = 0
-    n_photons = 0
-    n_neutrinos = 0
-    ht = 0.0
-    met_x = 0.0
-    met_y = 0.0
-
-    for p in final:
-        aid = abs(p.pdg_id)
-        pt = p.pt
-
-        if 1 <= aid <= 6 or aid == 21:
-            n_jets += 1
-            ht += pt
-        elif aid in (11, 13, 15):
-            n_leptons += 1
-            ht += pt
-        elif aid in (12, 14, 16):
-            n_neutrinos += 1
-            met_x += p.px
-            met_y += p.py
-        elif aid == 22:
-            n_photons += 1
-            ht += pt
-        else:
-            ht += pt
+    # Compile to bytecode once here; eval_filter runs per event.
+    code = compile(tree, "<hepconduit-filter>", "eval")
+    used = frozenset(
+        n.id for n in ast.walk(tree)
+        if isinstance(n, ast.Name) and n.id not in ALLOWED_FUNCS
+    )
+    compiled = CompiledFilter(expr=expr, tree=tree, code=code, used_vars=used)  # type: ignore[arg-type]
+    _COMPILED_CACHE[expr] = compiled
+    return compiled
+
+
+# Variables that require walking event.particles; filters that reference
+# none of these (e.g. "weight > 0") skip the particle scan entirely.
+_PARTICLE_VARS = frozenset(
+    {"n_final", "n_incoming", "n_jets", "n_leptons", "n_photons", "n_neutrinos", "ht", "met"}
+)
+
+
+def _compute_filter_variables(event: Event, used_vars: frozenset[str] | None = None) -> dict[str, Any]:
+    if used_vars is not None and not (used_vars & _PARTICLE_VARS):
+        return {
+            "n_particles": len(event.particles),
+            "weight": event.weight,
+            "process_id": event.process_id,
+            "scale": event.scale,
+            "alpha_qed": event.alpha_qed,
+            "alpha_qcd": event.alpha_qcd,
+        }
+
+    if _np is not None and len(event.particles) >= _VECTORIZE_MIN_PARTICLES:
+        # Category masks and reductions run as C loops over SoA columns
+        # instead of a Python branch tree per particle; the final-state
+        # selection itself becomes a status mask rather than a list build.
+        cols = event.particle_columns(("pdg_id", "status", "px", "py"))
+        fin = cols["status"] == 1
+        n_final = int(fin.sum())
+        n_incoming = int((cols["status"] == -1).sum())
+        pdg = cols["pdg_id"][fin]
+        px = cols["px"][fin]
+        py = cols["py"][fin]
+        apdg = _np.abs(pdg)
+        pt = _np.sqrt(px * px + py * py)
+
+        jet = ((apdg >= 1) & (apdg <= 6)) | (apdg == 21)
+        lep = _np.isin(apdg, (11, 13, 15))
+        neu = _np.isin(apdg, (12, 14, 16))
+        pho = apdg == 22
+
+        n_jets = int(jet.sum())
+        n_leptons = int(lep.sum())
+        n_neutrinos = int(neu.sum())
+        n_photons = int(pho.sum())
+        # Everything visible (i.e. non-neutrino) contributes to ht,
+        # matching the scalar loop's catch-all branch.
+        ht = float(pt[~neu].sum())
+        met_x = float(px[neu].sum())
+        met_y = float(py[neu].sum())
+    else:
+        final = event.final_particles
+        n_final = len(final)
+        n_incoming = len(event.incoming_particles)
+        n_jets = 0
+        n_leptons = 0
+        n_photons = 0
+        n_neutrinos = 0
+        ht = 0.0
+        met_x = 0.0
+        met_y = 0.0
+
+        for p in final:
+            aid = abs(p.pdg_id)
+            pt = p.pt
+
+            if 1 <= aid <= 6 or aid == 21:
+                n_jets += 1
+                ht += pt
+            elif aid in (11, 13, 15):
+                n_leptons += 1
+                ht += pt
+            elif aid in (12, 14, 16):
+                n_neutrinos += 1
+                met_x += p.px
+                met_y += p.py
+            elif aid == 22:
+                n_photons += 1
+                ht += pt
+            else:
+                ht += pt
 
     met = math.sqrt(met_x * met_x + met_y * met_y)
 
     return {
         "n_particles": len(event.particles),
-        "n_final": len(final),
-        "n_incoming": len(incoming),
+        "n_final": n_final,
+        "n_incoming": n_incoming,
         "weight": event.weight,
         "process_id": event.process_id,
         "scale": event.scale,
@@ -146,17 +219,39 @@ def _compute_filter_variables(event: Event) -> dict[str, Any]:
     }
 
 
+_SAFE_GLOBALS: dict[str, Any] = {"__builtins__": {}, **ALLOWED_FUNCS}
+
+
 def eval_filter(compiled: CompiledFilter, env: Mapping[str, Any]) -> bool:
-    code = compile(compiled.tree, "<hepconduit-filter>", "eval")
-    safe_globals = {"__builtins__": {}, **ALLOWED_FUNCS}
-    return bool(eval(code, safe_globals, dict(env)))
+    code = compiled.code
+    if code is None:  # pre-compiled CompiledFilter instances from callers
+        code = compile(compiled.tree, "<hepconduit-filter>", "eval")
+    return bool(eval(code, _SAFE_GLOBALS, dict(env)))
 
 
 def compile_filter_fn(expr: str) -> Callable[[Event], bool]:
     compiled = compile_filter(expr)
 
+    # Transpile the validated AST into a real function whose parameters are
+    # the referenced variables: per-event calls then go through ordinary
+    # argument passing instead of eval() plus an env-dict copy.
+    names = sorted(
+        n.id for n in ast.walk(compiled.tree)
+        if isinstance(n, ast.Name) and n.id not in ALLOWED_FUNCS
+    )
+    src = f"def _predicate({', '.join(names)}):\n    return ({ast.unparse(compiled.tree)})"
+    ns: dict[str, Any] = {}
+    exec(compile(src, "<hepconduit-filter>", "exec"), dict(_SAFE_GLOBALS), ns)
+    predicate = ns["_predicate"]
+
     def _fn(event: Event) -> bool:
-        return eval_filter(compiled, _compute_filter_variables(event))
+        env = _compute_filter_variables(event, used_vars=compiled.used_vars)
+        try:
+            args = [env[n] for n in names]
+        except KeyError as e:
+            # Match eval() semantics for unknown variables.
+            raise NameError(f"name {e.args[0]!r} is not defined") from None
+        return bool(predicate(*args))
 
     return _fn
 
@@ -0,0 +1,66 @@
+"""Shared gzip input helper for the text-based readers.
+
+Stdlib ``gzip`` decompresses on a single thread, which leaves multi-GB
+``.lhe.gz`` / ``.hepmc.gz`` inputs bottlenecked on one zlib worker. When
+``rapidgzip`` is installed we decode deflate blocks on multiple threads;
+``indexed_gzip`` is a slower but still buffered middle ground. Both are
+optional — the stdlib path always works.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import os
+
+# Buffer size for gzip streams on both the read and write side. CPython
+# itself measured ~10% faster gzip reads moving from the 8 KB default to
+# 128 KB; larger buffers showed no further gain.
+BUFFER_SIZE = 128 * 1024
+
+
+def _gzip_threads() -> int:
+    """Worker count for parallel decompression.
+
+    ``HEPCONDUIT_GZIP_THREADS`` overrides; otherwise use all cores.
+    """
+    try:
+        n = int(os.environ.get("HEPCONDUIT_GZIP_THREADS", ""))
+    except ValueError:
+        n = 0
+    return n if n > 0 else (os.cpu_count() or 1)
+
+
+def open_gzip(path) -> io.BufferedReader:
+    """Open a ``.gz`` file for binary reading.
+
+    Tries ``rapidgzip`` (parallel decode), then ``indexed_gzip``, then
+    stdlib ``gzip``. The stream is wrapped in a BufferedReader so line
+    iteration pulls ``BUFFER_SIZE`` at a time from the decompressor
+    rather than its small default read unit.
+    """
+    p = str(path)
+    try:
+        import rapidgzip
+
+        raw = rapidgzip.open(p, parallelization=_gzip_threads())
+    except ImportError:
+        try:
+            import indexed_gzip
+
+            raw = indexed_gzip.IndexedGzipFile(p, spacing=32 << 20)
+        except ImportError:
+            raw = gzip.open(p, "rb")
+    return io.BufferedReader(raw, buffer_size=BUFFER_SIZE)
+
+
+def open_gzip_write(path) -> io.TextIOWrapper:
+    """Open a ``.gz`` file for buffered text writing.
+
+    Batches compression into ``BUFFER_SIZE`` chunks instead of feeding
+    zlib one short record line at a time.
+    """
+    raw = gzip.open(str(path), "wb")
+    return io.TextIOWrapper(
+        io.BufferedWriter(raw, buffer_size=BUFFER_SIZE), encoding="utf-8"
+    )
@@ -32,41 +32,157 @@ def _delimiter_from_fmt(fmt: str) -> str:
     return "\t" if fmt == "tsv" else ","
 
 
+# Defaults applied for absent columns / null cells, matching the
+# csv.DictReader fallbacks below. energy/mass accept short aliases.
+_COL_DEFAULTS = {
+    "event_number": 0,
+    "pdg_id": 0,
+    "status": 0,
+    "mother1": 0,
+    "mother2": 0,
+    "color1": 0,
+    "color2": 0,
+    "px": 0.0,
+    "py": 0.0,
+    "pz": 0.0,
+    "energy": 0.0,
+    "mass": 0.0,
+    "spin": 9.0,
+    "barcode": 0,
+    "vertex_barcode": 0,
+    "end_vertex_barcode": 0,
+}
+_COL_ALIASES = {"energy": "E", "mass": "m"}
+
+
+def _make_row_parser(fieldnames):
+    """Build a row-list -> Particle function specialized to the header.
+
+    Columns are addressed by position in ``csv.reader`` rows — no
+    per-row dict at all, where DictReader allocated one per line.
+    Generating the converter once folds absent columns into constants
+    and resolves the energy/mass/spin aliases at build time, in the
+    same transpile-once style as filtering.compile_filter_fn. A missing
+    required column raises KeyError here, before any row is read.
+    """
+    index = {name: i for i, name in enumerate(fieldnames or ())}
+
+    def _int_col(key: str) -> str:
+        i = index.get(key)
+        return f"int(row[{i}] or '0')" if i is not None else "0"
+
+    def _float_alias(key: str, default: str) -> str:
+        i = index.get(key)
+        if i is None:
+            i = index.get(_COL_ALIASES.get(key, ""))
+        if i is not None:
+            return f"float(row[{i}] or {default!r})"
+        return f"{float(default)!r}"
+
+    args = ", ".join(
+        [
+            f"int(row[{index['pdg_id']}])",
+            f"int(row[{index['status']}])",
+            f"float(row[{index['px']}])",
+            f"float(row[{index['py']}])",
+            f"float(row[{index['pz']}])",
+            _float_alias("energy", "0"),
+            _float_alias("mass", "0"),
+            _int_col("mother1"),
+            _int_col("mother2"),
+            _int_col("color1"),
+            _int_col("color2"),
+            _float_alias("spin", "9"),
+            _int_col("barcode"),
+            _int_col("vertex_barcode"),
+            _int_col("end_vertex_barcode"),
+        ]
+    )
+    ns: dict = {"Particle": Particle}
+    exec(f"def _row_to_particle(row):\n    return Particle({args})", ns)
+    return ns["_row_to_particle"]
+
+
 class CSVReader(Reader):
     def __init__(self, delimiter: str = ","):
         self.delimiter = delimiter
 
     def iter_events(self, path: str) -> Iterator[Event]:
+        # pyarrow tokenizes and type-converts in C with SIMD; the stdlib
+        # csv path below remains the dependency-free fallback.
+        try:
+            import pyarrow.csv  # noqa: F401
+        except ImportError:
+            return self._iter_events_py(path)
+        return self._iter_events_arrow(path)
+
+    def _iter_events_arrow(self, path: str) -> Iterator[Event]:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        current_evt = None
+        particles: list[Particle] = []
+        try:
+            reader = pacsv.open_csv(
+                path, parse_options=pacsv.ParseOptions(delimiter=self.delimiter)
+            )
+        except pa.ArrowInvalid:
+            # Zero-byte file: pyarrow rejects it, but the stdlib fallback
+            # (and the baseline reader) yield no events -- match that.
+            return
+        with reader:
+            for batch in reader:
+                names = set(batch.schema.names)
+                n = batch.num_rows
+
+                def _col(name: str) -> list:
+                    src = name if name in names else _COL_ALIASES.get(name, "")
+                    default = _COL_DEFAULTS[name]
+                    if src not in names:
+                        return [default] * n
+                    vals = batch.column(src).to_pylist()
+                    return [default if v is None else v for v in vals]
+
+                ev_nos = _col("event_number") if "event_number" in names else [0] * n
+                pfields = DEFAULT_FIELDS[1:]
+                cols = [_col(f) for f in pfields]
+                for evt_no, row in zip(ev_nos, zip(*cols)):
+                    evt_no = int(evt_no)
+                    if current_evt is None:
+                        current_evt = evt_no
+                    if evt_no != current_evt:
+                        yield Event(event_number=current_evt, particles=particles)
+                        current_evt = evt_no
+                        particles = []
+                    particles.append(Particle(**dict(zip(pfields, row))))
+        if current_evt is not None:
+            yield Event(event_number=current_evt, particles=particles)
+
+    def _iter_events_py(self, path: str) -> Iterator[Event]:
         with open(path, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter=self.delimiter)
+            reader = csv.reader(f, delimiter=self.delimiter)
+            header = next(reader, None)
+            if header is None:
+                return
+            row_to_particle = _make_row_parser(header)
+            ncols = len(header)
+            ev_col = header.index("event_number") if "event_number" in header else -1
             current_evt = None
             particles: list[Particle] = []
             for row in reader:
-                evt_no = int(row.get("event_number", "0") or "0")
+                if not row:
+                    continue
+                if len(row) < ncols:
+                    # Short row: pad like DictReader's None fill.
+                    row = row + [""] * (ncols - len(row))
+                evt_no = int(row[ev_col] or "0") if ev_col >= 0 else 0
                 if current_evt is None:
                     current_evt = evt_no
                 if evt_no != current_evt:
                     yield Event(event_number=current_evt, particles=particles)
                     current_evt = evt_no
                     particles = []
-                p = Particle(
-                    pdg_id=int(row["pdg_id"]),
-                    status=int(row["status"]),
-                    mother1=int(row.get("mother1", "0") or "0"),
-                    mother2=int(row.get("mother2", "0") or "0"),
-                    color1=int(row.get("color1", "0") or "0"),
-                    color2=int(row.get("color2", "0") or "0"),
-                    px=float(row["px"]),
-                    py=float(row["py"]),
-                    pz=float(row["pz"]),
-                    energy=float(row.get("energy", row.get("E", "0")) or "0"),
-                    mass=float(row.get("mass", row.get("m", "0")) or "0"),
-                    spin=float(row.get("spin", "9") or "9"),
-                    barcode=int(row.get("barcode", "0") or "0"),
-                    vertex_barcode=int(row.get("vertex_barcode", "0") or "0"),
-                    end_vertex_barcode=int(row.get("end_vertex_barcode", "0") or "0"),
-                )
-                particles.append(p)
+                particles.append(row_to_particle(row))
             if current_evt is not None:
                 yield Event(event_number=current_evt, particles=particles)
 
@@ -75,12 +191,71 @@ class CSVReader(Reader):
         return EventFile(run_info=RunInfo(), events=events, format_name="csv")
 
 
+# Particle fields formatted as float64 in the arrow writer; the rest are int64.
+_FLOAT_FIELDS = frozenset({"px", "py", "pz", "energy", "mass", "spin"})
+
+# Rows buffered per RecordBatch in the arrow writer.
+_WRITE_BATCH_ROWS = 65536
+
+
 class CSVWriter(Writer):
     def __init__(self, delimiter: str = ","):
         self.delimiter = delimiter
 
     def write(self, path: str, events: Iterable[Event], run_info: Optional[RunInfo], **kwargs) -> None:
         fields = kwargs.get("fields", DEFAULT_FIELDS)
+        # pyarrow formats rows in C with large output buffers; unknown
+        # custom fields or a missing pyarrow fall back to csv.DictWriter.
+        if set(fields) <= set(DEFAULT_FIELDS):
+            try:
+                import pyarrow.csv  # noqa: F401
+
+                self._write_arrow(path, events, fields)
+                return
+            except ImportError:
+                pass
+        self._write_py(path, events, fields)
+
+    def _write_arrow(self, path: str, events: Iterable[Event], fields: list[str]) -> None:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        schema = pa.schema(
+            [(f, pa.float64() if f in _FLOAT_FIELDS else pa.int64()) for f in fields]
+        )
+        # quoting_style="none" keeps the all-numeric data rows unquoted like
+        # csv.DictWriter; pyarrow always quotes the header, which both our
+        # readers accept.
+        opts = pacsv.WriteOptions(
+            batch_size=_WRITE_BATCH_ROWS, delimiter=self.delimiter, quoting_style="none"
+        )
+        pfields = [f for f in fields if f != "event_number"]
+
+        cols: dict[str, list] = {f: [] for f in fields}
+        n_rows = 0
+        with pacsv.CSVWriter(path, schema, write_options=opts) as writer:
+            def _flush() -> None:
+                writer.write_batch(
+                    pa.record_batch([pa.array(cols[f], type=schema.field(f).type) for f in fields], schema=schema)
+                )
+                for lst in cols.values():
+                    lst.clear()
+
+            for ev in events:
+                evn = ev.event_number
+                for p in ev.particles:
+                    if "event_number" in cols:
+                        cols["event_number"].append(evn)
+                    for f in pfields:
+                        cols[f].append(getattr(p, f))
+                    n_rows += 1
+                if n_rows >= _WRITE_BATCH_ROWS:
+                    _flush()
+                    n_rows = 0
+            if n_rows:
+                _flush()
+
+    def _write_py(self, path: str, events: Iterable[Event], fields: list[str]) -> None:
         with open(path, "w", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(f, fieldnames=fields, delimiter=self.delimiter)
             writer.writeheader()
@@ -1,21 +1,67 @@
 from __future__ import annotations
 
-import gzip
-import io
+import mmap
 from dataclasses import asdict
 from pathlib import Path
 from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from ..models import Event, EventFile, Particle, RunInfo, Vertex
+from ._gzip import open_gzip, open_gzip_write
 from .reader_base import Reader
 from .writer_base import Writer
 
+try:  # optional: vectorized vertex-graph reconstruction (hepconduit[numpy])
+    import numpy as _np
+except ImportError:
+    _np = None
 
-def _open_text(path: str):
+# Below this many particles the dict-based loop wins; grouping setup
+# overhead dominates for small events.
+_VECTORIZE_MIN_PARTICLES = 64
+
+# HepMC status -> internal convention (4=beam -> -1, 2/3 -> intermediate).
+# Statuses not listed pass through unchanged.
+_HEPMC_STATUS_MAP = {4: -1, 1: 1, 2: 2, 3: 2}
+
+# Record lines buffered per writelines() call in the writer.
+_WRITE_FLUSH_LINES = 4096
+
+
+def _iter_byte_lines(path) -> Iterator[bytes]:
+    """Yield raw record lines as bytes.
+
+    Plain files are mmapped and scanned for newlines directly, skipping the
+    per-line UTF-8 decode entirely; int()/float() accept the byte slices
+    as-is, so decoding happens only for records we preserve verbatim.
+    Gzip files iterate the binary stream; open text streams (e.g.
+    io.StringIO) are re-encoded line by line.
+    """
+    if hasattr(path, "read"):
+        for raw in path:
+            yield raw.encode("utf-8") if isinstance(raw, str) else raw
+        return
     p = Path(path)
     if p.suffix == ".gz":
-        return io.TextIOWrapper(gzip.open(p, "rb"), encoding="utf-8", errors="replace")
-    return open(p, "r", encoding="utf-8", errors="replace")
+        with open_gzip(p) as f:
+            yield from f
+        return
+    with open(p, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty file (or no mmap support); fall back to buffered reads.
+            yield from f
+            return
+        with mm:
+            i = 0
+            n = len(mm)
+            while i < n:
+                j = mm.find(b"\n", i)
+                if j < 0:
+                    yield mm[i:n]
+                    break
+                yield mm[i:j]
+                i = j + 1
 
 
 # --- HepMC3 Asciiv3 support (production-grade subset) ---------------------------------
@@ -33,6 +79,69 @@ def _open_text(path: str):
 # The parser is robust: it ignores extra columns while capturing the canonical ones.
 
 
+def _parse_kv_record(line: str) -> Dict[str, str]:
+    """Parse ``key=value`` tokens from a record line (e.g. F/C run info)."""
+    out: Dict[str, str] = {}
+    for tok in line.split()[1:]:
+        if "=" in tok:
+            k, _, v = tok.partition("=")
+            if k:
+                out[k] = v
+    return out
+
+
+def _parse_cross_section_record(line: str) -> Dict[str, object]:
+    """Parse a C (cross section) record.
+
+    Handles both the key=value style (``C xs=1.23 err=0.04 unit=pb``) and
+    the positional style (``C 1.20 0.05 pb``). Numeric values are surfaced
+    under canonical ``xsec`` / ``xsec_error`` keys.
+    """
+    parts = line.split()[1:]
+    kv = {}
+    for tok in parts:
+        if "=" in tok:
+            k, _, v = tok.partition("=")
+            kv[k] = v
+    out: Dict[str, object] = {}
+    if kv:
+        for key, canon in (("xs", "xsec"), ("xsec", "xsec"), ("err", "xsec_error"), ("error", "xsec_error")):
+            if key in kv:
+                try:
+                    out[canon] = float(kv[key])
+                except ValueError:
+                    pass
+        if "unit" in kv:
+            out["unit"] = kv["unit"]
+    else:
+        nums = []
+        for tok in parts:
+            try:
+                nums.append(float(tok))
+            except ValueError:
+                out.setdefault("unit", tok)
+        if nums:
+            out["xsec"] = nums[0]
+        if len(nums) > 1:
+            out["xsec_error"] = nums[1]
+    return out
+
+
+def _ordered_vertices(vertices: Dict[int, Vertex]) -> List[Vertex]:
+    """Vertices in ascending-barcode order, without sorting when possible.
+
+    HepMC3 ASCII emits vertices in decreasing-barcode order, so the
+    insertion-ordered dict reversed is already sorted; the O(V log V)
+    sort only runs for files that deviate from that convention.
+    """
+    keys = list(vertices.keys())
+    if all(keys[i] > keys[i + 1] for i in range(len(keys) - 1)):
+        keys.reverse()
+    else:
+        keys.sort()
+    return [vertices[k] for k in keys]
+
+
 def iter_hepmc3(path: str) -> Iterator[Event]:
     """Iterate events from a HepMC3 ASCII (Asciiv3) file."""
     _runinfo, it = iter_hepmc3_with_runinfo(path)
@@ -45,197 +154,205 @@ def iter_hepmc3_with_runinfo(path: str) -> Tuple[RunInfo, Iterator[Event]]:
     run.extra["hepmc3"].setdefault("raw_headers", [])
 
     def _events() -> Iterator[Event]:
-        with _open_text(path) as f:
-            current: Optional[Event] = None
-            vertices: Dict[int, Vertex] = {}
-            particles_by_bc: Dict[int, Particle] = {}
-
-            mom_unit = None
-            len_unit = None
-
-            for raw in f:
-                line = raw.strip()
-                if not line or line.startswith("#"):
-                    continue
-
-                # Headers / run info
-                if line.startswith("HepMC::"):
-                    run.extra["hepmc3"]["raw_headers"].append(line)
-                    continue
-
-                tag = line.split(maxsplit=1)[0]
-
-                if tag == "U":
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        mom_unit, len_unit = parts[1], parts[2]
-                        run.extra["units"] = {"momentum": mom_unit, "length": len_unit}
+        current: Optional[Event] = None
+        vertices: Dict[int, Vertex] = {}
+        particles_by_bc: Dict[int, Particle] = {}
+
+        # The loop works on bytes throughout: tag dispatch, split() and
+        # int()/float() all operate on the raw slices. Records preserved
+        # verbatim (headers, F/C/A, unknown tags) are decoded on demand.
+        for raw in _iter_byte_lines(path):
+            line = raw.strip()
+            if not line or line.startswith(b"#"):
+                continue
+
+            # Headers / run info
+            if line.startswith(b"HepMC::"):
+                run.extra["hepmc3"]["raw_headers"].append(line.decode("utf-8", "replace"))
+                continue
+
+            tag = line.split(maxsplit=1)[0]
+
+            if tag == b"U":
+                parts = line.split(None, 3)
+                if len(parts) >= 3:
+                    run.extra["units"] = {
+                        "momentum": parts[1].decode("utf-8", "replace"),
+                        "length": parts[2].decode("utf-8", "replace"),
+                    }
+                else:
+                    run.extra["units"] = {}
+                continue
+
+            if tag == b"N":
+                parts = line.split()
+                # N <n> <name1> ...
+                if len(parts) >= 2:
+                    try:
+                        n = int(parts[1])
+                    except Exception:
+                        n = 0
+                    names = [t.decode("utf-8", "replace") for t in parts[2:]]
+                    if n and len(names) >= n:
+                        run.weight_names = names[:n]
                     else:
-                        run.extra["units"] = {}
-                    continue
-
-                if tag == "N":
-                    parts = line.split()
-                    # N <n> <name1> ...
-                    if len(parts) >= 2:
-                        try:
-                            n = int(parts[1])
-                        except Exception:
-                            n = 0
-                        names = parts[2:]
-                        if n and len(names) >= n:
-                            run.weight_names = names[:n]
-                        else:
-                            run.weight_names = names
-                    continue
-
-                if tag == "F":
-                    # GenRunInfo line; preserve
-                    run.extra["hepmc3"].setdefault("F", []).append(line)
-                    continue
-
-                if tag == "C":
-                    # Cross section info line; preserve
-                    run.extra["hepmc3"].setdefault("C", []).append(line)
-                    continue
-
-                # Event start
-                if tag == "E":
-                    if current is not None:
-                        # finalize last event: attach collected vertices (sorted by barcode for determinism)
-                        current.vertices = [vertices[k] for k in sorted(vertices.keys())]
-                        yield current
-                    parts = line.split()
-                    evtno = 0
-                    if len(parts) >= 2:
-                        try:
-                            evtno = int(parts[1])
-                        except Exception:
-                            evtno = 0
-                    current = Event(event_number=evtno)
-                    current.extra.setdefault("hepmc3", {})
-                    current.extra["hepmc3"]["E_raw"] = line
-                    vertices = {}
-                    particles_by_bc = {}
-                    continue
-
-                if current is None:
-                    # Skip stray records before first event
+                        run.weight_names = names
+                continue
+
+            if tag == b"F":
+                # GenRunInfo line; preserve raw and parsed forms
+                text = line.decode("utf-8", "replace")
+                run.extra["hepmc3"].setdefault("F", []).append(text)
+                parsed = _parse_kv_record(text)
+                if parsed:
+                    run.extra["hepmc3"].setdefault("F_parsed", []).append(parsed)
+                continue
+
+            if tag == b"C":
+                # Cross section info line; run-level before the first event,
+                # per-event afterwards. Preserve raw and parsed forms.
+                text = line.decode("utf-8", "replace")
+                scope = run.extra["hepmc3"] if current is None else current.extra.setdefault("hepmc3", {})
+                scope.setdefault("C", []).append(text)
+                parsed = _parse_cross_section_record(text)
+                if parsed:
+                    scope.setdefault("C_parsed", []).append(parsed)
+                    if current is None and "xsec" in parsed:
+                        run.extra.setdefault("cross_section", {}).update(parsed)
+                continue
+
+            # Event start
+            if tag == b"E":
+                if current is not None:
+                    # finalize last event: attach collected vertices (ascending barcode for determinism)
+                    current.vertices = _ordered_vertices(vertices)
+                    yield current
+                # Only the event number is consumed; stop splitting after it.
+                parts = line.split(None, 2)
+                evtno = 0
+                if len(parts) >= 2:
+                    try:
+                        evtno = int(parts[1])
+                    except Exception:
+                        evtno = 0
+                current = Event(event_number=evtno)
+                current.extra.setdefault("hepmc3", {})
+                current.extra["hepmc3"]["E_raw"] = line.decode("utf-8", "replace")
+                vertices = {}
+                particles_by_bc = {}
+                continue
+
+            if current is None:
+                # Skip stray records before first event
+                continue
+
+            if tag == b"A":
+                # Event attribute record; preserve raw
+                current.extra.setdefault("hepmc3", {}).setdefault("A", []).append(line.decode("utf-8", "replace"))
+                continue
+
+            if tag == b"W":
+                parts = line.split()
+                ws: List[float] = []
+                for tok in parts[1:]:
+                    try:
+                        ws.append(float(tok))
+                    except Exception:
+                        pass
+                if ws:
+                    current.weights = ws
+                continue
+
+            if tag == b"V":
+                parts = line.split()
+                # V <vtxid> <x> <y> <z> <t> [<nin> <nout> <in...> <out...>]
+                if len(parts) < 6:
                     continue
-
-                if tag == "W":
-                    parts = line.split()
-                    ws: List[float] = []
-                    for tok in parts[1:]:
-                        try:
-                            ws.append(float(tok))
-                        except Exception:
-                            pass
-                    if ws:
-                        current.weights = ws
+                try:
+                    vtxid = int(parts[1])
+                    x, y, z, t = float(parts[2]), float(parts[3]), float(parts[4]), float(parts[5])
+                except Exception:
                     continue
-
-                if tag == "V":
-                    parts = line.split()
-                    # V <vtxid> <x> <y> <z> <t> [<nin> <nout> <in...> <out...>]
-                    if len(parts) < 6:
-                        continue
+                v = Vertex(barcode=vtxid, x=x, y=y, z=z, t=t)
+                idx = 6
+                if len(parts) >= idx + 2:
                     try:
-                        vtxid = int(parts[1])
-                        x, y, z, t = float(parts[2]), float(parts[3]), float(parts[4]), float(parts[5])
+                        nin = int(parts[idx])
+                        nout = int(parts[idx + 1])
+                        idx += 2
+                        incoming = []
+                        outgoing = []
+                        for _ in range(nin):
+                            if idx >= len(parts):
+                                break
+                            try:
+                                incoming.append(int(parts[idx]))
+                            except Exception:
+                                pass
+                            idx += 1
+                        for _ in range(nout):
+                            if idx >= len(parts):
+                                break
+                            try:
+                                outgoing.append(int(parts[idx]))
+                            except Exception:
+                                pass
+                            idx += 1
+                        v.incoming = incoming
+                        v.outgoing = outgoing
                     except Exception:
-                        continue
-                    v = Vertex(barcode=vtxid, x=x, y=y, z=z, t=t)
-                    idx = 6
-                    if len(parts) >= idx + 2:
-                        try:
-                            nin = int(parts[idx])
-                            nout = int(parts[idx + 1])
-                            idx += 2
-                            incoming = []
-                            outgoing = []
-                            for _ in range(nin):
-                                if idx >= len(parts):
-                                    break
-                                try:
-                                    incoming.append(int(parts[idx]))
-                                except Exception:
-                                    pass
-                                idx += 1
-                            for _ in range(nout):
-                                if idx >= len(parts):
-                                    break
-                                try:
-                                    outgoing.append(int(parts[idx]))
-                                except Exception:
-                                    pass
-                                idx += 1
-                            v.incoming = incoming
-                            v.outgoing = outgoing
-                        except Exception:
-                            pass
-                    vertices[vtxid] = v
+                        pass
+                vertices[vtxid] = v
+                continue
+
+            if tag == b"P":
+                # Fixed arity: 11 fields at most are consumed, so the
+                # splitter stops scanning once they are captured. V/W/N
+                # records keep full splits — they consume variable tails.
+                parts = line.split(None, 11)
+                # P <bc> <pdg> <status> <px> <py> <pz> <e> <m> [<pv> <ev>]
+                if len(parts) < 9:
+                    continue
+                try:
+                    bc = int(parts[1])
+                    pdg = int(parts[2])
+                    st = int(parts[3])
+                    px, py, pz = float(parts[4]), float(parts[5]), float(parts[6])
+                    e, m = float(parts[7]), float(parts[8])
+                except Exception:
                     continue
 
-                if tag == "P":
-                    parts = line.split()
-                    # P <bc> <pdg> <status> <px> <py> <pz> <e> <m> [<pv> <ev>]
-                    if len(parts) < 9:
-                        continue
+                pv = 0
+                ev = 0
+                if len(parts) >= 11:
                     try:
-                        bc = int(parts[1])
-                        pdg = int(parts[2])
-                        st = int(parts[3])
-                        px, py, pz = float(parts[4]), float(parts[5]), float(parts[6])
-                        e, m = float(parts[7]), float(parts[8])
+                        pv = int(parts[9])
+                        ev = int(parts[10])
                     except Exception:
-                        continue
-
-                    pv = 0
-                    ev = 0
-                    if len(parts) >= 11:
-                        try:
-                            pv = int(parts[9])
-                            ev = int(parts[10])
-                        except Exception:
-                            pv = 0
-                            ev = 0
-
-                    # Map HepMC-like statuses into internal convention when possible.
-                    mapped_status = st
-                    if st in (4,):  # beam
-                        mapped_status = -1
-                    elif st in (1,):
-                        mapped_status = 1
-                    elif st in (2, 3):
-                        mapped_status = 2
-
-                    p = Particle(
-                        pdg_id=pdg,
-                        status=mapped_status,
-                        px=px,
-                        py=py,
-                        pz=pz,
-                        energy=e,
-                        mass=m,
-                        barcode=bc,
-                        vertex_barcode=pv,
-                        end_vertex_barcode=ev,
-                    )
-                    # Preserve original status if it doesn't map cleanly
-                    if mapped_status != st:
-                        p.attributes["hepmc_status_raw"] = st
-
-                    particles_by_bc[bc] = p
-                    current.particles.append(p)
-                    continue
+                        pv = 0
+                        ev = 0
+
+                # Map HepMC-like statuses into internal convention when
+                # possible: one table lookup instead of a comparison chain.
+                mapped_status = _HEPMC_STATUS_MAP.get(st, st)
 
-                # Preserve unknown tags at event scope
-                current.extra.setdefault("hepmc3", {}).setdefault("unknown_records", []).append(line)
+                # Positional construction in models.PARTICLE_FIELDS order
+                # skips the per-particle kwargs dict.
+                p = Particle(pdg, mapped_status, px, py, pz, e, m, 0, 0, 0, 0, 9.0, bc, pv, ev)
+                # Preserve original status if it doesn't map cleanly
+                if mapped_status != st:
+                    p.attributes["hepmc_status_raw"] = st
 
-            if current is not None:
-                current.vertices = [vertices[k] for k in sorted(vertices.keys())]
-                yield current
+                particles_by_bc[bc] = p
+                current.particles.append(p)
+                continue
+
+            # Preserve unknown tags at event scope
+            current.extra.setdefault("hepmc3", {}).setdefault("unknown_records", []).append(line.decode("utf-8", "replace"))
+
+        if current is not None:
+            current.vertices = _ordered_vertices(vertices)
+            yield current
 
     return run, _events()
 
@@ -271,6 +388,10 @@ def _build_vertices_from_mothers(ev: Event) -> None:
         if not p.barcode:
             p.barcode = i
 
+    if _np is not None and len(ev.particles) >= _VECTORIZE_MIN_PARTICLES:
+        _build_vertices_np(ev)
+        return
+
     # Map mother-index pairs -> vertex id
     vtx_map: Dict[Tuple[int, int], int] = {}
     vertices: Dict[int, Vertex] = {}
@@ -307,20 +428,31 @@ def _build_vertices_from_mothers(ev: Event) -> None:
         prod_vtx[idx] = v_id
         p.vertex_barcode = v_id
 
-    # Fill vertex incoming/outgoing using mother relationships
+    # Fill vertex incoming/outgoing using mother relationships. Dedup
+    # goes through per-vertex sets (the lists stay the output) and the
+    # mother pair is walked as a tuple — no set allocations per particle.
+    n = len(ev.particles)
+    in_seen: Dict[int, set] = {}
+    out_seen: Dict[int, set] = {}
     for child_idx, p in enumerate(ev.particles, start=1):
         v_id = prod_vtx.get(child_idx, 0)
         if v_id == 0:
             continue
         v = vertices[v_id]
         # incoming: mothers (if present), outgoing: this child
-        for midx in {int(p.mother1), int(p.mother2)} - {0}:
-            if 1 <= midx <= len(ev.particles):
+        m1 = int(p.mother1)
+        m2 = int(p.mother2)
+        seen = in_seen.setdefault(v_id, set())
+        for midx in (m1,) if m1 == m2 else (m1, m2):
+            if 1 <= midx <= n:
                 mbar = ev.particles[midx - 1].barcode
-                if mbar not in v.incoming:
+                if mbar not in seen:
+                    seen.add(mbar)
                     v.incoming.append(mbar)
         cbar = p.barcode
-        if cbar not in v.outgoing:
+        seen_out = out_seen.setdefault(v_id, set())
+        if cbar not in seen_out:
+            seen_out.add(cbar)
             v.outgoing.append(cbar)
 
     # End vertex for a particle is the vertex where it appears as incoming
@@ -335,96 +467,179 @@ def _build_vertices_from_mothers(ev: Event) -> None:
     ev.vertices = [vertices[k] for k in sorted(vertices.keys())]
 
 
+def _build_vertices_np(ev: Event) -> None:
+    """NumPy variant of :func:`_build_vertices_from_mothers`.
+
+    The per-particle dict/tuple bookkeeping becomes one ``np.unique``
+    grouping over the sorted (mother1, mother2) pairs, with vertex ids
+    renumbered into first-encounter order so the output matches the
+    dict path exactly. Per-vertex incoming/outgoing lists are still
+    assembled in Python, but over pre-grouped index arrays.
+    """
+    ps = ev.particles
+    n = len(ps)
+    cols = ev.particle_columns(("status", "mother1", "mother2"))
+    prod_idx = _np.nonzero(cols["status"] != -1)[0]
+
+    if prod_idx.size == 0:
+        for p in ps:
+            p.vertex_barcode = 0
+            p.end_vertex_barcode = 0
+        ev.vertices = []
+        return
+
+    pairs = _np.stack([cols["mother1"], cols["mother2"]], axis=1)[prod_idx]
+    key = _np.sort(pairs, axis=1)
+    _keys, first, inv = _np.unique(key, axis=0, return_index=True, return_inverse=True)
+    # np.unique orders keys lexicographically; remap to the order the
+    # dict path would create them in (first encounter over particles).
+    order = _np.argsort(first, kind="stable")
+    rank = _np.empty(order.size, dtype=_np.int64)
+    rank[order] = _np.arange(order.size)
+    vertex_rank = rank[inv]
+
+    vids_all = _np.zeros(n, dtype=_np.int64)
+    vids_all[prod_idx] = -1 - vertex_rank
+    for p, v in zip(ps, vids_all.tolist()):
+        p.vertex_barcode = v
+
+    # Group produced-particle rows by vertex, in creation order.
+    grp = _np.argsort(vertex_rank, kind="stable")
+    bounds = _np.nonzero(_np.diff(vertex_rank[grp]))[0] + 1
+    groups = _np.split(prod_idx[grp], bounds)
+
+    vertices: Dict[int, Vertex] = {}
+    for k, rows in enumerate(groups):
+        vid = -1 - k
+        v = Vertex(barcode=vid)
+        seen_in: set = set()
+        seen_out: set = set()
+        for r in rows.tolist():
+            p = ps[r]
+            m1 = int(p.mother1)
+            m2 = int(p.mother2)
+            for midx in (m1,) if m1 == m2 else (m1, m2):
+                if 1 <= midx <= n:
+                    mbar = ps[midx - 1].barcode
+                    if mbar not in seen_in:
+                        seen_in.add(mbar)
+                        v.incoming.append(mbar)
+            cbar = p.barcode
+            if cbar not in seen_out:
+                seen_out.add(cbar)
+                v.outgoing.append(cbar)
+        vertices[vid] = v
+
+    incoming_to_vtx: Dict[int, int] = {}
+    for vid, v in vertices.items():
+        for inc in v.incoming:
+            incoming_to_vtx[inc] = vid
+    for p in ps:
+        p.end_vertex_barcode = incoming_to_vtx.get(p.barcode, 0)
+
+    ev.vertices = [vertices[k] for k in sorted(vertices.keys())]
+
+
 class HepMC3Writer(Writer):
-    def write(self, path: str, events: Iterable[Event], run_info: Optional[RunInfo], **kwargs) -> None:
+    def write(self, path, events: Iterable[Event], run_info: Optional[RunInfo], **kwargs) -> None:
+        if hasattr(path, "write"):
+            # Already an open text stream; the caller owns its lifetime.
+            self._write_stream(path, events, run_info)
+            return
         p = Path(path)
         if p.suffix == ".gz":
-            raw = gzip.open(p, "wb")
-            f = io.TextIOWrapper(raw, encoding="utf-8")
+            f = open_gzip_write(p)
         else:
-            f = open(p, "w", encoding="utf-8")
+            f = open(p, "w", encoding="utf-8", buffering=1 << 20)
         with f:
-            f.write("HepMC::Version 3.0.0\n")
-            f.write("HepMC::Asciiv3\n")
-
-            run = run_info or RunInfo()
-            units = (run.extra or {}).get("units") if run else None
-            if isinstance(units, dict) and units.get("momentum") and units.get("length"):
-                f.write(f"U {units['momentum']} {units['length']}\n")
-            else:
-                # Default to common generator-level units
-                f.write("U GEV MM\n")
-
-            if run.weight_names:
-                f.write("N {} {}\n".format(len(run.weight_names), " ".join(run.weight_names)))
-
-            # Preserve some raw run header records if present
-            hepmc_extra = (run.extra or {}).get("hepmc3", {}) or {}
-            for line in hepmc_extra.get("F", []) or []:
-                f.write(line.rstrip("\n") + "\n")
-            for line in hepmc_extra.get("C", []) or []:
-                f.write(line.rstrip("\n") + "\n")
-
-            for ev in events:
-                # Ensure we have a vertex graph (even when input came from LHE/CSV)
+            self._write_stream(f, events, run_info)
+
+    def _write_stream(self, f, events: Iterable[Event], run_info: Optional[RunInfo]) -> None:
+        f.write("HepMC::Version 3.0.0\n")
+        f.write("HepMC::Asciiv3\n")
+
+        run = run_info or RunInfo()
+        units = (run.extra or {}).get("units") if run else None
+        if isinstance(units, dict) and units.get("momentum") and units.get("length"):
+            f.write(f"U {units['momentum']} {units['length']}\n")
+        else:
+            # Default to common generator-level units
+            f.write("U GEV MM\n")
+
+        if run.weight_names:
+            f.write("N {} {}\n".format(len(run.weight_names), " ".join(run.weight_names)))
+
+        # Preserve some raw run header records if present
+        hepmc_extra = (run.extra or {}).get("hepmc3", {}) or {}
+        for line in hepmc_extra.get("F", []) or []:
+            f.write(line.rstrip("\n") + "\n")
+        for line in hepmc_extra.get("C", []) or []:
+            f.write(line.rstrip("\n") + "\n")
+
+        # Record lines are accumulated and flushed through writelines in
+        # chunks: one write call per ~4k records instead of one per line.
+        # Floats are rendered with repr(), which round-trips exactly like
+        # the old %.17g but without a format-spec parse per value.
+        chunk: List[str] = []
+        append = chunk.append
+
+        for ev in events:
+            # Ensure we have a vertex graph (even when input came from
+            # LHE/CSV). Events that already carry one — HepMC3 input, or
+            # repeated writes of the same events — skip the call entirely.
+            if not ev.vertices:
                 _build_vertices_from_mothers(ev)
 
-                # Deterministic E line: event number only (other fields may exist but are optional)
-                f.write(f"E {ev.event_number}\n")
-
-                # Weights
-                if ev.weights and (len(ev.weights) > 1 or (len(ev.weights) == 1 and ev.weights[0] != 1.0)):
-                    f.write("W {}\n".format(" ".join(f"{w:.17g}" for w in ev.weights)))
-
-                # Vertices
-                vtx_by_id = {v.barcode: v for v in ev.vertices}
-                for vid in sorted(vtx_by_id.keys()):
-                    v = vtx_by_id[vid]
-                    # V <id> <x> <y> <z> <t> <nin> <nout> <in...> <out...>
-                    f.write(
-                        "V {id} {x:.17g} {y:.17g} {z:.17g} {t:.17g} {nin} {nout} {ins} {outs}\n".format(
-                            id=v.barcode,
-                            x=v.x,
-                            y=v.y,
-                            z=v.z,
-                            t=v.t,
-                            nin=len(v.incoming),
-                            nout=len(v.outgoing),
-                            ins=" ".join(str(i) for i in v.incoming) if v.incoming else "",
-                            outs=" ".join(str(o) for o in v.outgoing) if v.outgoing else "",
-                        )
-                    )
-
-                # Particles
-                for i, part in enumerate(ev.particles, start=1):
-                    bc = part.barcode if part.barcode else i
-                    # Map back to HepMC status codes (best-effort)
-                    out_status = part.status
-                    if part.status == -1:
-                        out_status = 4
-                    elif part.status == 1:
-                        out_status = 1
-                    elif part.status == 2:
-                        out_status = 2
-                    # If we preserved a raw status, prefer it
-                    raw_st = part.attributes.get("hepmc_status_raw") if isinstance(part.attributes, dict) else None
-                    if isinstance(raw_st, int):
-                        out_status = raw_st
-
-                    pv = int(part.vertex_barcode) if part.vertex_barcode else 0
-                    evv = int(part.end_vertex_barcode) if part.end_vertex_barcode else 0
-
-                    f.write(
-                        "P {bc} {pid} {st} {px:.17g} {py:.17g} {pz:.17g} {e:.17g} {m:.17g} {pv} {ev}\n".format(
-                            bc=bc,
-                            pid=part.pdg_id,
-                            st=out_status,
-                            px=part.px,
-                            py=part.py,
-                            pz=part.pz,
-                            e=part.energy,
-                            m=part.mass,
-                            pv=pv,
-                            ev=evv,
-                        )
-                    )
+            # Deterministic E line: event number only (other fields may exist but are optional)
+            append(f"E {ev.event_number}\n")
+
+            # Weights
+            if ev.weights and (len(ev.weights) > 1 or (len(ev.weights) == 1 and ev.weights[0] != 1.0)):
+                append("W {}\n".format(" ".join(repr(w) for w in ev.weights)))
+
+            # Vertices. Readers and _build_vertices_from_mothers produce
+            # ascending-barcode lists already; only hand-built events with
+            # out-of-order (or duplicate) barcodes pay for the dict + sort.
+            verts = ev.vertices
+            if any(verts[i].barcode >= verts[i + 1].barcode for i in range(len(verts) - 1)):
+                vtx_by_id = {v.barcode: v for v in verts}
+                verts = [vtx_by_id[k] for k in sorted(vtx_by_id.keys())]
+            for v in verts:
+                # V <id> <x> <y> <z> <t> <nin> <nout> <in...> <out...>
+                append(
+                    f"V {v.barcode} {v.x!r} {v.y!r} {v.z!r} {v.t!r} "
+                    f"{len(v.incoming)} {len(v.outgoing)} "
+                    f"{' '.join(str(i) for i in v.incoming)} "
+                    f"{' '.join(str(o) for o in v.outgoing)}\n"
+                )
+
+            # Particles
+            for i, part in enumerate(ev.particles, start=1):
+                bc = part.barcode if part.barcode else i
+                # Map back to HepMC status codes (best-effort)
+                out_status = part.status
+                if part.status == -1:
+                    out_status = 4
+                elif part.status == 1:
+                    out_status = 1
+                elif part.status == 2:
+                    out_status = 2
+                # If we preserved a raw status, prefer it
+                raw_st = part.attributes.get("hepmc_status_raw") if isinstance(part.attributes, dict) else None
+                if isinstance(raw_st, int):
+                    out_status = raw_st
+
+                pv = int(part.vertex_barcode) if part.vertex_barcode else 0
+                evv = int(part.end_vertex_barcode) if part.end_vertex_barcode else 0
+
+                append(
+                    f"P {bc} {part.pdg_id} {out_status} {part.px!r} {part.py!r} "
+                    f"{part.pz!r} {part.energy!r} {part.mass!r} {pv} {evv}\n"
+                )
+
+            if len(chunk) >= _WRITE_FLUSH_LINES:
+                f.writelines(chunk)
+                chunk.clear()
+
+        if chunk:
+            f.writelines(chunk)
@@ -1,26 +1,63 @@
 from __future__ import annotations
 
-import gzip
 import io
+import queue
 import re
+import threading
 from pathlib import Path
 from typing import Iterable, Iterator, Optional
 
 from ..models import Event, EventFile, Particle, ProcessInfo, RunInfo
+from ._gzip import open_gzip, open_gzip_write
 from .reader_base import Reader
 from .writer_base import Writer
 
-_TAG_EVENT_OPEN = re.compile(r"<event\b")
-_TAG_EVENT_CLOSE = re.compile(r"</event>")
-_TAG_INIT_OPEN = re.compile(r"<init\b")
-_TAG_INIT_CLOSE = re.compile(r"</init>")
-_TAG_GENERATOR = re.compile(r"<generator\b[^>]*>(.*?)</generator>", re.IGNORECASE|re.DOTALL)
+try:  # optional: batch particle-block parsing (hepconduit[numpy])
+    import numpy as _np
+except ImportError:
+    _np = None
 
+# Below this many particles per event the scalar loop wins; loadtxt
+# setup overhead dominates for small blocks.
+_VECTORIZE_MIN_PARTICLES = 32
 
-def _open_text(path: str):
+_TAG_WEIGHT = re.compile(r"<weight\b[^>]*\bid\s*=\s*['\"]([^'\"]+)['\"][^>]*>(.*?)</weight>", re.IGNORECASE|re.DOTALL)
+_TAG_WGT = re.compile(r"<wgt\b[^>]*\bid\s*=\s*['\"]([^'\"]+)['\"][^>]*>(.*?)</wgt>", re.IGNORECASE|re.DOTALL)
+_TAG_WEIGHTS_BLOCK = re.compile(r"<weights\b[^>]*>(.*?)</weights>", re.IGNORECASE|re.DOTALL)
+_TAG_RWGT_BLOCK = re.compile(r"<rwgt\b[^>]*>(.*?)</rwgt>", re.IGNORECASE|re.DOTALL)
+
+
+def _tag_at_start(line: str, tag: str) -> bool:
+    """True if ``line`` begins with ``tag``, allowing leading indentation.
+
+    LHE structural tags sit at the start of their line, so a prefix
+    compare replaces the compiled-regex search the scan loops used to
+    run on every line; lstrip() only happens when the line is indented.
+    """
+    if line.startswith(tag):
+        return True
+    c = line[:1]
+    if c == " " or c == "\t":
+        return line.lstrip().startswith(tag)
+    return False
+
+
+def _to_float(tok: str) -> float:
+    """Parse a float, tolerating Fortran D exponents (1.0D+01)."""
+    try:
+        return float(tok)
+    except ValueError:
+        return float(tok.replace("D", "E").replace("d", "e"))
+
+
+def _open_text(path):
+    # File-like objects pass through unchanged (single scan; the stream is
+    # consumed and closed). Use a fresh buffer per call for re-scans.
+    if hasattr(path, "read"):
+        return path
     p = Path(path)
     if p.suffix == ".gz":
-        return io.TextIOWrapper(gzip.open(p, "rb"), encoding="utf-8", errors="replace")
+        return io.TextIOWrapper(open_gzip(p), encoding="utf-8", errors="replace")
     return open(p, "r", encoding="utf-8", errors="replace")
 
 
@@ -59,27 +96,115 @@ def _parse_init(lines: list[str]) -> RunInfo:
     return RunInfo(beam_pdg_id=beam_pdg, beam_energy=beam_e, processes=processes)
 
 
-def iter_lhe(path: str) -> Iterator[Event]:
-    with _open_text(path) as f:
-        in_event = False
-        buf: list[str] = []
-        event_no = 0
-        for line in f:
-            if not in_event:
-                if _TAG_EVENT_OPEN.search(line):
-                    in_event = True
-                    buf = []
-                continue
-            else:
-                if _TAG_EVENT_CLOSE.search(line):
-                    # parse buffered event
-                    event_no += 1
-                    ev = _parse_event_block(buf, event_no)
-                    yield ev
+# Bound on event blocks buffered between the reader thread and the parser.
+_BLOCK_QUEUE_SIZE = 8
+
+
+def _put_block(q: "queue.Queue", stop: threading.Event, item) -> bool:
+    """Enqueue, backing off so a stopped consumer never strands the producer."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _read_blocks(path, q: "queue.Queue", stop: threading.Event) -> None:
+    """Producer: scan for <event> blocks and enqueue their buffered lines.
+
+    Pushes an exception instance on failure and None when exhausted.
+    """
+    try:
+        with _open_text(path) as f:
+            in_event = False
+            buf: list[str] = []
+            for line in f:
+                if not in_event:
+                    if _tag_at_start(line, "<event"):
+                        in_event = True
+                        buf = []
+                    continue
+                if _tag_at_start(line, "</event>"):
+                    if not _put_block(q, stop, buf):
+                        return
                     in_event = False
                     buf = []
                 else:
                     buf.append(line)
+    except BaseException as exc:  # re-raised on the consumer side
+        _put_block(q, stop, exc)
+        return
+    _put_block(q, stop, None)
+
+
+def iter_lhe(path: str) -> Iterator[Event]:
+    # Pipelined read: a reader thread assembles event blocks while the
+    # main thread parses them. Decompression and file reads release the
+    # GIL, so gzip refills overlap with numeric parsing instead of
+    # stalling it. Blocks arrive in file order, so event numbering is
+    # unchanged.
+    q: "queue.Queue" = queue.Queue(maxsize=_BLOCK_QUEUE_SIZE)
+    stop = threading.Event()
+    t = threading.Thread(target=_read_blocks, args=(path, q, stop), daemon=True)
+    t.start()
+    event_no = 0
+    try:
+        while True:
+            item = q.get()
+            if item is None:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            event_no += 1
+            yield _parse_event_block(item, event_no)
+    finally:
+        stop.set()
+        t.join()
+
+
+def _parse_particles_np(lines: list[str], idx: int, nup: int):
+    """Batch-parse a large particle block with NumPy.
+
+    Collects the next ``nup`` candidate lines and hands the whole block
+    to ``np.loadtxt`` — one C-side tokenize/atof pass instead of 13
+    Python conversions per line. Returns ``(particles, next_idx)`` or
+    None when the block needs the tolerant scalar loop (Fortran D
+    exponents, ragged rows, early XML, trailer lines).
+    """
+    plines: list[str] = []
+    j = idx
+    n = len(lines)
+    while len(plines) < nup and j < n:
+        s = lines[j].strip()
+        j += 1
+        if not s or s.startswith("#"):
+            continue
+        if s.startswith("<"):
+            return None
+        if "D" in s or "d" in s:  # Fortran exponents
+            return None
+        plines.append(s)
+    if len(plines) < nup:
+        return None
+    try:
+        arr = _np.loadtxt(io.StringIO("\n".join(plines)), dtype=_np.float64, ndmin=2)
+    except ValueError:
+        return None
+    if arr.shape[0] != nup or arr.shape[1] < 11:
+        return None
+    has_spin = arr.shape[1] > 12
+    particles = [
+        # id status mother1 mother2 col1 col2 px py pz E M lifetime spin
+        Particle(
+            int(r[0]), int(r[1]), r[6], r[7], r[8], r[9], r[10],
+            int(r[2]), int(r[3]), int(r[4]), int(r[5]),
+            r[12] if has_spin else 9.0,
+        )
+        for r in arr.tolist()
+    ]
+    return particles, j
 
 
 def _parse_event_block(lines: list[str], event_number: int) -> Event:
@@ -100,48 +225,70 @@ def _parse_event_block(lines: list[str], event_number: int) -> Event:
     # nup idprup xwgtup scalup aqedup aqcdup
     nup = int(hp[0])
     process_id = int(hp[1]) if len(hp) > 1 else 0
-    weight = float(hp[2]) if len(hp) > 2 else 1.0
-    scale = float(hp[3]) if len(hp) > 3 else 0.0
-    aqed = float(hp[4]) if len(hp) > 4 else 0.0
-    aqcd = float(hp[5]) if len(hp) > 5 else 0.0
+    weight = _to_float(hp[2]) if len(hp) > 2 else 1.0
+    scale = _to_float(hp[3]) if len(hp) > 3 else 0.0
+    aqed = _to_float(hp[4]) if len(hp) > 4 else 0.0
+    aqcd = _to_float(hp[5]) if len(hp) > 5 else 0.0
 
     particles: list[Particle] = []
-    # next nup lines are particles
-    for i in range(nup):
-        if idx >= len(lines):
-            break
+
+    if _np is not None and nup >= _VECTORIZE_MIN_PARTICLES:
+        parsed = _parse_particles_np(lines, idx, nup)
+        if parsed is not None:
+            particles, idx = parsed
+            ev = Event(
+                event_number=event_number,
+                particles=particles,
+                process_id=process_id,
+                scale=scale,
+                alpha_qed=aqed,
+                alpha_qcd=aqcd,
+                weights=[weight],
+                n_particles=nup,
+            )
+            tail_text = "".join(lines[idx:])
+            if tail_text.strip():
+                _parse_event_tail(ev, tail_text)
+            return ev
+
+    # next nup (non-comment) lines are particles
+    n_parsed = 0
+    while n_parsed < nup and idx < len(lines):
         s = lines[idx].strip()
         idx += 1
         if not s or s.startswith("#"):
-            i -= 1
             continue
+        if s.startswith("<"):
+            # XML block started early (malformed nup); rewind and stop
+            idx -= 1
+            break
         cols = s.split()
-        # id status mother1 mother2 col1 col2 px py pz E M lifetime spin
-        pdg_id = int(cols[0])
-        status = int(cols[1])
-        mother1 = int(cols[2])
-        mother2 = int(cols[3])
-        c1 = int(cols[4])
-        c2 = int(cols[5])
-        px = float(cols[6]); py = float(cols[7]); pz = float(cols[8])
-        e = float(cols[9]); m = float(cols[10])
-        spin = float(cols[12]) if len(cols) > 12 else 9.0
-        particles.append(Particle(
-            pdg_id=pdg_id,
-            status=status,
-            mother1=mother1,
-            mother2=mother2,
-            color1=c1,
-            color2=c2,
-            px=px,
-            py=py,
-            pz=pz,
-            energy=e,
-            mass=m,
-            spin=spin,
-        ))
-
-    return Event(
+        try:
+            # id status mother1 mother2 col1 col2 px py pz E M lifetime spin
+            # map() batches the conversions through C dispatch; a short row
+            # fails the unpack with ValueError and rewinds like before.
+            pdg_id, status, mother1, mother2, c1, c2 = map(int, cols[:6])
+            try:
+                px, py, pz, e, m = map(float, cols[6:11])
+            except ValueError:
+                # Rare path: Fortran D exponents (or a trailer line).
+                px = _to_float(cols[6]); py = _to_float(cols[7]); pz = _to_float(cols[8])
+                e = _to_float(cols[9]); m = _to_float(cols[10])
+            spin = _to_float(cols[12]) if len(cols) > 12 else 9.0
+        except (ValueError, IndexError):
+            # An unparseable line before the header's nup particles have
+            # been read is corruption, not a generator trailer -- trailers
+            # only follow a complete block. Raise rather than silently
+            # truncating the event.
+            raise ValueError(
+                f"Malformed particle line in event {event_number} "
+                f"(got {n_parsed} of {nup} particles): {s!r}"
+            ) from None
+        # Positional construction skips per-field keyword dict handling.
+        particles.append(Particle(pdg_id, status, px, py, pz, e, m, mother1, mother2, c1, c2, spin))
+        n_parsed += 1
+
+    ev = Event(
         event_number=event_number,
         particles=particles,
         process_id=process_id,
@@ -152,22 +299,84 @@ def _parse_event_block(lines: list[str], event_number: int) -> Event:
         n_particles=nup,
     )
 
+    # Whatever follows the particle block: optional <weights>/<rwgt> XML and
+    # generator-specific trailer lines. Preserve them in extra["lhe"].
+    tail_text = "".join(lines[idx:])
+    if tail_text.strip():
+        _parse_event_tail(ev, tail_text)
+
+    return ev
+
+
+def _parse_event_tail(ev: Event, text: str) -> None:
+    """Parse optional per-event weight blocks and trailer lines into extra."""
+    lhe_extra: dict = {}
+
+    wblock = _TAG_WEIGHTS_BLOCK.search(text)
+    if wblock:
+        weights = {}
+        for wid, val in _TAG_WEIGHT.findall(wblock.group(0)):
+            try:
+                weights[wid] = _to_float(val.strip())
+            except ValueError:
+                continue
+        if weights:
+            lhe_extra["weights"] = weights
+        text = text[: wblock.start()] + text[wblock.end():]
+
+    rblock = _TAG_RWGT_BLOCK.search(text)
+    if rblock:
+        rwgt = {}
+        for wid, val in _TAG_WGT.findall(rblock.group(0)):
+            try:
+                rwgt[wid] = _to_float(val.strip())
+            except ValueError:
+                continue
+        if rwgt:
+            lhe_extra["rwgt"] = rwgt
+        text = text[: rblock.start()] + text[rblock.end():]
+
+    tail = [
+        s for s in (ln.strip() for ln in text.splitlines())
+        if s and not s.startswith("#") and not s.startswith("<")
+    ]
+    if tail:
+        lhe_extra["tail"] = tail
+
+    if lhe_extra:
+        ev.extra["lhe"] = lhe_extra
+        # Keep the flat weights list a superset: header weight first, then
+        # named block weights in document order.
+        for blk in ("weights", "rwgt"):
+            ev.weights.extend(lhe_extra.get(blk, {}).values())
+
 
 class LHEReader(Reader):
     def iter_events(self, path: str) -> Iterator[Event]:
         return iter_lhe(path)
 
-    def read(self, path: str) -> EventFile:
+    def read(self, path) -> EventFile:
+        if hasattr(path, "read"):
+            # read() needs two scans; capture the text once and re-wrap.
+            text = path.read()
+            run = self.read_run_info(io.StringIO(text))
+            events = list(iter_lhe(io.StringIO(text)))
+            return EventFile(run_info=run, events=events, format_name="lhe")
         run = self.read_run_info(path)
         events = list(iter_lhe(path))
         return EventFile(run_info=run, events=events, format_name="lhe")
 
-    def read_run_info(self, path: str) -> RunInfo:
+    def read_run_info(self, path) -> RunInfo:
+        if hasattr(path, "read"):
+            text = path.read()
+            _opener = lambda: io.StringIO(text)  # noqa: E731
+        else:
+            _opener = lambda: _open_text(path)  # noqa: E731
         generator_name = ""
         generator_version = ""
         init_lines: list[str] = []
         in_init = False
-        with _open_text(path) as f:
+        with _opener() as f:
             # Try to sniff generator tag quickly
             head = ""
             for _ in range(200):
@@ -177,24 +386,30 @@ class LHEReader(Reader):
                 head += ln
                 if "</generator>" in ln.lower():
                     break
-            m = _TAG_GENERATOR.search(head)
-            if m:
-                gen = re.sub(r"\s+", " ", m.group(1).strip())
+            # Plain substring scans over the bounded head instead of a
+            # DOTALL regex: find the open tag, its closing '>', then the
+            # end tag, and slice the body out.
+            low = head.lower()
+            i = low.find("<generator")
+            j = head.find(">", i) if i >= 0 else -1
+            k = low.find("</generator>", j) if j >= 0 else -1
+            if k >= 0:
+                gen = " ".join(head[j + 1 : k].split())
                 # common pattern: "MadGraph5_aMC@NLO v2.9.18"
                 if " v" in gen:
                     generator_name, generator_version = gen.split(" v", 1)
                 else:
                     generator_name = gen
 
-        with _open_text(path) as f2:
+        with _opener() as f2:
             for line in f2:
                 if not in_init:
-                    if _TAG_INIT_OPEN.search(line):
+                    if _tag_at_start(line, "<init"):
                         in_init = True
                         init_lines = []
                     continue
                 else:
-                    if _TAG_INIT_CLOSE.search(line):
+                    if _tag_at_start(line, "</init>"):
                         break
                     init_lines.append(line)
 
@@ -205,37 +420,44 @@ class LHEReader(Reader):
 
 
 class LHEWriter(Writer):
-    def write(self, path: str, events: Iterable[Event], run_info: Optional[RunInfo], **kwargs) -> None:
+    def write(self, path, events: Iterable[Event], run_info: Optional[RunInfo], **kwargs) -> None:
+        if hasattr(path, "write"):
+            # Caller owns the stream's lifetime.
+            self._write_stream(path, events, run_info)
+            return
         p = Path(path)
         if p.suffix == ".gz":
-            fh = gzip.open(p, "wt", encoding="utf-8")
+            fh = open_gzip_write(p)
         else:
             fh = open(p, "w", encoding="utf-8")
         with fh as out:
-            out.write("<LesHouchesEvents version=\"3.0\">\n")
-            # init block
-            run = run_info or RunInfo()
-            out.write("<init>\n")
-            out.write(f"{run.beam_pdg_id[0]} {run.beam_pdg_id[1]} {run.beam_energy[0]:.8g} {run.beam_energy[1]:.8g} 0 0 0 0 0 0\n")
-            for proc in run.processes:
-                out.write(f"{proc.cross_section:.8g} {proc.cross_section_error:.8g} {proc.max_weight:.8g} {proc.process_id}\n")
-            out.write("</init>\n")
-            if run.generator_name:
-                gen = run.generator_name
-                if run.generator_version:
-                    gen += f" v{run.generator_version}"
-                out.write(f"<generator>{gen}</generator>\n")
-
-            for ev in events:
-                out.write("<event>\n")
-                nup = len(ev.particles)
-                w = ev.weight
-                out.write(f"{nup} {ev.process_id} {w:.16g} {ev.scale:.16g} {ev.alpha_qed:.16g} {ev.alpha_qcd:.16g}\n")
-                for i, p in enumerate(ev.particles, start=1):
-                    # lifetime not modeled -> 0.0
-                    out.write(
-                        f"{p.pdg_id} {p.status} {p.mother1} {p.mother2} {p.color1} {p.color2} "
-                        f"{p.px:.16g} {p.py:.16g} {p.pz:.16g} {p.energy:.16g} {p.mass:.16g} 0 {p.spin:.16g}\n"
-                    )
-                out.write("</event>\n")
-            out.write("</LesHouchesEvents>\n")
+            self._write_stream(out, events, run_info)
+
+    def _write_stream(self, out, events: Iterable[Event], run_info: Optional[RunInfo]) -> None:
+        out.write("<LesHouchesEvents version=\"3.0\">\n")
+        # init block
+        run = run_info or RunInfo()
+        out.write("<init>\n")
+        out.write(f"{run.beam_pdg_id[0]} {run.beam_pdg_id[1]} {run.beam_energy[0]:.8g} {run.beam_energy[1]:.8g} 0 0 0 0 0 0\n")
+        for proc in run.processes:
+            out.write(f"{proc.cross_section:.8g} {proc.cross_section_error:.8g} {proc.max_weight:.8g} {proc.process_id}\n")
+        out.write("</init>\n")
+        if run.generator_name:
+            gen = run.generator_name
+            if run.generator_version:
+                gen += f" v{run.generator_version}"
+            out.write(f"<generator>{gen}</generator>\n")
+
+        for ev in events:
+            out.write("<event>\n")
+            nup = len(ev.particles)
+            w = ev.weight
+            out.write(f"{nup} {ev.process_id} {w:.16g} {ev.scale:.16g} {ev.alpha_qed:.16g} {ev.alpha_qcd:.16g}\n")
+            for i, p in enumerate(ev.particles, start=1):
+                # lifetime not modeled -> 0.0
+                out.write(
+                    f"{p.pdg_id} {p.status} {p.mother1} {p.mother2} {p.color1} {p.color2} "
+                    f"{p.px:.16g} {p.py:.16g} {p.pz:.16g} {p.energy:.16g} {p.mass:.16g} 0 {p.spin:.16g}\n"
+                )
+            out.write("</event>\n")
+        out.write("</LesHouchesEvents>\n")
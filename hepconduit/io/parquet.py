@@ -3,11 +3,22 @@ from __future__ import annotations
 from dataclasses import asdict
 from typing import Iterable, Iterator, Optional
 
-from ..models import Event, EventFile, Particle, RunInfo, Vertex
+from ..models import Event, EventFile, Particle, ProcessInfo, RunInfo, Vertex
 from ..provenance import stable_json_dumps
 from .reader_base import Reader
 from .writer_base import Writer
 
+try:  # optional: vectorized vertex reconstruction (hepconduit[numpy])
+    import numpy as _np
+except ImportError:
+    _np = None
+
+from .. import _vertex_numba as _nbvtx
+
+# Below this many particles the scalar vertex builder wins; above it the
+# numpy grouping amortizes its setup.
+_VECTORIZE_MIN_PARTICLES = 64
+
 
 def _require_pyarrow():
     try:
@@ -40,22 +51,78 @@ def json_loads_lenient(s: str):
             return None
 
 
+def _json_dict(s) -> dict:
+    """Decode an attributes/extra JSON cell to a dict.
+
+    Our writer emits "{}" for empty dicts -- the overwhelmingly common
+    case -- so empty, "{}" and "null" cells skip the JSON parser
+    entirely; everything else goes through the lenient decoder, with
+    undecodable cells coming back as {}.
+    """
+    if not s or s == "{}" or s == "null":
+        return {}
+    return json_loads_lenient(s) or {}
+
+
+# Separator for weight_names in schema metadata: the ASCII unit
+# separator cannot appear in a sane weight name and needs no escaping.
+_WEIGHT_NAME_SEP = "\x1f"
+
+
 def _encode_run_info(run_info: Optional[RunInfo]) -> dict[str, str]:
+    # RunInfo has a fixed schema, so each scalar field gets its own
+    # metadata entry instead of one JSON blob: decoding becomes plain
+    # dict lookups with no JSON parse on the read path. Only the
+    # structured tails (processes, extra) still go through JSON.
     run_info = run_info or RunInfo()
     md: dict[str, str] = {}
-    _md_set(md, "run_info_json", stable_json_dumps(asdict(run_info)))
-    _md_set(md, "beam_pdg_id", stable_json_dumps(list(run_info.beam_pdg_id)))
-    _md_set(md, "beam_energy", stable_json_dumps(list(run_info.beam_energy)))
-    _md_set(md, "weight_names", stable_json_dumps(list(run_info.weight_names)))
+    _md_set(md, "beam_pdg_id_0", int(run_info.beam_pdg_id[0]))
+    _md_set(md, "beam_pdg_id_1", int(run_info.beam_pdg_id[1]))
+    _md_set(md, "beam_energy_0", float(run_info.beam_energy[0]))
+    _md_set(md, "beam_energy_1", float(run_info.beam_energy[1]))
+    if run_info.weight_names:
+        _md_set(md, "weight_names", _WEIGHT_NAME_SEP.join(run_info.weight_names))
     _md_set(md, "generator_name", run_info.generator_name or "")
     _md_set(md, "generator_version", run_info.generator_version or "")
-    units = (run_info.extra or {}).get("units")
+    if run_info.processes:
+        _md_set(md, "processes_json", stable_json_dumps([asdict(p) for p in run_info.processes]))
+    extra = {k: v for k, v in (run_info.extra or {}).items() if k != "parquet_schema_metadata"}
+    if extra:
+        _md_set(md, "extra_json", stable_json_dumps(extra))
+    units = extra.get("units")
     if units is not None:
         _md_set(md, "units", stable_json_dumps(units))
     return md
 
 
 def _decode_run_info(md: dict[str, str]) -> RunInfo:
+    if _md_get(md, "beam_pdg_id_0") is not None:
+        ri = RunInfo(
+            beam_pdg_id=(int(_md_get(md, "beam_pdg_id_0", 0)), int(_md_get(md, "beam_pdg_id_1", 0))),
+            beam_energy=(float(_md_get(md, "beam_energy_0", 0.0)), float(_md_get(md, "beam_energy_1", 0.0))),
+            generator_name=_md_get(md, "generator_name", "") or "",
+            generator_version=_md_get(md, "generator_version", "") or "",
+        )
+        wn = _md_get(md, "weight_names")
+        if wn:
+            ri.weight_names = wn.split(_WEIGHT_NAME_SEP)
+        raw = _md_get(md, "processes_json")
+        if raw:
+            d = json_loads_lenient(raw)
+            if isinstance(d, list):
+                try:
+                    ri.processes = [ProcessInfo(**p) for p in d]
+                except TypeError:
+                    pass
+        raw = _md_get(md, "extra_json")
+        if raw:
+            d = json_loads_lenient(raw)
+            if isinstance(d, dict):
+                ri.extra = d
+        ri.extra.setdefault("parquet_schema_metadata", md)
+        return ri
+    # Fallback for files written before the per-field encoding, which
+    # carried the whole RunInfo as one JSON blob.
     raw = _md_get(md, "run_info_json")
     if not raw:
         return RunInfo(extra={"parquet_schema_metadata": md})
@@ -77,6 +144,16 @@ def _vertex_lookup(vertices: list[Vertex]) -> dict[int, Vertex]:
     return {int(v.barcode): v for v in (vertices or [])}
 
 
+def _sorted_unique(lst: list[int]) -> list[int]:
+    # Vertex incoming/outgoing lists are appended in particle order, and
+    # barcodes are assigned positionally -- so the list is usually
+    # already strictly increasing. One cheap monotonicity scan then
+    # skips the set build and the sort.
+    if all(a < b for a, b in zip(lst, lst[1:])):
+        return lst
+    return sorted(set(lst))
+
+
 def _ensure_vertices_from_particles(particles: list[Particle], vertices: list[Vertex]) -> list[Vertex]:
     vmap = _vertex_lookup(vertices or [])
     for p in particles:
@@ -92,11 +169,90 @@ def _ensure_vertices_from_particles(particles: list[Particle], vertices: list[Ve
         if p.end_vertex_barcode:
             vmap[int(p.end_vertex_barcode)].incoming.append(int(p.barcode))
     for v in vmap.values():
-        v.incoming = sorted(set(v.incoming))
-        v.outgoing = sorted(set(v.outgoing))
+        v.incoming = _sorted_unique(v.incoming)
+        v.outgoing = _sorted_unique(v.outgoing)
     return [vmap[k] for k in sorted(vmap.keys())]
 
 
+def _build_vertices_np(ev: Event) -> None:
+    """Vectorized vertex reconstruction for large events.
+
+    The grouping step -- canonicalize each particle's (mother1, mother2)
+    pair and dedup in first-encounter order -- runs in C via np.unique;
+    only the write-back into Particle/Vertex objects stays Python.
+    Produces exactly what the scalar path below produces.
+    """
+    ps = ev.particles
+    n = len(ps)
+    m1 = _np.fromiter((p.mother1 or 0 for p in ps), dtype=_np.int64, count=n)
+    m2 = _np.fromiter((p.mother2 or 0 for p in ps), dtype=_np.int64, count=n)
+    keys = _np.stack([_np.minimum(m1, m2), _np.maximum(m1, m2)], axis=1)
+    _, first_idx, inv = _np.unique(keys, axis=0, return_index=True, return_inverse=True)
+
+    # np.unique sorts lexically; remap ranks so vertex barcodes follow
+    # first encounter, matching the scalar next_vtx counter.
+    order = _np.argsort(first_idx, kind="stable")
+    rank = _np.empty(len(first_idx), dtype=_np.int64)
+    rank[order] = _np.arange(len(first_idx))
+    vtx_of = (-1 - rank[inv]).tolist()
+
+    # Barcodes are compact negatives in creation order; index vertices
+    # as a list by -barcode - 1 and reverse at the end (see the scalar
+    # path below).
+    vertices = [Vertex(barcode=-1 - r) for r in range(len(first_idx))]
+    for p, vtx in zip(ps, vtx_of):
+        p.vertex_barcode = vtx
+        vertices[-1 - vtx].outgoing.append(int(p.barcode))
+
+    m1l, m2l = m1.tolist(), m2.tolist()
+    for p, vtx, a, b in zip(ps, vtx_of, m1l, m2l):
+        for midx in (a, b):
+            if midx and 1 <= midx <= n:
+                mother = ps[midx - 1]
+                vertices[-1 - vtx].incoming.append(int(mother.barcode))
+                mother.end_vertex_barcode = vtx
+
+    for v in vertices:
+        v.incoming = _sorted_unique(v.incoming)
+        v.outgoing = _sorted_unique(v.outgoing)
+
+    ev.vertices = vertices[::-1]
+
+
+def _build_vertices_nb(ev: Event) -> None:
+    """Numba-compiled vertex reconstruction for large events.
+
+    The whole integer loop -- pair dedup plus the incoming/outgoing
+    barcode scatter -- runs inside the :func:`_vertex_numba.group_mothers`
+    kernel; Python only materializes the Vertex objects from the flat
+    arrays it returns. Produces exactly what the scalar path produces.
+    """
+    ps = ev.particles
+    n = len(ps)
+    m1 = _np.fromiter((p.mother1 or 0 for p in ps), dtype=_np.int64, count=n)
+    m2 = _np.fromiter((p.mother2 or 0 for p in ps), dtype=_np.int64, count=n)
+    bc = _np.fromiter((p.barcode for p in ps), dtype=_np.int64, count=n)
+    vtx_of, end_vtx_of, out_flat, out_off, in_flat, in_off = _nbvtx.group_mothers(m1, m2, bc)
+
+    for p, r in zip(ps, (-1 - vtx_of).tolist()):
+        p.vertex_barcode = r
+    for p, e in zip(ps, end_vtx_of.tolist()):
+        if e:
+            p.end_vertex_barcode = e
+
+    out_flat, out_off = out_flat.tolist(), out_off.tolist()
+    in_flat, in_off = in_flat.tolist(), in_off.tolist()
+    vertices = [
+        Vertex(
+            barcode=-1 - r,
+            incoming=_sorted_unique(in_flat[in_off[r]:in_off[r + 1]]),
+            outgoing=_sorted_unique(out_flat[out_off[r]:out_off[r + 1]]),
+        )
+        for r in range(len(out_off) - 1)
+    ]
+    ev.vertices = vertices[::-1]
+
+
 def _build_vertices_from_mothers(ev: Event) -> None:
     if ev.vertices:
         return
@@ -105,28 +261,38 @@ def _build_vertices_from_mothers(ev: Event) -> None:
         if not p.barcode:
             p.barcode = i
 
+    if len(ev.particles) >= _VECTORIZE_MIN_PARTICLES:
+        if _nbvtx.group_mothers is not None:
+            _build_vertices_nb(ev)
+            return
+        if _np is not None:
+            _build_vertices_np(ev)
+            return
+
+    # Vertex barcodes are compact negatives (-1, -2, ...) assigned in
+    # creation order, so a list indexed by -barcode - 1 replaces the
+    # barcode-keyed dict, and the final ascending-barcode ordering is
+    # just the list reversed -- no hashing, no sort.
     vtx_map: dict[tuple[int, int], int] = {}
-    vertices: dict[int, Vertex] = {}
-    next_vtx = -1
+    vertices: list[Vertex] = []
 
     def _vtx_for(m1: int, m2: int) -> int:
-        nonlocal next_vtx
         if m1 == 0 and m2 == 0:
             key = (0, 0)
         else:
-            a, b = (m1, m2) if m1 <= m2 else (m2, m1)
-            key = (a, b)
-        if key not in vtx_map:
-            vtx_map[key] = next_vtx
-            vertices[next_vtx] = Vertex(barcode=next_vtx)
-            next_vtx -= 1
-        return vtx_map[key]
+            key = (m1, m2) if m1 <= m2 else (m2, m1)
+        vtx = vtx_map.get(key)
+        if vtx is None:
+            vtx = -len(vertices) - 1
+            vtx_map[key] = vtx
+            vertices.append(Vertex(barcode=vtx))
+        return vtx
 
     for p in ev.particles:
         m1, m2 = int(p.mother1 or 0), int(p.mother2 or 0)
         vtx = _vtx_for(m1, m2)
         p.vertex_barcode = vtx
-        vertices[vtx].outgoing.append(int(p.barcode))
+        vertices[-1 - vtx].outgoing.append(int(p.barcode))
 
     for p in ev.particles:
         vtx = int(p.vertex_barcode or 0)
@@ -136,29 +302,82 @@ def _build_vertices_from_mothers(ev: Event) -> None:
         for midx in (m1, m2):
             if midx and 1 <= midx <= len(ev.particles):
                 mother = ev.particles[midx - 1]
-                vertices[vtx].incoming.append(int(mother.barcode))
+                vertices[-1 - vtx].incoming.append(int(mother.barcode))
                 mother.end_vertex_barcode = vtx
 
-    for v in vertices.values():
-        v.incoming = sorted(set(v.incoming))
-        v.outgoing = sorted(set(v.outgoing))
+    for v in vertices:
+        v.incoming = _sorted_unique(v.incoming)
+        v.outgoing = _sorted_unique(v.outgoing)
+
+    ev.vertices = vertices[::-1]
+
+
+# Record-batch size for streaming reads: 8k rows keeps a batch's hot
+# columns cache-resident while amortizing per-batch overhead.
+_ITER_BATCH_ROWS = 8192
+
+# Semantic presets for the columns= projection. Parquet's columnar
+# layout makes unprojected columns free: their chunks are never read
+# off disk, and fewer columns also means less Arrow -> Python decoding.
+_COLUMN_PRESETS = {
+    "kinematics": [
+        "event_number",
+        "pdg_id",
+        "status",
+        "px",
+        "py",
+        "pz",
+        "energy",
+        "mass",
+    ],
+}
 
-    ev.vertices = [vertices[k] for k in sorted(vertices.keys())]
+
+def _schema_metadata(schema) -> dict[str, str]:
+    md: dict[str, str] = {}
+    try:
+        if schema.metadata:
+            for k, v in schema.metadata.items():
+                md[k.decode("utf-8", "replace")] = v.decode("utf-8", "replace")
+    except Exception:
+        md = {}
+    return md
 
 
 class ParquetReader(Reader):
-    def read(self, path: str) -> EventFile:
+    def read(self, path: str, columns=None, workers: int | None = None) -> EventFile:
+        """Read a parquet event file.
+
+        ``columns`` pushes a projection down to the parquet scan: a list
+        of column names, or a preset name ("kinematics"). Absent columns
+        fall back to their defaults, so a projected read yields events
+        with the skipped fields zeroed. None reads everything.
+
+        ``workers`` > 1 fans the flat-layout decode out across row
+        groups with a process pool; it is ignored for single-row-group
+        or columnar files.
+        """
         pa, pq = _require_pyarrow()
-        table = pq.read_table(path)
-        md: dict[str, str] = {}
-        try:
-            if table.schema.metadata:
-                for k, v in table.schema.metadata.items():
-                    md[k.decode("utf-8", "replace")] = v.decode("utf-8", "replace")
-        except Exception:
-            md = {}
-
-        run_info = _decode_run_info(md)
+        if columns is not None:
+            if isinstance(columns, str):
+                try:
+                    columns = _COLUMN_PRESETS[columns]
+                except KeyError:
+                    raise ValueError(f"unknown column preset: {columns!r}") from None
+            # Only request columns the file actually has; pq.read_table
+            # errors on unknown names and presets target the flat layout.
+            present = set(pq.read_schema(path).names)
+            columns = [c for c in columns if c in present]
+
+        if workers is not None and workers > 1:
+            pqf = pq.ParquetFile(path)
+            if "particles" not in pqf.schema_arrow.names and pqf.metadata.num_row_groups > 1:
+                md = _schema_metadata(pqf.schema_arrow)
+                events = _read_flat_parallel(path, columns, workers, pqf.metadata.num_row_groups)
+                return EventFile(run_info=_decode_run_info(md), events=events, format_name="parquet")
+
+        table = pq.read_table(path, columns=columns)
+        run_info = _decode_run_info(_schema_metadata(table.schema))
         cols = set(table.column_names)
 
         if "particles" in cols:
@@ -170,128 +389,297 @@ class ParquetReader(Reader):
         return ef
 
     def iter_events(self, path: str) -> Iterator[Event]:
-        return iter(self.read(path).events)
+        """Stream events without materializing the whole file.
 
+        Reads 8192-row record batches via ``pq.ParquetFile.iter_batches``
+        so peak memory stays O(batch) rather than O(file). Events in a
+        flat file are assumed row-contiguous, as our writer emits them;
+        arbitrarily interleaved rows are only merged by ``read()``.
+        """
+        pa, pq = _require_pyarrow()
+        pqf = pq.ParquetFile(path)
+        if "particles" in set(pqf.schema_arrow.names):
+            for batch in pqf.iter_batches(batch_size=_ITER_BATCH_ROWS):
+                yield from _read_columnar(pa.Table.from_batches([batch]), run_info=RunInfo()).events
+            return
+        yield from _iter_flat_batches(pqf, pa)
 
-def _read_flat(table, *, run_info: RunInfo) -> EventFile:
-    from collections import defaultdict
+
+def _flat_columns(table) -> dict:
+    """Decode a flat table (or single-batch table) into Python columns.
+
+    Fixed-width columns come back as lists of Python scalars via NumPy,
+    variable-width ones via Arrow ``to_pylist``; ``ev_arr`` stays a NumPy
+    array for vectorized grouping. Shared by the whole-file reader and
+    the batch streamer.
+    """
+    import numpy as np  # pyarrow guarantees numpy
 
     cols = set(table.column_names)
-    ev_col = table["event_number"].to_pylist()
+    n = table.num_rows
+
+    def ncol_np(name, default):
+        # Fixed-width column -> NumPy, zero-copy when the buffer allows
+        # it, with a copying fallback otherwise. Nulls are filled with
+        # the column default first. None when the column is absent.
+        if name not in cols:
+            return None
+        arr = table.column(name)
+        if arr.null_count:
+            arr = arr.fill_null(default)
+        arr = arr.combine_chunks()
+        try:
+            return arr.to_numpy(zero_copy_only=True)
+        except Exception:
+            return arr.to_numpy(zero_copy_only=False)
+
+    def ncol(name, default, dtype):
+        # One C-level .tolist(): cells come out as Python scalars
+        # already, so the row loop does no per-cell int()/float()
+        # marshalling.
+        arr = ncol_np(name, default)
+        if arr is None:
+            return [default] * n
+        return arr.tolist()
 
     def col(name, default=None):
+        # Variable-width columns (strings, lists) stay on the Arrow path.
         if name in cols:
             return table[name].to_pylist()
-        return [default] * len(ev_col)
-
-    pdg = col("pdg_id", 0)
-    status = col("status", 0)
-    px = col("px", 0.0)
-    py = col("py", 0.0)
-    pz = col("pz", 0.0)
-    e = col("energy", 0.0)
-    m = col("mass", 0.0)
-    mother1 = col("mother1", 0)
-    mother2 = col("mother2", 0)
-    color1 = col("color1", 0)
-    color2 = col("color2", 0)
-    spin = col("spin", 9.0)
-    barcode = col("barcode", 0)
-    vbar = col("vertex_barcode", 0)
-    evbar = col("end_vertex_barcode", 0)
+        return [default] * n
+
+    ev_arr = ncol_np("event_number", 0)
+    if ev_arr is None:
+        ev_arr = np.zeros(n, dtype=np.int64)
+
+    pdg = ncol("pdg_id", 0, np.int64)
+    status = ncol("status", 0, np.int64)
+    px = ncol("px", 0.0, np.float64)
+    py = ncol("py", 0.0, np.float64)
+    pz = ncol("pz", 0.0, np.float64)
+    e = ncol("energy", 0.0, np.float64)
+    m = ncol("mass", 0.0, np.float64)
+    mother1 = ncol("mother1", 0, np.int64)
+    mother2 = ncol("mother2", 0, np.int64)
+    color1 = ncol("color1", 0, np.int64)
+    color2 = ncol("color2", 0, np.int64)
+    spin = ncol("spin", 9.0, np.float64)
+    barcode = ncol("barcode", 0, np.int64)
+    vbar = ncol("vertex_barcode", 0, np.int64)
+    evbar = ncol("end_vertex_barcode", 0, np.int64)
     attr_json = col("attributes_json", None)
 
-    proc = col("process_id", 0)
-    scale = col("scale", 0.0)
-    aqed = col("alpha_qed", 0.0)
-    aqcd = col("alpha_qcd", 0.0)
+    proc = ncol("process_id", 0, np.int64)
+    scale = ncol("scale", 0.0, np.float64)
+    aqed = ncol("alpha_qed", 0.0, np.float64)
+    aqcd = ncol("alpha_qcd", 0.0, np.float64)
     weights = col("weights", None)
     extra_json = col("event_extra_json", None)
 
     have_vpos = {"prod_vx", "prod_vy", "prod_vz", "prod_vt", "end_vx", "end_vy", "end_vz", "end_vt"} <= cols
-    pvx = col("prod_vx", 0.0)
-    pvy = col("prod_vy", 0.0)
-    pvz = col("prod_vz", 0.0)
-    pvt = col("prod_vt", 0.0)
-    evx = col("end_vx", 0.0)
-    evy = col("end_vy", 0.0)
-    evz = col("end_vz", 0.0)
-    evt = col("end_vt", 0.0)
-
-    by_ev = defaultdict(list)
-    ev_meta: dict[int, dict] = {}
-    vpos_by_ev: dict[int, dict[int, tuple[float, float, float, float]]] = {}
-
-    for i, evn in enumerate(ev_col):
-        evn_i = int(evn)
-        attrs = json_loads_lenient(attr_json[i]) if (attr_json and attr_json[i]) else {}
+    pvx = ncol("prod_vx", 0.0, np.float64)
+    pvy = ncol("prod_vy", 0.0, np.float64)
+    pvz = ncol("prod_vz", 0.0, np.float64)
+    pvt = ncol("prod_vt", 0.0, np.float64)
+    evx = ncol("end_vx", 0.0, np.float64)
+    evy = ncol("end_vy", 0.0, np.float64)
+    evz = ncol("end_vz", 0.0, np.float64)
+    evt = ncol("end_vt", 0.0, np.float64)
+
+    return {
+        "ev_arr": ev_arr,
+        "pdg": pdg, "status": status,
+        "px": px, "py": py, "pz": pz, "e": e, "m": m,
+        "mother1": mother1, "mother2": mother2,
+        "color1": color1, "color2": color2,
+        "spin": spin, "barcode": barcode, "vbar": vbar, "evbar": evbar,
+        "attr_json": attr_json,
+        "proc": proc, "scale": scale, "aqed": aqed, "aqcd": aqcd,
+        "weights": weights, "extra_json": extra_json,
+        "have_vpos": have_vpos,
+        "pvx": pvx, "pvy": pvy, "pvz": pvz, "pvt": pvt,
+        "evx": evx, "evy": evy, "evz": evz, "evt": evt,
+    }
+
+
+def _flat_rows(c: dict, ridx) -> tuple[list[Particle], dict]:
+    """Particles (and vertex positions) for flat rows ``ridx``, in order."""
+    pdg, status = c["pdg"], c["status"]
+    px, py, pz, e, m = c["px"], c["py"], c["pz"], c["e"], c["m"]
+    mother1, mother2 = c["mother1"], c["mother2"]
+    color1, color2 = c["color1"], c["color2"]
+    spin, barcode, vbar, evbar = c["spin"], c["barcode"], c["vbar"], c["evbar"]
+    attr_json = c["attr_json"]
+    have_vpos = c["have_vpos"]
+    pvx, pvy, pvz, pvt = c["pvx"], c["pvy"], c["pvz"], c["pvt"]
+    evx, evy, evz, evt = c["evx"], c["evy"], c["evz"], c["evt"]
+
+    parts: list[Particle] = []
+    vpos: dict[int, tuple[float, float, float, float]] = {}
+    for i in ridx:
+        attrs = _json_dict(attr_json[i])
+        # Positional construction: _flat_columns cells are Python scalars already.
         p = Particle(
-            pdg_id=int(pdg[i]),
-            status=int(status[i]),
-            px=float(px[i]),
-            py=float(py[i]),
-            pz=float(pz[i]),
-            energy=float(e[i]),
-            mass=float(m[i]),
-            mother1=int(mother1[i]),
-            mother2=int(mother2[i]),
-            color1=int(color1[i]),
-            color2=int(color2[i]),
-            spin=float(spin[i]) if spin is not None else 9.0,
-            barcode=int(barcode[i]) if barcode is not None else 0,
-            vertex_barcode=int(vbar[i]) if vbar is not None else 0,
-            end_vertex_barcode=int(evbar[i]) if evbar is not None else 0,
-            attributes=attrs or {},
+            pdg[i], status[i],
+            px[i], py[i], pz[i], e[i], m[i],
+            mother1[i], mother2[i], color1[i], color2[i],
+            spin[i], barcode[i], vbar[i], evbar[i],
+            attrs or {},
         )
-        by_ev[evn_i].append(p)
-
-        if evn_i not in ev_meta:
-            ev_meta[evn_i] = {
-                "weights": [float(x) for x in (weights[i] or [1.0])] if weights else [1.0],
-                "process_id": int(proc[i] or 0),
-                "scale": float(scale[i] or 0.0),
-                "alpha_qed": float(aqed[i] or 0.0),
-                "alpha_qcd": float(aqcd[i] or 0.0),
-                "extra": json_loads_lenient(extra_json[i]) if (extra_json and extra_json[i]) else {},
-            }
-
+        parts.append(p)
         if have_vpos:
-            vpos_by_ev.setdefault(evn_i, {})
             if p.vertex_barcode:
-                vpos_by_ev[evn_i][int(p.vertex_barcode)] = (float(pvx[i]), float(pvy[i]), float(pvz[i]), float(pvt[i]))
+                vpos[p.vertex_barcode] = (pvx[i], pvy[i], pvz[i], pvt[i])
             if p.end_vertex_barcode:
-                vpos_by_ev[evn_i][int(p.end_vertex_barcode)] = (float(evx[i]), float(evy[i]), float(evz[i]), float(evt[i]))
+                vpos[p.end_vertex_barcode] = (evx[i], evy[i], evz[i], evt[i])
+    return parts, vpos
+
+
+def _flat_meta(c: dict, i0: int) -> dict:
+    """Event-level metadata read from the event's first row."""
+    extra_json = c["extra_json"]
+    return {
+        "weights": [float(x) for x in (c["weights"][i0] or [1.0])],
+        "process_id": c["proc"][i0],
+        "scale": c["scale"][i0],
+        "alpha_qed": c["aqed"][i0],
+        "alpha_qcd": c["aqcd"][i0],
+        "extra": _json_dict(extra_json[i0]),
+    }
+
+
+def _finalize_flat_event(evn: int, parts: list[Particle], vpos: dict, meta: dict) -> Event:
+    ev = Event(
+        event_number=evn,
+        particles=parts,
+        n_particles=len(parts),
+        weights=meta["weights"],
+        process_id=meta["process_id"],
+        scale=meta["scale"],
+        alpha_qed=meta["alpha_qed"],
+        alpha_qcd=meta["alpha_qcd"],
+        extra=meta["extra"],
+    )
+
+    vertices: list[Vertex] = []
+    for vb, (x, y, z, t) in vpos.items():
+        vertices.append(Vertex(barcode=int(vb), x=float(x), y=float(y), z=float(z), t=float(t)))
+
+    if not vertices:
+        _build_vertices_from_mothers(ev)
+    else:
+        ev.vertices = _ensure_vertices_from_particles(ev.particles, vertices)
+    return ev
 
-    events: list[Event] = []
-    for evn, parts in sorted(by_ev.items()):
-        meta = ev_meta.get(evn, {})
-        ev = Event(
-            event_number=evn,
-            particles=parts,
-            n_particles=len(parts),
-            weights=meta.get("weights", [1.0]),
-            process_id=meta.get("process_id", 0),
-            scale=meta.get("scale", 0.0),
-            alpha_qed=meta.get("alpha_qed", 0.0),
-            alpha_qcd=meta.get("alpha_qcd", 0.0),
-            extra=meta.get("extra", {}) or {},
-        )
-
-        vertices: list[Vertex] = []
-        if have_vpos:
-            for vb, (x, y, z, t) in (vpos_by_ev.get(evn, {}) or {}).items():
-                vertices.append(Vertex(barcode=int(vb), x=float(x), y=float(y), z=float(z), t=float(t)))
 
-        if not vertices:
-            _build_vertices_from_mothers(ev)
-        else:
-            ev.vertices = _ensure_vertices_from_particles(ev.particles, vertices)
+def _read_flat(table, *, run_info: RunInfo) -> EventFile:
+    import numpy as np  # pyarrow guarantees numpy
+
+    c = _flat_columns(table)
+    ev_arr = c["ev_arr"]
+    n = len(ev_arr)
+
+    # Group rows by event number in C instead of bucketing through a
+    # defaultdict: a stable argsort keeps row order within each event,
+    # boundaries fall out of one vectorized comparison, and the groups
+    # come back sorted by event number like the old sorted(by_ev.items()).
+    # Event metadata is read once per group, at its first row.
+    order = np.argsort(ev_arr, kind="stable")
+    sorted_ev = ev_arr[order]
+    cuts = np.nonzero(sorted_ev[1:] != sorted_ev[:-1])[0] + 1
+    groups = np.split(order, cuts) if n else []
 
-        events.append(ev)
+    events: list[Event] = []
+    for rows in groups:
+        ridx = rows.tolist()
+        i0 = ridx[0]
+        parts, vpos = _flat_rows(c, ridx)
+        events.append(_finalize_flat_event(int(ev_arr[i0]), parts, vpos, _flat_meta(c, i0)))
 
     return EventFile(run_info=run_info, events=events, format_name="parquet")
 
 
+def _flat_runs(c: dict) -> list[tuple[int, list[Particle], dict, dict]]:
+    """Decoded (event_number, particles, vpos, meta) runs, in row order.
+
+    A run is a maximal stretch of contiguous rows sharing one event
+    number; callers merge runs that belong to the same event (across
+    batch or chunk boundaries) before finalizing.
+    """
+    import numpy as np  # pyarrow guarantees numpy
+
+    ev_arr = c["ev_arr"]
+    n = len(ev_arr)
+    if not n:
+        return []
+    cuts = np.nonzero(ev_arr[1:] != ev_arr[:-1])[0] + 1
+    starts = [0, *cuts.tolist(), n]
+    runs = []
+    for s, end in zip(starts, starts[1:]):
+        parts, vpos = _flat_rows(c, range(s, end))
+        runs.append((int(ev_arr[s]), parts, vpos, _flat_meta(c, s)))
+    return runs
+
+
+def _iter_flat_batches(pqf, pa) -> Iterator[Event]:
+    """Stream flat-layout events batch by batch with bounded memory.
+
+    Rows for one event are expected to be contiguous (our writer emits
+    them that way); runs of equal event number are merged across batch
+    boundaries, so the carry never exceeds one event.
+    """
+    carry: Optional[tuple[int, list[Particle], dict, dict]] = None
+    for batch in pqf.iter_batches(batch_size=_ITER_BATCH_ROWS):
+        for evn, parts, vpos, meta in _flat_runs(_flat_columns(pa.Table.from_batches([batch]))):
+            if carry is not None and carry[0] == evn:
+                carry[1].extend(parts)
+                carry[2].update(vpos)
+                continue
+            if carry is not None:
+                yield _finalize_flat_event(*carry)
+            carry = (evn, parts, vpos, meta)
+    if carry is not None:
+        yield _finalize_flat_event(*carry)
+
+
+def _flat_runs_task(path: str, columns, lo: int, hi: int):
+    # Module-level so worker processes can unpickle the call; each
+    # worker reads only its own row groups off disk.
+    _, pq = _require_pyarrow()
+    pqf = pq.ParquetFile(path)
+    table = pqf.read_row_groups(list(range(lo, hi)), columns=columns)
+    return _flat_runs(_flat_columns(table))
+
+
+def _read_flat_parallel(path: str, columns, workers: int, n_groups: int) -> list[Event]:
+    """Fan a flat read out across row groups, one worker per chunk.
+
+    Particle construction is CPU-bound Python, so chunks go to
+    processes (as in Reader.read_many). Workers return decoded runs;
+    the parent merges runs with equal event number in arrival order --
+    reproducing read()'s stable-argsort semantics, including files with
+    interleaved rows -- then finalizes vertices once per event.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(workers, n_groups)
+    bounds = [round(i * n_groups / workers) for i in range(workers + 1)]
+    ranges = [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if lo < hi]
+
+    merged: dict[int, tuple[list[Particle], dict, dict]] = {}
+    with ProcessPoolExecutor(max_workers=len(ranges)) as ex:
+        futures = [ex.submit(_flat_runs_task, path, columns, lo, hi) for lo, hi in ranges]
+        for fut in futures:
+            for evn, parts, vpos, meta in fut.result():
+                cur = merged.get(evn)
+                if cur is None:
+                    merged[evn] = (parts, vpos, meta)
+                else:
+                    cur[0].extend(parts)
+                    cur[1].update(vpos)
+    return [_finalize_flat_event(evn, *merged[evn]) for evn in sorted(merged)]
+
+
 def _read_columnar(table, *, run_info: RunInfo) -> EventFile:
     cols = set(table.column_names)
     ev_numbers = table["event_number"].to_pylist() if "event_number" in cols else list(range(1, table.num_rows + 1))
@@ -316,7 +704,7 @@ def _read_columnar(table, *, run_info: RunInfo) -> EventFile:
         for p in (plist or []):
             attrs = p.get("attributes")
             if attrs is None and p.get("attributes_json"):
-                attrs = json_loads_lenient(p.get("attributes_json")) or {}
+                attrs = _json_dict(p.get("attributes_json"))
             parts.append(
                 Particle(
                     pdg_id=int(p.get("pdg_id", 0)),
@@ -362,7 +750,7 @@ def _read_columnar(table, *, run_info: RunInfo) -> EventFile:
             scale=float(scale[i] or 0.0),
             alpha_qed=float(aqed[i] or 0.0),
             alpha_qcd=float(aqcd[i] or 0.0),
-            extra=json_loads_lenient(extra_json[i]) if (extra_json and extra_json[i]) else {},
+            extra=_json_dict(extra_json[i]) if extra_json else {},
         )
 
         if not ev.vertices:
@@ -373,9 +761,77 @@ def _read_columnar(table, *, run_info: RunInfo) -> EventFile:
     return EventFile(run_info=run_info, events=events, format_name="parquet")
 
 
+# Flat-layout column order, matching what from_pylist used to infer.
+_FLAT_WRITE_COLUMNS = (
+    "event_number", "process_id", "scale", "alpha_qed", "alpha_qcd",
+    "weights", "event_extra_json",
+    "pdg_id", "status", "mother1", "mother2", "color1", "color2",
+    "px", "py", "pz", "energy", "mass", "spin",
+    "barcode", "vertex_barcode", "end_vertex_barcode", "attributes_json",
+    "prod_vx", "prod_vy", "prod_vz", "prod_vt",
+    "end_vx", "end_vy", "end_vz", "end_vt",
+)
+
+_PARTICLE_STRUCT_FIELDS = (
+    "pdg_id", "status", "mother1", "mother2", "color1", "color2",
+    "px", "py", "pz", "energy", "mass", "spin",
+    "barcode", "vertex_barcode", "end_vertex_barcode", "attributes_json",
+)
+
+_VERTEX_STRUCT_FIELDS = ("barcode", "x", "y", "z", "t", "incoming", "outgoing")
+
+# Most particles carry no attributes; serialize the empty dict once.
+_EMPTY_JSON = stable_json_dumps({})
+
+
+def _attributes_json(p: Particle) -> str:
+    return stable_json_dumps(p.attributes) if p.attributes else _EMPTY_JSON
+
+
+def _particle_struct_types(pa) -> dict:
+    i64, f64 = pa.int64(), pa.float64()
+    types = {f: i64 for f in _PARTICLE_STRUCT_FIELDS}
+    for f in ("px", "py", "pz", "energy", "mass", "spin"):
+        types[f] = f64
+    types["attributes_json"] = pa.string()
+    return types
+
+
+def _vertex_struct_types(pa) -> dict:
+    f64 = pa.float64()
+    return {
+        "barcode": pa.int64(),
+        "x": f64, "y": f64, "z": f64, "t": f64,
+        "incoming": pa.list_(pa.int64()),
+        "outgoing": pa.list_(pa.int64()),
+    }
+
+
+def _columnar_schema(pa):
+    # Declared once so Table assembly never type-infers; field order is
+    # the column order the columnar reader expects.
+    i64, f64 = pa.int64(), pa.float64()
+    return pa.schema(
+        [
+            ("event_number", i64),
+            ("process_id", i64),
+            ("scale", f64),
+            ("alpha_qed", f64),
+            ("alpha_qcd", f64),
+            ("weights", pa.list_(f64)),
+            ("event_extra_json", pa.string()),
+            ("particles", pa.list_(pa.struct(list(_particle_struct_types(pa).items())))),
+            ("vertices", pa.list_(pa.struct(list(_vertex_struct_types(pa).items())))),
+        ]
+    )
+
+
 class ParquetWriter(Writer):
+    supports_metadata = True
+
     def write(self, path: str, events: Iterable[Event], run_info: Optional[RunInfo], **kwargs) -> None:
         columnar = bool(kwargs.get("columnar", False))
+        normalize = bool(kwargs.get("normalize_event_columns", False))
         metadata_in = kwargs.get("metadata") or {}
         pa, pq = _require_pyarrow()
 
@@ -383,83 +839,194 @@ class ParquetWriter(Writer):
         for k, v in metadata_in.items():
             md[str(k)] = str(v)
 
+        # Columns are built directly (SoA) and handed to Arrow whole:
+        # from_pylist had to allocate a dict per row, type-infer, and
+        # transpose back into columns -- the direction Arrow is worst at.
         if columnar:
-            rows = []
-            for ev in events:
-                _build_vertices_from_mothers(ev)
-                rows.append({
-                    "event_number": ev.event_number,
-                    "process_id": ev.process_id,
-                    "scale": ev.scale,
-                    "alpha_qed": ev.alpha_qed,
-                    "alpha_qcd": ev.alpha_qcd,
-                    "weights": list(ev.weights or [1.0]),
-                    "event_extra_json": stable_json_dumps(ev.extra or {}),
-                    "particles": [
-                        {
-                            "pdg_id": p.pdg_id,
-                            "status": p.status,
-                            "mother1": p.mother1,
-                            "mother2": p.mother2,
-                            "color1": p.color1,
-                            "color2": p.color2,
-                            "px": p.px,
-                            "py": p.py,
-                            "pz": p.pz,
-                            "energy": p.energy,
-                            "mass": p.mass,
-                            "spin": p.spin,
-                            "barcode": p.barcode,
-                            "vertex_barcode": p.vertex_barcode,
-                            "end_vertex_barcode": p.end_vertex_barcode,
-                            "attributes_json": stable_json_dumps(p.attributes or {}),
-                        }
-                        for p in ev.particles
-                    ],
-                    "vertices": [
-                        {
-                            "barcode": v.barcode,
-                            "x": v.x,
-                            "y": v.y,
-                            "z": v.z,
-                            "t": v.t,
-                            "incoming": list(v.incoming or []),
-                            "outgoing": list(v.outgoing or []),
-                        }
-                        for v in (ev.vertices or [])
-                    ],
-                })
-            table = pa.Table.from_pylist(rows)
-            table = table.replace_schema_metadata({k: str(v) for k, v in md.items()})
-            pq.write_table(table, path)
-            return
-
-        rows = []
+            table = self._build_columnar_table(pa, events)
+        else:
+            table = self._build_flat_table(pa, events, normalize=normalize)
+        table = table.replace_schema_metadata({k: str(v) for k, v in md.items()})
+        self._write_table(pa, pq, table, path, columnar=columnar)
+
+    @staticmethod
+    def _write_table(pa, pq, table, path: str, *, columnar: bool = False) -> None:
+        """Write with encodings tuned for event data.
+
+        Event rows repeat heavily (event_number, process_id, pdg_id,
+        status), so those columns get dictionary encoding and the whole
+        file zstd; 8192-row row groups keep reader batches small, and
+        flat rows are stably sorted by event_number (when not already
+        ordered) so readers can skip row groups on event predicates.
+        Columnar rows are never reordered: there row order *is* the
+        event order, which the readers preserve.
+        """
+        names = table.column_names
+        ev_sorted = False
+        if "event_number" in names and table.num_rows:
+            ev_col = table.column("event_number").combine_chunks()
+            if _np is not None:
+                try:
+                    ev = ev_col.to_numpy(zero_copy_only=True)
+                except Exception:
+                    ev = ev_col.to_numpy(zero_copy_only=False)
+                ev_sorted = bool((ev[1:] >= ev[:-1]).all())
+                if not ev_sorted and not columnar:
+                    # Stable sort keeps particle order within each event.
+                    table = table.take(pa.array(_np.argsort(ev, kind="stable")))
+                    ev_sorted = True
+            else:
+                # Without numpy the sort is skipped; a linear scan decides
+                # whether the SortingColumn claim below would be truthful.
+                vals = ev_col.to_pylist()
+                ev_sorted = all(a <= b for a, b in zip(vals, vals[1:]))
+
+        opts: dict = {
+            "compression": "zstd",
+            "compression_level": 3,
+            "use_dictionary": [c for c in ("pdg_id", "status", "event_number", "process_id") if c in names],
+            "row_group_size": _ITER_BATCH_ROWS,
+            "data_page_size": 1 << 20,
+            "write_statistics": True,
+        }
+        if ev_sorted and hasattr(pq, "SortingColumn"):
+            opts["sorting_columns"] = [pq.SortingColumn(column_index=names.index("event_number"))]
+        pq.write_table(table, path, **opts)
+
+    @staticmethod
+    def _build_columnar_table(pa, events: Iterable[Event]):
+        ev_cols: dict[str, list] = {
+            "event_number": [], "process_id": [], "scale": [],
+            "alpha_qed": [], "alpha_qcd": [], "weights": [],
+            "event_extra_json": [],
+        }
+        # Nested columns as flattened field arrays + list offsets, so the
+        # particle/vertex structs are assembled by StructArray.from_arrays
+        # rather than re-inferred from per-row dicts.
+        p_cols: dict[str, list] = {f: [] for f in _PARTICLE_STRUCT_FIELDS}
+        v_cols: dict[str, list] = {f: [] for f in _VERTEX_STRUCT_FIELDS}
+        p_offsets = [0]
+        v_offsets = [0]
+
+        n_events = 0
+        for ev in events:
+            n_events += 1
+            _build_vertices_from_mothers(ev)
+            ev_cols["event_number"].append(ev.event_number)
+            ev_cols["process_id"].append(ev.process_id)
+            ev_cols["scale"].append(ev.scale)
+            ev_cols["alpha_qed"].append(ev.alpha_qed)
+            ev_cols["alpha_qcd"].append(ev.alpha_qcd)
+            ev_cols["weights"].append(list(ev.weights or [1.0]))
+            ev_cols["event_extra_json"].append(stable_json_dumps(ev.extra) if ev.extra else _EMPTY_JSON)
+            for p in ev.particles:
+                p_cols["pdg_id"].append(p.pdg_id)
+                p_cols["status"].append(p.status)
+                p_cols["mother1"].append(p.mother1)
+                p_cols["mother2"].append(p.mother2)
+                p_cols["color1"].append(p.color1)
+                p_cols["color2"].append(p.color2)
+                p_cols["px"].append(p.px)
+                p_cols["py"].append(p.py)
+                p_cols["pz"].append(p.pz)
+                p_cols["energy"].append(p.energy)
+                p_cols["mass"].append(p.mass)
+                p_cols["spin"].append(p.spin)
+                p_cols["barcode"].append(p.barcode)
+                p_cols["vertex_barcode"].append(p.vertex_barcode)
+                p_cols["end_vertex_barcode"].append(p.end_vertex_barcode)
+                p_cols["attributes_json"].append(_attributes_json(p))
+            p_offsets.append(len(p_cols["pdg_id"]))
+            for v in ev.vertices or []:
+                v_cols["barcode"].append(v.barcode)
+                v_cols["x"].append(v.x)
+                v_cols["y"].append(v.y)
+                v_cols["z"].append(v.z)
+                v_cols["t"].append(v.t)
+                v_cols["incoming"].append(list(v.incoming or []))
+                v_cols["outgoing"].append(list(v.outgoing or []))
+            v_offsets.append(len(v_cols["barcode"]))
+
+        if not n_events:
+            return pa.Table.from_pylist([])
+
+        def _list_struct(cols, fields, offsets):
+            struct = pa.StructArray.from_arrays(
+                [pa.array(cols[name], type=typ) for name, typ in fields.items()],
+                names=list(fields),
+            )
+            return pa.ListArray.from_arrays(pa.array(offsets, type=pa.int32()), struct)
+
+        schema = _columnar_schema(pa)
+        arrays = [
+            pa.array(ev_cols[f.name], type=f.type)
+            for f in schema
+            if f.name not in ("particles", "vertices")
+        ]
+        arrays.append(_list_struct(p_cols, _particle_struct_types(pa), p_offsets))
+        arrays.append(_list_struct(v_cols, _vertex_struct_types(pa), v_offsets))
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+    @staticmethod
+    def _build_flat_table(pa, events: Iterable[Event], *, normalize: bool = False):
+        cols: dict[str, list] = {name: [] for name in _FLAT_WRITE_COLUMNS}
         for ev in events:
             _build_vertices_from_mothers(ev)
             vmap = _vertex_lookup(ev.vertices or [])
+            # Event-level values are identical for every particle row:
+            # serialize/copy them once per event, not once per particle.
+            evn = ev.event_number
+            proc, scale = ev.process_id, ev.scale
+            aqed, aqcd = ev.alpha_qed, ev.alpha_qcd
+            weights_l = list(ev.weights or [1.0])
+            extra_s = stable_json_dumps(ev.extra) if ev.extra else _EMPTY_JSON
+            first_row = True
             for p in ev.particles:
                 prod = vmap.get(int(p.vertex_barcode)) if p.vertex_barcode else None
                 endv = vmap.get(int(p.end_vertex_barcode)) if p.end_vertex_barcode else None
-                rows.append({
-                    "event_number": ev.event_number,
-                    "process_id": ev.process_id,
-                    "scale": ev.scale,
-                    "alpha_qed": ev.alpha_qed,
-                    "alpha_qcd": ev.alpha_qcd,
-                    "weights": list(ev.weights or [1.0]),
-                    "event_extra_json": stable_json_dumps(ev.extra or {}),
-                    **p.to_dict(),
-                    "attributes_json": stable_json_dumps(p.attributes or {}),
-                    "prod_vx": float(prod.x) if prod else 0.0,
-                    "prod_vy": float(prod.y) if prod else 0.0,
-                    "prod_vz": float(prod.z) if prod else 0.0,
-                    "prod_vt": float(prod.t) if prod else 0.0,
-                    "end_vx": float(endv.x) if endv else 0.0,
-                    "end_vy": float(endv.y) if endv else 0.0,
-                    "end_vz": float(endv.z) if endv else 0.0,
-                    "end_vt": float(endv.t) if endv else 0.0,
-                })
-        table = pa.Table.from_pylist(rows)
-        table = table.replace_schema_metadata({k: str(v) for k, v in md.items()})
-        pq.write_table(table, path)
+                cols["event_number"].append(evn)
+                if first_row or not normalize:
+                    cols["process_id"].append(proc)
+                    cols["scale"].append(scale)
+                    cols["alpha_qed"].append(aqed)
+                    cols["alpha_qcd"].append(aqcd)
+                    cols["weights"].append(weights_l)
+                    cols["event_extra_json"].append(extra_s)
+                else:
+                    # Normalized layout: event-level values only on the
+                    # event's first row; the reader takes metadata from
+                    # there, and parquet RLE collapses the null runs.
+                    for name in ("process_id", "scale", "alpha_qed",
+                                 "alpha_qcd", "weights", "event_extra_json"):
+                        cols[name].append(None)
+                first_row = False
+                cols["pdg_id"].append(p.pdg_id)
+                cols["status"].append(p.status)
+                cols["mother1"].append(p.mother1)
+                cols["mother2"].append(p.mother2)
+                cols["color1"].append(p.color1)
+                cols["color2"].append(p.color2)
+                cols["px"].append(p.px)
+                cols["py"].append(p.py)
+                cols["pz"].append(p.pz)
+                cols["energy"].append(p.energy)
+                cols["mass"].append(p.mass)
+                cols["spin"].append(p.spin)
+                cols["barcode"].append(p.barcode)
+                cols["vertex_barcode"].append(p.vertex_barcode)
+                cols["end_vertex_barcode"].append(p.end_vertex_barcode)
+                cols["attributes_json"].append(_attributes_json(p))
+                cols["prod_vx"].append(float(prod.x) if prod else 0.0)
+                cols["prod_vy"].append(float(prod.y) if prod else 0.0)
+                cols["prod_vz"].append(float(prod.z) if prod else 0.0)
+                cols["prod_vt"].append(float(prod.t) if prod else 0.0)
+                cols["end_vx"].append(float(endv.x) if endv else 0.0)
+                cols["end_vy"].append(float(endv.y) if endv else 0.0)
+                cols["end_vz"].append(float(endv.z) if endv else 0.0)
+                cols["end_vt"].append(float(endv.t) if endv else 0.0)
+
+        if not cols["event_number"]:
+            return pa.Table.from_pylist([])
+        data = {k: pa.array(v) for k, v in cols.items()}
+        data["weights"] = pa.array(cols["weights"], type=pa.list_(pa.float64()))
+        return pa.Table.from_pydict(data)
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Iterator
 
 from ..models import Event, EventFile, RunInfo
 
 
+def _read_one(reader: "Reader", path: str) -> EventFile:
+    # Module-level so worker processes can unpickle the call.
+    return reader.read(path)
+
+
 class Reader(ABC):
     @abstractmethod
     def read(self, path: str) -> EventFile:
@@ -18,3 +26,20 @@ class Reader(ABC):
     def read_run_info(self, path: str) -> RunInfo:
         """Optional fast path; default loads via read()."""
         return self.read(path).run_info
+
+    def read_many(self, paths, *, workers: int | None = None) -> list[EventFile]:
+        """Read several files concurrently, one task per file.
+
+        Parsing is CPU-bound Python, so files fan out across processes
+        rather than threads. Results come back in ``paths`` order. With
+        a single path (or ``workers=1``) this reads serially and skips
+        the pool entirely.
+        """
+        paths = [str(p) for p in paths]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(paths))
+        if workers <= 1:
+            return [self.read(p) for p in paths]
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(partial(_read_one, self), paths))
@@ -22,27 +22,34 @@ def register(fmt: str, reader: Callable[[], Reader], writer: Callable[[], Writer
     _REGISTRY[fmt] = FormatHandlers(reader=reader, writer=writer)
 
 
+# Extension -> format table, hoisted so detect_format does a single
+# dict probe instead of rebuilding the map per call.
+_EXT_MAP: dict[str, str] = {
+    ".lhe": "lhe",
+    ".hepmc": "hepmc3",
+    ".hepmc3": "hepmc3",
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".tab": "tsv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+
 def detect_format(filepath: str | Path) -> str:
-    p = Path(filepath)
-    suffixes = list(p.suffixes)
-    if suffixes and suffixes[-1] == ".gz":
-        suffixes = suffixes[:-1]
-    if not suffixes:
-        raise ValueError(f"Cannot detect format from filename: {p}")
-    ext = suffixes[-1].lower()
-    ext_map = {
-        ".lhe": "lhe",
-        ".hepmc": "hepmc3",
-        ".hepmc3": "hepmc3",
-        ".csv": "csv",
-        ".tsv": "tsv",
-        ".tab": "tsv",
-        ".parquet": "parquet",
-        ".pq": "parquet",
-    }
-    fmt = ext_map.get(ext)
+    # Plain string ops: detect_format runs once per file in CLI batch
+    # jobs, and Path construction plus the suffixes list cost more than
+    # the lookup itself.
+    name = os.path.basename(str(filepath)).lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    i = name.rfind(".")
+    if i <= 0:  # no extension, or a bare dotfile like ".lhe"
+        raise ValueError(f"Cannot detect format from filename: {filepath}")
+    ext = name[i:]
+    fmt = _EXT_MAP.get(ext)
     if fmt is None:
-        raise ValueError(f"Unknown file extension '{ext}' in {p}")
+        raise ValueError(f"Unknown file extension '{ext}' in {filepath}")
     return fmt
 
 
@@ -1,12 +1,65 @@
 from __future__ import annotations
 
+import gzip
+import os
+import shutil
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Iterable, Optional
 
 from ..models import Event, RunInfo
+from ._gzip import open_gzip
+
+# Chunk size for passthrough copies; large chunks keep the copy loop in
+# C (or the kernel) rather than Python.
+_PASSTHROUGH_CHUNK = 16 * 1024 * 1024
 
 
 class Writer(ABC):
+    # Whether write() can embed key/value metadata (e.g. provenance JSON).
+    # Callers may skip serialising metadata for writers that cannot store it.
+    supports_metadata: bool = False
+
     @abstractmethod
     def write(self, path: str, events: Iterable[Event], run_info: Optional[RunInfo], **kwargs) -> None:
         ...
+
+    def passthrough(self, src_path, dst_path) -> None:
+        """Copy a file without parsing events.
+
+        For pure passthrough pipelines (same format in and out, no
+        filter or transform) this skips Event construction and
+        re-serialisation entirely. ``.gz`` suffixes are honoured on
+        both sides: when they match, the raw bytes are copied verbatim
+        (byte-for-byte, including gz-to-gz -- recompressing would only
+        be content-equivalent), using os.sendfile where available so
+        bytes never enter userspace. When they differ, gzipped sources
+        decompress through open_gzip and gzipped destinations
+        recompress.
+        """
+        src = Path(src_path)
+        dst = Path(dst_path)
+        src_gz = src.suffix == ".gz"
+        dst_gz = dst.suffix == ".gz"
+
+        if src_gz == dst_gz:
+            with open(src, "rb") as fin, open(dst, "wb") as fout:
+                if hasattr(os, "sendfile"):
+                    in_fd = fin.fileno()
+                    out_fd = fout.fileno()
+                    offset = 0
+                    remaining = os.fstat(in_fd).st_size
+                    while remaining > 0:
+                        sent = os.sendfile(out_fd, in_fd, offset, min(remaining, _PASSTHROUGH_CHUNK))
+                        if sent == 0:
+                            break
+                        offset += sent
+                        remaining -= sent
+                else:
+                    shutil.copyfileobj(fin, fout, _PASSTHROUGH_CHUNK)
+            return
+
+        fin = open_gzip(src) if src_gz else open(src, "rb")
+        fout = gzip.open(dst, "wb") if dst_gz else open(dst, "wb")
+        with fin, fout:
+            shutil.copyfileobj(fin, fout, _PASSTHROUGH_CHUNK)
@@ -12,8 +12,58 @@ import math
 from dataclasses import dataclass, field
 from typing import Optional
 
-
-@dataclass
+try:  # optional: columnar particle views (hepconduit[numpy])
+    import numpy as _np
+except ImportError:
+    _np = None
+
+from . import _kinematics_numba as _nbkin
+
+# Particle fields stored as int64 in columnar views; the rest are float64.
+_INT_PARTICLE_FIELDS = frozenset(
+    {
+        "pdg_id",
+        "status",
+        "mother1",
+        "mother2",
+        "color1",
+        "color2",
+        "barcode",
+        "vertex_barcode",
+        "end_vertex_barcode",
+    }
+)
+
+
+# Particle constructor-argument order, for readers that build instances
+# positionally in their hot loops (keyword construction rebuilds a kwargs
+# dict per particle). Must stay in sync with the dataclass fields below.
+PARTICLE_FIELDS = (
+    "pdg_id",
+    "status",
+    "px",
+    "py",
+    "pz",
+    "energy",
+    "mass",
+    "mother1",
+    "mother2",
+    "color1",
+    "color2",
+    "spin",
+    "barcode",
+    "vertex_barcode",
+    "end_vertex_barcode",
+    "attributes",
+)
+
+
+# Fields the parquet/hepmc3 vertex builders rewrite in place; never
+# cached by Event.particle_columns.
+_MUTABLE_PARTICLE_FIELDS = frozenset({"barcode", "vertex_barcode", "end_vertex_barcode"})
+
+
+@dataclass(slots=True)
 class Particle:
     """A single particle in an event.
 
@@ -51,24 +101,45 @@ class Particle:
     vertex_barcode: int = 0
     end_vertex_barcode: int = 0
     attributes: dict = field(default_factory=dict)
+    # Memoization slots for the transcendental kinematics below.
+    # ``functools.cached_property`` needs a __dict__, which slots=True
+    # removes, so the properties cache by hand. Analyses read pt/eta/phi
+    # several times per particle (sort, cut, histogram); the repeat
+    # accesses become a slot load. Momenta are treated as immutable once
+    # a derived quantity has been read -- nothing in the codebase
+    # mutates them -- so there is no invalidation hook.
+    _pt: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _eta: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _phi: Optional[float] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def pt(self) -> float:
         """Transverse momentum."""
-        return math.sqrt(self.px**2 + self.py**2)
+        v = self._pt
+        if v is None:
+            v = self._pt = math.sqrt(self.px**2 + self.py**2)
+        return v
 
     @property
     def eta(self) -> float:
         """Pseudorapidity."""
-        p = math.sqrt(self.px**2 + self.py**2 + self.pz**2)
-        if p == abs(self.pz):
-            return float("inf") if self.pz >= 0 else float("-inf")
-        return 0.5 * math.log((p + self.pz) / (p - self.pz))
+        v = self._eta
+        if v is None:
+            p = math.sqrt(self.px**2 + self.py**2 + self.pz**2)
+            if p == abs(self.pz):
+                v = float("inf") if self.pz >= 0 else float("-inf")
+            else:
+                v = 0.5 * math.log((p + self.pz) / (p - self.pz))
+            self._eta = v
+        return v
 
     @property
     def phi(self) -> float:
         """Azimuthal angle."""
-        return math.atan2(self.py, self.px)
+        v = self._phi
+        if v is None:
+            v = self._phi = math.atan2(self.py, self.px)
+        return v
 
     @property
     def rapidity(self) -> float:
@@ -85,10 +156,12 @@ class Particle:
         ultra-relativistic / tiny-mass particles. We clamp small negative
         values to zero to avoid nonsense masses.
         """
-        m2 = self.energy**2 - self.px**2 - self.py**2 - self.pz**2
-        if m2 < 0 and abs(m2) < 1e-8:
-            m2 = 0.0
-        return math.sqrt(m2) if m2 >= 0 else -math.sqrt(-m2)
+        # Plain multiplies (not **) and a single sign-aware sqrt: the
+        # only remaining branch is the rare tiny-negative clamp.
+        m2 = self.energy * self.energy - (self.px * self.px + (self.py * self.py + self.pz * self.pz))
+        if -1e-8 < m2 < 0.0:
+            return 0.0
+        return math.copysign(math.sqrt(abs(m2)), m2)
 
     @property
     def is_incoming(self) -> bool:
@@ -123,7 +196,7 @@ class Particle:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Vertex:
     """A vertex in the event record (HepMC-style).
 
@@ -146,7 +219,7 @@ class Vertex:
     outgoing: list[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessInfo:
     """Information about a physics process.
 
@@ -163,7 +236,7 @@ class ProcessInfo:
     max_weight: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class RunInfo:
     """Run-level metadata.
 
@@ -186,7 +259,7 @@ class RunInfo:
     extra: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """A single physics event.
 
@@ -214,6 +287,14 @@ class Event:
     alpha_qcd: float = 0.0
     n_particles: int = 0
     extra: dict = field(default_factory=dict)
+    # Per-field column cache for particle_columns (slots rule out
+    # cached_property, as for the Particle kinematics above).
+    _columns: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    # Set by readers that share one extra dict across events; consumers
+    # that add keys (e.g. validate_stream) then copy-on-write first.
+    # Every in-tree reader builds a fresh dict per event, so the common
+    # case annotates in place with no copy.
+    _extra_shared: bool = field(default=False, init=False, repr=False, compare=False)
 
     @property
     def weight(self) -> float:
@@ -236,8 +317,87 @@ class Event:
     def n_final(self) -> int:
         return len(self.final_particles)
 
+    def particle_columns(self, fields: tuple[str, ...]) -> dict:
+        """Structure-of-arrays view of the requested particle fields.
+
+        Returns one NumPy array per field (int64 or float64), built with
+        a C-level fill per column. Vectorized consumers operate on these
+        instead of allocating per-particle Python objects; the Particle
+        list itself stays authoritative. Requires numpy.
+
+        Columns are cached per field, so validation, filtering and
+        batch kinematics passes over the same event extract each column
+        once. The cache assumes kinematics fields are immutable once
+        read (as for the Particle property caches); barcode fields,
+        which vertex reconstruction rewrites, are never cached, and a
+        length check drops stale columns if the particle list changed.
+        """
+        if _np is None:
+            raise RuntimeError("particle_columns requires numpy (hepconduit[numpy])")
+        ps = self.particles
+        n = len(ps)
+        cache = self._columns
+        if cache is None:
+            cache = self._columns = {}
+        out = {}
+        for f in fields:
+            arr = cache.get(f)
+            if arr is None or len(arr) != n:
+                arr = _np.fromiter(
+                    (getattr(p, f) for p in ps),
+                    dtype=_np.int64 if f in _INT_PARTICLE_FIELDS else _np.float64,
+                    count=n,
+                )
+                if f not in _MUTABLE_PARTICLE_FIELDS:
+                    cache[f] = arr
+            out[f] = arr
+        return out
+
+    def kinematics_arrays(self) -> dict:
+        """Batch pt/eta/phi/rapidity/mass for all particles at once.
+
+        Extracts px/py/pz/energy into float64 columns via
+        :meth:`particle_columns`, then computes every derived quantity
+        in one vectorized pass -- through the numba ``@vectorize``
+        kernels when hepconduit[numba] is installed, otherwise through
+        equivalent NumPy expressions. Results match the scalar Particle
+        properties element for element, including the +/-inf degenerate
+        cases and the computed-mass clamp. Requires numpy.
+        """
+        cols = self.particle_columns(("px", "py", "pz", "energy"))
+        px, py, pz, e = cols["px"], cols["py"], cols["pz"], cols["energy"]
+
+        if _nbkin.pt is not None:
+            return {
+                "pt": _nbkin.pt(px, py),
+                "eta": _nbkin.eta(px, py, pz),
+                "phi": _nbkin.phi(py, px),
+                "rapidity": _nbkin.rapidity(e, pz),
+                "mass": _nbkin.mass(e, px, py, pz),
+            }
+
+        p = _np.sqrt(px * px + py * py + pz * pz)
+        with _np.errstate(divide="ignore", invalid="ignore"):
+            eta = 0.5 * _np.log((p + pz) / (p - pz))
+            rap = 0.5 * _np.log((e + pz) / (e - pz))
+        deg = p == _np.abs(pz)
+        if deg.any():
+            eta[deg] = _np.where(pz[deg] >= 0, _np.inf, -_np.inf)
+        deg = e == _np.abs(pz)
+        if deg.any():
+            rap[deg] = _np.where(pz[deg] >= 0, _np.inf, -_np.inf)
+        m2 = e * e - (px * px + (py * py + pz * pz))
+        m2 = _np.where((m2 < 0) & (m2 > -1e-8), 0.0, m2)
+        return {
+            "pt": _np.sqrt(px * px + py * py),
+            "eta": eta,
+            "phi": _np.arctan2(py, px),
+            "rapidity": rap,
+            "mass": _np.copysign(_np.sqrt(_np.abs(m2)), m2),
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class EventFile:
     """A complete event file with run info and events.
 
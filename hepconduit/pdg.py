@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional
 
 _FALLBACK_NAMES = {
@@ -44,7 +45,18 @@ except Exception:  # pragma: no cover
     _PDGID = None
     _Particle = None
 
+try:  # optional: array-level validity masks (hepconduit[numpy])
+    import numpy as _np
+except ImportError:
+    _np = None
 
+
+# The scikit-hep lookups below walk a particle table on every call,
+# which is slow when invoked once per particle. PDG IDs in a file draw
+# from a small set, so an lru_cache turns repeat lookups into dict hits.
+
+
+@lru_cache(maxsize=8192)
 def is_valid_pdg_id(pdg_id: int) -> bool:
     if _PDGID is None:
         return True
@@ -54,6 +66,7 @@ def is_valid_pdg_id(pdg_id: int) -> bool:
         return False
 
 
+@lru_cache(maxsize=8192)
 def name(pdg_id: int) -> str:
     if _Particle is not None:
         try:
@@ -63,6 +76,7 @@ def name(pdg_id: int) -> str:
     return _FALLBACK_NAMES.get(pdg_id, str(pdg_id))
 
 
+@lru_cache(maxsize=8192)
 def mass_geV(pdg_id: int) -> Optional[float]:
     if _Particle is None:
         return None
@@ -74,6 +88,25 @@ def mass_geV(pdg_id: int) -> Optional[float]:
     except Exception:
         return None
 
+def valid_mask(pdg_ids):
+    """Boolean validity mask for an integer array of PDG IDs.
+
+    A static table of every valid ID is not available -- validity is
+    delegated to scikit-hep's particle package when installed -- so the
+    mask is built from one (cached) is_valid_pdg_id call per *distinct*
+    ID and expanded back to particle order with a single gather. Events
+    draw from a handful of IDs, so per-particle cost is just the
+    np.unique pass. Requires numpy.
+    """
+    if _np is None:
+        raise RuntimeError("valid_mask requires numpy (hepconduit[numpy])")
+    uniq, inv = _np.unique(pdg_ids, return_inverse=True)
+    good = _np.fromiter(
+        (is_valid_pdg_id(int(u)) for u in uniq), dtype=_np.bool_, count=len(uniq)
+    )
+    return good[inv]
+
+
 # Backwards-compatible alias
 is_valid = is_valid_pdg_id
 
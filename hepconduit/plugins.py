@@ -1,13 +1,72 @@
 from __future__ import annotations
 
-from importlib import metadata
-from typing import Callable
+import hashlib
+import json
+import os
+import sys
+from importlib import import_module, metadata
+from operator import attrgetter
+from typing import Callable, Optional
 
 from .io.registry import register
 
 
 _LOADED = False
 
+_CACHE_VERSION = 1
+
+
+def _cache_path() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "hepconduit", "plugins.json")
+
+
+def _cache_key() -> str:
+    # sys.path entries plus their mtimes: changes whenever a package is
+    # installed or removed, without reading any distribution metadata
+    # (hashing the full distribution set would itself rescan metadata
+    # and forfeit the saving).
+    parts = []
+    for p in sys.path:
+        try:
+            parts.append(f"{p}:{os.stat(p).st_mtime_ns}")
+        except OSError:
+            parts.append(p)
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+def _read_cache(key: str) -> Optional[list[str]]:
+    try:
+        with open(_cache_path(), encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != _CACHE_VERSION or data.get("key") != key:
+            return None
+        eps = data.get("entry_points")
+        return eps if isinstance(eps, list) else None
+    except Exception:
+        return None
+
+
+def _write_cache(key: str, values: list[str]) -> None:
+    path = _cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": _CACHE_VERSION, "key": key, "entry_points": values}, f)
+        os.replace(tmp, path)
+    except Exception:
+        # The cache is purely an optimization; never fail over it.
+        pass
+
+
+def _register_entry_point(value: str) -> None:
+    # value is "module:attr" (attr possibly dotted), as in ep.value.
+    mod, _, attr = value.partition(":")
+    fn = attrgetter(attr)(import_module(mod))
+    fmt, reader_factory, writer_factory = fn()
+    register(fmt, reader_factory, writer_factory)
+
 
 def load_plugins() -> None:
     """Load hepconduit plugins via Python entry points.
@@ -17,6 +76,12 @@ def load_plugins() -> None:
 
     This keeps core lightweight while allowing experiments to extend formats
     without forking.
+
+    The selected group is cached to ~/.cache/hepconduit/plugins.json,
+    keyed on the sys.path state: entry_points() walks the metadata of
+    every installed distribution, which costs tens of ms on a fat
+    environment, so warm starts import the cached "module:attr" values
+    directly and only a changed environment re-scans.
     """
 
     global _LOADED
@@ -24,13 +89,26 @@ def load_plugins() -> None:
         return
     _LOADED = True
 
+    key = _cache_key()
+    cached = _read_cache(key)
+    if cached is not None:
+        for value in cached:
+            try:
+                _register_entry_point(value)
+            except Exception:
+                # Plugin failures must not break core functionality.
+                continue
+        return
+
     try:
         eps = metadata.entry_points()
         group = eps.select(group="hepconduit.formats") if hasattr(eps, "select") else eps.get("hepconduit.formats", [])
     except Exception:
         return
 
+    values: list[str] = []
     for ep in group:
+        values.append(ep.value)
         try:
             fn = ep.load()
             fmt, reader_factory, writer_factory = fn()
@@ -38,3 +116,4 @@ def load_plugins() -> None:
         except Exception:
             # Plugin failures must not break core functionality.
             continue
+    _write_cache(key, values)
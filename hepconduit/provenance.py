@@ -2,29 +2,119 @@ from __future__ import annotations
 
 import hashlib
 import json
+import mmap
 import os
 import subprocess
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 
-def _sha256_file(path: str | Path, *, chunk_size: int = 1024 * 1024) -> str:
-    h = hashlib.sha256()
+# Files at least this large are memory-mapped and hashed in one call.
+_MMAP_MIN_BYTES = 256 * 1024
+
+
+def _sha256_file(path: str | Path) -> str:
+    """Cached sha256 of a file.
+
+    Keyed on (path, size, mtime_ns, inode), so re-hashing the same
+    unchanged input across conversions in one process -- the common
+    pipeline/batch pattern -- is a dict hit; any modification changes
+    the key and re-hashes automatically.
+    """
+    st = os.stat(path)
+    return _sha256_file_cached(str(path), st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+@lru_cache(maxsize=256)
+def _sha256_file_cached(path: str, size: int, mtime_ns: int, ino: int, *, chunk_size: int = 4 * 1024 * 1024) -> str:
     with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= _MMAP_MIN_BYTES:
+            # One sha256 call over the whole mapping: no Python-level
+            # chunk loop, and the kernel prefetches ahead of the hash.
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, "madvise"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    return hashlib.sha256(mm).hexdigest()
+            except (ValueError, OSError):  # pragma: no cover - exotic filesystems
+                pass
+        if hasattr(hashlib, "file_digest"):  # Python >= 3.11: chunk loop in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        buf = bytearray(chunk_size)
+        view = memoryview(buf)
         while True:
-            b = f.read(chunk_size)
-            if not b:
+            n = f.readinto(buf)
+            if not n:
                 break
-            h.update(b)
-    return h.hexdigest()
+            h.update(view[:n])
+        return h.hexdigest()
+
 
+# Chunking for the parallel tree hash: 8 MiB keeps per-chunk overhead
+# negligible while giving a multi-GB file plenty of parallel slices.
+_TREE_CHUNK_BYTES = 8 * 1024 * 1024
 
+# Domain-separation tag so a tree digest can never collide with (or be
+# mistaken for) a plain sha256 of the same bytes.
+_TREE_HASH_TAG = b"hepconduit-tree-sha256-v1"
+
+
+def _sha256_file_parallel(
+    path: str | Path,
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = _TREE_CHUNK_BYTES,
+) -> str:
+    """Tree-style sha256 of a file, hashing fixed-size chunks in parallel.
+
+    hashlib releases the GIL, so chunks hash concurrently in threads;
+    per-chunk digests are combined under a domain-separation tag. The
+    result is deterministic for a given chunk size but is NOT the plain
+    sha256 of the bytes -- provenance records it under a separate key.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        outer = hashlib.sha256(_TREE_HASH_TAG)
+        outer.update(chunk_size.to_bytes(8, "little"))
+        outer.update(size.to_bytes(8, "little"))
+        if size == 0:
+            return outer.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            mv = memoryview(mm)
+            try:
+                n_chunks = (size + chunk_size - 1) // chunk_size
+                from concurrent.futures import ThreadPoolExecutor
+
+                def _chunk_digest(i: int) -> bytes:
+                    return hashlib.sha256(mv[i * chunk_size:(i + 1) * chunk_size]).digest()
+
+                if n_chunks == 1:
+                    digests = [_chunk_digest(0)]
+                else:
+                    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as ex:
+                        digests = list(ex.map(_chunk_digest, range(n_chunks)))
+            finally:
+                mv.release()
+        for d in digests:
+            outer.update(d)
+        return outer.hexdigest()
+
+
+@lru_cache(maxsize=8)
 def _git_sha(repo_root: str | Path | None = None) -> str:
     """Best-effort git SHA for provenance.
 
     Returns empty string if not in a git worktree or git is unavailable.
+    Cached: the SHA cannot change within a process, and the subprocess
+    fork otherwise outweighs small conversions in batch loops. Tests
+    that switch worktrees can call ``_git_sha.cache_clear()``.
     """
     try:
         cwd = str(repo_root) if repo_root is not None else None
@@ -34,8 +124,10 @@ def _git_sha(repo_root: str | Path | None = None) -> str:
         return ""
 
 
+@lru_cache(maxsize=1)
 def _repo_root_from_here() -> Optional[Path]:
     # Walk upwards from this file; if a .git exists, treat that as root.
+    # Cached: the answer is fixed relative to __file__.
     p = Path(__file__).resolve()
     for parent in [p.parent] + list(p.parents):
         if (parent / ".git").exists():
@@ -43,6 +135,21 @@ def _repo_root_from_here() -> Optional[Path]:
     return None
 
 
+def _utc_timestamp() -> str:
+    """ISO-8601 UTC timestamp with microseconds and a ``Z`` suffix.
+
+    Formats straight from ``time.time_ns()`` via ``gmtime``: no datetime
+    object, no ``.replace("+00:00", "Z")`` pass, and the microsecond
+    field is always six digits (datetime.isoformat omits it when zero).
+    """
+    s, ns = divmod(time.time_ns(), 1_000_000_000)
+    t = time.gmtime(s)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{ns // 1000:06d}Z"
+    )
+
+
 def build_provenance(
     *,
     tool: str,
@@ -55,16 +162,21 @@ def build_provenance(
     contract_id: str = "",
     loss_hash: str = "",
     extra: Optional[Dict[str, Any]] = None,
+    tree_hash: bool = False,
+    precomputed_sha256: str = "",
 ) -> Dict[str, Any]:
     repo_root = _repo_root_from_here()
     prov: Dict[str, Any] = {
         "tool": tool,
         "tool_version": tool_version,
         "git_sha": _git_sha(repo_root),
-        "utc_timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "utc_timestamp": _utc_timestamp(),
         "input": {
             "path": str(input_path),
-            "sha256": _sha256_file(input_path),
+            # Callers that already hold the digest (e.g. they hashed
+            # while staging the input) pass it through and skip the
+            # extra read of the file.
+            "sha256": precomputed_sha256 or _sha256_file(input_path),
             "format": input_format,
         },
         "output": {
@@ -75,11 +187,26 @@ def build_provenance(
         "contract_id": contract_id,
         "loss_hash": loss_hash,
     }
+    if tree_hash:
+        # Parallel tree digest for multi-GB inputs where even SHA-NI is
+        # single-core bound; plain input.sha256 stays for compatibility.
+        prov["input"]["content_hash_tree"] = _sha256_file_parallel(input_path)
     if extra:
         prov["extra"] = extra
     return prov
 
 
-def stable_json_dumps(obj: Any) -> str:
-    """Deterministic JSON for hashing / embedding."""
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+try:  # orjson is ~3-5x faster on dict-heavy payloads; purely optional
+    import orjson as _orjson  # type: ignore
+
+    _ORJSON_OPTS = _orjson.OPT_SORT_KEYS | _orjson.OPT_NON_STR_KEYS
+
+    def stable_json_dumps(obj: Any) -> str:
+        """Deterministic JSON for hashing / embedding."""
+        return _orjson.dumps(obj, option=_ORJSON_OPTS).decode("utf-8")
+
+except ImportError:
+
+    def stable_json_dumps(obj: Any) -> str:
+        """Deterministic JSON for hashing / embedding."""
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
@@ -33,7 +33,26 @@ def upgrade_parquet(input_path: str, output_path: str, *, to_schema: str) -> Non
     if spec["format"] != "parquet":
         raise ValueError("upgrade_parquet only supports parquet targets")
 
-    ef = read(input_path, format="parquet")
     columnar = spec["layout"] == "columnar"
+
+    # When the stored layout already matches the target, the upgrade is
+    # metadata-only: rewrite the table Arrow-native (keeping the tuned
+    # encodings) without materializing a single Event. Only a layout
+    # change pays for the dataclass decode/encode roundtrip.
+    from .io.parquet import ParquetWriter, _require_pyarrow
+
+    pa, pq = _require_pyarrow()
+    src_columnar = "particles" in pq.read_schema(input_path).names
+    if src_columnar == columnar:
+        table = pq.read_table(input_path)
+        md = {
+            (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+            for k, v in (table.schema.metadata or {}).items()
+        }
+        md["hepconduit_schema"] = to_schema
+        ParquetWriter._write_table(pa, pq, table.replace_schema_metadata(md), output_path, columnar=columnar)
+        return
+
+    ef = read(input_path, format="parquet")
     # Writer will embed schema name in metadata
     write(output_path, ef, format="parquet", columnar=columnar, metadata={"hepconduit_schema": to_schema})
@@ -12,14 +12,27 @@ Provides checks for:
 from __future__ import annotations
 
 import math
+from array import array
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 
 from . import pdg as pdg_module
 from .models import Event, EventFile, Particle
 
+try:  # optional: vectorized per-particle checks for large events (hepconduit[numpy])
+    import numpy as _np
+except ImportError:
+    _np = None
 
-@dataclass
+from . import _validation_numba as _nbval
+
+# Below this many particles the plain loops win; array setup overhead
+# dominates for small events.
+_VECTORIZE_MIN_PARTICLES = 32
+
+
+@dataclass(slots=True)
 class ValidationIssue:
     """A single validation issue found in an event."""
 
@@ -45,48 +58,335 @@ class ValidationIssue:
 
 @dataclass
 class ValidationReport:
-    """Summary of all validation issues."""
+    """Summary of all validation issues.
+
+    Issues are stored columnar -- level strings (shared references to
+    three constants), packed int64 event/particle indices, and message
+    strings -- with level counts maintained on :meth:`add`. For
+    validation-heavy runs this keeps the report at four appends per
+    issue instead of retaining millions of dataclass instances;
+    ``ValidationIssue`` objects materialize lazily through ``issues``.
+    """
+
+    _levels: list[str] = field(default_factory=list, repr=False)
+    _event_numbers: array = field(default_factory=lambda: array("q"), repr=False)
+    _pidx: array = field(default_factory=lambda: array("q"), repr=False)
+    _messages: list[str] = field(default_factory=list, repr=False)
+    _counts: Counter = field(default_factory=Counter, repr=False, compare=False)
+    _cache: Optional[list[ValidationIssue]] = field(default=None, repr=False, compare=False)
+
+    def add(
+        self,
+        level: str,
+        event_number: int,
+        particle_index: Optional[int],
+        message: str,
+    ) -> None:
+        self._levels.append(level)
+        self._event_numbers.append(event_number)
+        self._pidx.append(-1 if particle_index is None else particle_index)
+        self._messages.append(message)
+        self._counts[level] += 1
+        self._cache = None
+
+    def extend(self, issues: list[ValidationIssue]) -> None:
+        # Batch the column appends: one C-level extend per column instead
+        # of four Python-level appends (plus bookkeeping) per issue, which
+        # also halves the list-growth reallocations on issue-heavy events.
+        if not issues:
+            return
+        self._levels.extend(iss.level for iss in issues)
+        self._event_numbers.extend(
+            iss.event_number for iss in issues
+        )
+        self._pidx.extend(
+            (-1 if iss.particle_index is None else iss.particle_index) for iss in issues
+        )
+        self._messages.extend(iss.message for iss in issues)
+        self._counts.update(iss.level for iss in issues)
+        self._cache = None
+
+    def tally(self, level: str) -> None:
+        """Count an issue without retaining it (summary-only mode)."""
+        self._counts[level] += 1
+
+    @property
+    def n_issues(self) -> int:
+        # Total counted, which can exceed the retained columns when a
+        # summary-only validation capped retention.
+        return sum(self._counts.values())
 
-    issues: list[ValidationIssue] = field(default_factory=list)
+    @property
+    def issues(self) -> list[ValidationIssue]:
+        if self._cache is None:
+            self._cache = [
+                ValidationIssue(l, e, (None if p == -1 else p), m)
+                for l, e, p, m in zip(self._levels, self._event_numbers, self._pidx, self._messages)
+            ]
+        return self._cache
 
     @property
     def n_errors(self) -> int:
-        return sum(1 for i in self.issues if i.level == "error")
+        return self._counts["error"]
 
     @property
     def n_warnings(self) -> int:
-        return sum(1 for i in self.issues if i.level == "warning")
+        return self._counts["warning"]
 
     @property
     def is_valid(self) -> bool:
         return self.n_errors == 0
 
     def __str__(self) -> str:
+        n = self.n_issues
         lines = [
             f"Validation: {self.n_errors} errors, {self.n_warnings} warnings, "
-            f"{len(self.issues)} total issues"
+            f"{n} total issues"
         ]
-        for issue in self.issues[:50]:  # Cap output
-            lines.append(f"  {issue}")
-        if len(self.issues) > 50:
-            lines.append(f"  ... and {len(self.issues) - 50} more")
+        # Cap output; only the shown slice is materialized.
+        for l, e, p, m in zip(self._levels[:50], self._event_numbers[:50],
+                              self._pidx[:50], self._messages[:50]):
+            lines.append(f"  {ValidationIssue(l, e, (None if p == -1 else p), m)}")
+        if n > 50:
+            lines.append(f"  ... and {n - 50} more")
         return "\n".join(lines)
 
     def summary(self) -> str:
         """One-line summary."""
         return (
             f"{self.n_errors} errors, {self.n_warnings} warnings "
-            f"across {len(self.issues)} issues"
+            f"across {self.n_issues} issues"
         )
 
     def to_dict(self) -> dict:
         return {
             "n_errors": self.n_errors,
             "n_warnings": self.n_warnings,
-            "n_issues": len(self.issues),
+            "n_issues": self.n_issues,
             "is_valid": self.is_valid,
-            "issues": [i.to_dict() for i in self.issues],
+            "issues": [
+                {
+                    "level": l,
+                    "event_number": e,
+                    "particle_index": None if p == -1 else p,
+                    "message": m,
+                }
+                for l, e, p, m in zip(self._levels, self._event_numbers, self._pidx, self._messages)
+            ],
+        }
+
+
+def _append_momentum_issues(
+    issues: list[ValidationIssue],
+    evt: int,
+    sum_in: list[float],
+    sum_out: list[float],
+    momentum_tolerance: float,
+) -> None:
+    total_energy = max(abs(sum_in[3]), abs(sum_out[3]), 1e-10)
+    labels = ["px", "py", "pz", "E"]
+
+    for j in range(4):
+        diff = abs(sum_in[j] - sum_out[j])
+        if diff / total_energy > momentum_tolerance:
+            issues.append(ValidationIssue(
+                "error", evt, None,
+                f"Momentum non-conservation in {labels[j]}: "
+                f"in={sum_in[j]:.6e}, out={sum_out[j]:.6e}, "
+                f"diff={diff:.6e} ({diff/total_energy:.4e} relative)"
+            ))
+
+
+def _validate_event_np(
+    event: Event,
+    evt: int,
+    check_momentum: bool,
+    check_pdg: bool,
+    check_energy: bool,
+    check_mass: bool,
+    momentum_tolerance: float,
+    mass_tolerance: float,
+) -> list[ValidationIssue]:
+    """Vectorized validate_event body for large events.
+
+    Pulls the particle list into column arrays once, then runs each
+    check as masked ndarray ops; only the flagged indices fall back to
+    Python to build their ValidationIssue. Issue order and message text
+    match the scalar loops below.
+    """
+    issues: list[ValidationIssue] = []
+    cols = event.particle_columns(("pdg_id", "status", "px", "py", "pz", "energy", "mass"))
+    pdg, status = cols["pdg_id"], cols["status"]
+    px, py, pz = cols["px"], cols["py"], cols["pz"]
+    energy, mass = cols["energy"], cols["mass"]
+
+    if check_pdg:
+        invalid = ~pdg_module.valid_mask(pdg)
+        if invalid.any():
+            pdg_l = pdg.tolist()
+            for i in _np.nonzero(invalid)[0].tolist():
+                issues.append(ValidationIssue(
+                    "warning", evt, i,
+                    f"Unknown/invalid PDG ID: {pdg_l[i]}"
+                ))
+
+    if _nbval.validate_particles is not None and (check_energy or check_mass or check_momentum):
+        # Single compiled pass flags everything; Python only formats the
+        # (rare) flagged entries. Same issue order and text as below.
+        bad_e, bad_m, computed, rel, sum_in, sum_out, n_in, n_out = _nbval.validate_particles(
+            px, py, pz, energy, mass, status, mass_tolerance
+        )
+        if check_energy:
+            for i in bad_e.tolist():
+                issues.append(ValidationIssue(
+                    "error", evt, i,
+                    f"Negative energy: {energy[i]:.6e} GeV"
+                ))
+        if check_mass:
+            for i, c, r in zip(bad_m.tolist(), computed.tolist(), rel.tolist()):
+                issues.append(ValidationIssue(
+                    "warning", evt, i,
+                    f"Mass inconsistency: stored={mass[i]:.6e}, "
+                    f"computed={c:.6e}, rel_diff={r:.4e}"
+                ))
+        if check_momentum and n_in and n_out:
+            _append_momentum_issues(issues, evt, sum_in.tolist(), sum_out.tolist(), momentum_tolerance)
+        return issues
+
+    if check_energy:
+        for i in _np.nonzero(energy < 0)[0].tolist():
+            issues.append(ValidationIssue(
+                "error", evt, i,
+                f"Negative energy: {energy[i]:.6e} GeV"
+            ))
+
+    if check_mass:
+        # Same arithmetic as Particle.computed_mass, including the
+        # tiny-negative clamp, so flagged values match the scalar path.
+        m2 = energy * energy - (px * px + (py * py + pz * pz))
+        m2 = _np.where((m2 < 0) & (m2 > -1e-8), 0.0, m2)
+        computed = _np.copysign(_np.sqrt(_np.abs(m2)), m2)
+        rel = _np.abs(computed - mass) / _np.maximum(_np.abs(mass), 1e-12)
+        flagged = (_np.abs(mass) >= 1e-3) & (rel > mass_tolerance)
+        for i in _np.nonzero(flagged)[0].tolist():
+            issues.append(ValidationIssue(
+                "warning", evt, i,
+                f"Mass inconsistency: stored={mass[i]:.6e}, "
+                f"computed={computed[i]:.6e}, rel_diff={rel[i]:.4e}"
+            ))
+
+    if check_momentum:
+        inc = status == -1
+        out = status == 1
+        if inc.any() and out.any():
+            sum_in = [float(px[inc].sum()), float(py[inc].sum()),
+                      float(pz[inc].sum()), float(energy[inc].sum())]
+            sum_out = [float(px[out].sum()), float(py[out].sum()),
+                       float(pz[out].sum()), float(energy[out].sum())]
+            _append_momentum_issues(issues, evt, sum_in, sum_out, momentum_tolerance)
+
+    return issues
+
+
+# Scalar check blocks, assembled per check_* combination and exec'd
+# into a specialized function (the same runtime-compilation approach as
+# filtering.CompiledFilter). The flags are constant across a file, so
+# specializing once removes the per-event flag branches and leaves only
+# the enabled loops in the bytecode.
+_SCALAR_HEAD = (
+    "def _specialized(event, evt, issues, momentum_tolerance, mass_tolerance):\n"
+)
+
+_SCALAR_PDG_BLOCK = """\
+    # --- PDG ID check ---
+    for i, p in enumerate(event.particles):
+        if not pdg_module.is_valid_pdg_id(p.pdg_id):
+            issues.append(ValidationIssue(
+                "warning", evt, i,
+                f"Unknown/invalid PDG ID: {p.pdg_id}"
+            ))
+"""
+
+_SCALAR_ENERGY_BLOCK = """\
+    # --- Energy positivity ---
+    for i, p in enumerate(event.particles):
+        if p.energy < 0:
+            issues.append(ValidationIssue(
+                "error", evt, i,
+                f"Negative energy: {p.energy:.6e} GeV"
+            ))
+"""
+
+_SCALAR_MASS_BLOCK = """\
+    # --- Mass consistency ---
+    for i, p in enumerate(event.particles):
+        if p.mass == 0:
+            continue
+        if abs(p.mass) < 1e-3:
+            continue
+        computed = p.computed_mass
+        rel_diff = abs(computed - p.mass) / max(abs(p.mass), 1e-12)
+        if rel_diff > mass_tolerance:
+            issues.append(ValidationIssue(
+                "warning", evt, i,
+                f"Mass inconsistency: stored={p.mass:.6e}, "
+                f"computed={computed:.6e}, rel_diff={rel_diff:.4e}"
+            ))
+"""
+
+# All eight sums in a single pass; building incoming/outgoing lists and
+# summing each component separately walked the particle list ten times.
+_SCALAR_MOMENTUM_BLOCK = """\
+    # --- Momentum conservation ---
+    sum_in = [0.0, 0.0, 0.0, 0.0]
+    sum_out = [0.0, 0.0, 0.0, 0.0]
+    n_in = n_out = 0
+    for p in event.particles:
+        s = p.status
+        if s == -1:
+            sum_in[0] += p.px
+            sum_in[1] += p.py
+            sum_in[2] += p.pz
+            sum_in[3] += p.energy
+            n_in += 1
+        elif s == 1:
+            sum_out[0] += p.px
+            sum_out[1] += p.py
+            sum_out[2] += p.pz
+            sum_out[3] += p.energy
+            n_out += 1
+
+    if n_in and n_out:
+        _append_momentum_issues(issues, evt, sum_in, sum_out, momentum_tolerance)
+"""
+
+_SPECIALIZED_VALIDATORS: dict[tuple[bool, bool, bool, bool], Callable] = {}
+
+
+def _scalar_validator(
+    check_momentum: bool, check_pdg: bool, check_energy: bool, check_mass: bool
+):
+    key = (check_momentum, check_pdg, check_energy, check_mass)
+    fn = _SPECIALIZED_VALIDATORS.get(key)
+    if fn is None:
+        src = _SCALAR_HEAD
+        if check_pdg:
+            src += _SCALAR_PDG_BLOCK
+        if check_energy:
+            src += _SCALAR_ENERGY_BLOCK
+        if check_mass:
+            src += _SCALAR_MASS_BLOCK
+        if check_momentum:
+            src += _SCALAR_MOMENTUM_BLOCK
+        src += "    return issues\n"
+        ns = {
+            "pdg_module": pdg_module,
+            "ValidationIssue": ValidationIssue,
+            "_append_momentum_issues": _append_momentum_issues,
         }
+        exec(compile(src, "<validate_event specialization>", "exec"), ns)
+        fn = _SPECIALIZED_VALIDATORS[key] = ns["_specialized"]
+    return fn
 
 
 def validate_event(
@@ -120,72 +420,16 @@ def validate_event(
         issues.append(ValidationIssue("warning", evt, None, "Event has no particles"))
         return issues
 
-    # --- PDG ID check ---
-    if check_pdg:
-        for i, p in enumerate(event.particles):
-            if not pdg_module.is_valid_pdg_id(p.pdg_id):
-                issues.append(ValidationIssue(
-                    "warning", evt, i,
-                    f"Unknown/invalid PDG ID: {p.pdg_id}"
-                ))
-
-    # --- Energy positivity ---
-    if check_energy:
-        for i, p in enumerate(event.particles):
-            if p.energy < 0:
-                issues.append(ValidationIssue(
-                    "error", evt, i,
-                    f"Negative energy: {p.energy:.6e} GeV"
-                ))
-
-    # --- Mass consistency ---
-    if check_mass:
-        for i, p in enumerate(event.particles):
-            if p.mass == 0:
-                continue
-            if abs(p.mass) < 1e-3:
-                continue
-            computed = p.computed_mass
-            rel_diff = abs(computed - p.mass) / max(abs(p.mass), 1e-12)
-            if rel_diff > mass_tolerance:
-                issues.append(ValidationIssue(
-                    "warning", evt, i,
-                    f"Mass inconsistency: stored={p.mass:.6e}, "
-                    f"computed={computed:.6e}, rel_diff={rel_diff:.4e}"
-                ))
-
-    # --- Momentum conservation ---
-    if check_momentum:
-        incoming = [p for p in event.particles if p.status == -1]
-        outgoing = [p for p in event.particles if p.status == 1]
-
-        if incoming and outgoing:
-            sum_in = [
-                sum(p.px for p in incoming),
-                sum(p.py for p in incoming),
-                sum(p.pz for p in incoming),
-                sum(p.energy for p in incoming),
-            ]
-            sum_out = [
-                sum(p.px for p in outgoing),
-                sum(p.py for p in outgoing),
-                sum(p.pz for p in outgoing),
-                sum(p.energy for p in outgoing),
-            ]
-
-            total_energy = max(abs(sum_in[3]), abs(sum_out[3]), 1e-10)
-            labels = ["px", "py", "pz", "E"]
-
-            for j in range(4):
-                diff = abs(sum_in[j] - sum_out[j])
-                if diff / total_energy > momentum_tolerance:
-                    issues.append(ValidationIssue(
-                        "error", evt, None,
-                        f"Momentum non-conservation in {labels[j]}: "
-                        f"in={sum_in[j]:.6e}, out={sum_out[j]:.6e}, "
-                        f"diff={diff:.6e} ({diff/total_energy:.4e} relative)"
-                    ))
+    if _np is not None and len(event.particles) >= _VECTORIZE_MIN_PARTICLES:
+        return _validate_event_np(
+            event, evt,
+            check_momentum, check_pdg, check_energy, check_mass,
+            momentum_tolerance, mass_tolerance,
+        )
 
+    _scalar_validator(check_momentum, check_pdg, check_energy, check_mass)(
+        event, evt, issues, momentum_tolerance, mass_tolerance
+    )
     return issues
 
 
@@ -199,6 +443,8 @@ def validate(
     momentum_tolerance: float = 1e-4,
     mass_tolerance: float = 1e-2,
     max_events: int = -1,
+    summary_only: bool = False,
+    max_issues_kept: int = 100,
 ) -> ValidationReport:
     """Validate an entire event file.
 
@@ -211,6 +457,10 @@ def validate(
         momentum_tolerance: Relative tolerance for momentum conservation.
         mass_tolerance: Relative tolerance for mass check.
         max_events: Maximum number of events to check (-1 for all).
+        summary_only: Keep at most max_issues_kept issues for
+            diagnostics and only count the rest -- for callers that
+            just read is_valid / summary() on issue-heavy files.
+        max_issues_kept: Retention cap used when summary_only is set.
 
     Returns:
         A ValidationReport summarizing all issues found.
@@ -230,7 +480,14 @@ def validate(
             momentum_tolerance=momentum_tolerance,
             mass_tolerance=mass_tolerance,
         )
-        report.issues.extend(issues)
+        if summary_only:
+            for iss in issues:
+                if len(report._levels) < max_issues_kept:
+                    report.add(iss.level, iss.event_number, iss.particle_index, iss.message)
+                else:
+                    report.tally(iss.level)
+        else:
+            report.extend(issues)
 
     return report
 
@@ -269,6 +526,10 @@ def validate_stream(
         if errors and strict:
             raise ValueError(str(errors[0]))
         if issues:
-            event.extra = dict(event.extra)
+            # Copy-on-write: only events whose reader shared one extra
+            # dict across events pay for a copy before annotation.
+            if event._extra_shared:
+                event.extra = dict(event.extra)
+                event._extra_shared = False
             event.extra["validation_issues"] = [str(x) for x in issues]
         yield event
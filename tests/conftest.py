@@ -10,6 +10,8 @@ at test collection time if they are missing.
 
 from __future__ import annotations
 
+import hashlib
+from contextlib import contextmanager
 from pathlib import Path
 
 
@@ -22,39 +24,80 @@ def _ensure_standard_fixtures(fixtures: Path) -> None:
     lhe = fixtures / "pp_to_wpenu.lhe"
     hepmc = fixtures / "pp_to_wpenu.hepmc"
 
-    # A tiny, deterministic, *valid enough* LHE file with one event.
+    # A small, deterministic, momentum-conserving LHE file with three events.
     if not lhe.exists():
         _write_text(
             lhe,
             """<LesHouchesEvents version="3.0">
+<!--
+File generated with MadGraph5_aMC@NLO
+-->
+<header>
+<generator name="MadGraph5_aMC@NLO" version="2.9.18">MadGraph5_aMC@NLO v2.9.18</generator>
+</header>
 <init>
-2212 2212 6500 6500 0 0 0 0 0 0
-1.0 0.0 1.0 1
+2212 2212 6500 6500 0 0 0 0 0 1
+1.0 0.01 1.0 1
 </init>
 <event>
-4 1 1.0 91.1876 0.00729735256 0.118
-  11 1 1 2 0 0  0.0 0.0 40.1895 40.1895 0.000511 0 9
- -11 1 1 2 0 0  0.0 0.0 -40.1895 40.1895 0.000511 0 9
-  12 1 1 2 0 0  0.0 0.0 10.0 10.0 0.0 0 9
- -12 1 1 1 2 0 0  0.0 0.0 -10.0 10.0 0.0 0 9
+5 1 1.0 80.379 0.00729735256 0.118
+  2 -1 0 0 501 0  0.0 0.0 40.1895 40.1895 0.0 0 9
+ -1 -1 0 0 0 501  0.0 0.0 -40.1895 40.1895 0.0 0 9
+ 24  2 1 2 0 0  0.0 0.0 0.0 80.379 80.379 0 9
+-11  1 3 3 0 0  37.61876949 11.63684907 8.0379 40.1895 0.000511 0 9
+ 12  1 3 3 0 0  -37.61876949 -11.63684907 -8.0379 40.1895 0.0 0 9
+</event>
+<event>
+5 1 1.0 80.379 0.00729735256 0.118
+  2 -1 0 0 501 0  0.0 0.0 40.1895 40.1895 0.0 0 9
+ -1 -1 0 0 0 501  0.0 0.0 -40.1895 40.1895 0.0 0 9
+ 24  2 1 2 0 0  0.0 0.0 0.0 80.379 80.379 0 9
+-11  1 3 3 0 0  -4.484449112 34.51502063 -20.09475 40.1895 0.000511 0 9
+ 12  1 3 3 0 0  4.484449112 -34.51502063 20.09475 40.1895 0.0 0 9
+</event>
+<event>
+5 1 1.0 80.379 0.00729735256 0.118
+  2 -1 0 0 501 0  0.0 0.0 40.1895 40.1895 0.0 0 9
+ -1 -1 0 0 0 501  0.0 0.0 -40.1895 40.1895 0.0 0 9
+ 24  2 1 2 0 0  0.0 0.0 0.0 80.379 80.379 0 9
+-11  1 3 3 0 0  -29.65439825 7.307003683 26.123175 40.1895 0.000511 0 9
+ 12  1 3 3 0 0  29.65439825 -7.307003683 -26.123175 40.1895 0.0 0 9
 </event>
 </LesHouchesEvents>
 """,
         )
 
-    # A tiny HepMC3 Asciiv3 file with one event.
+    # The matching HepMC3 Asciiv3 file (same three events, converted).
     if not hepmc.exists():
         _write_text(
             hepmc,
-            """HepMC::Version 3.02.05
-HepMC::Asciiv3-START_EVENT_LISTING
+            """HepMC::Version 3.0.0
+HepMC::Asciiv3
 U GEV MM
 E 1
-W 1.0
-V 1 0 0 0 0 0 2 1 2
-P 1 11 1 0 0 40.1895 40.1895 0.000511 1 0
-P 2 -11 1 0 0 -40.1895 40.1895 0.000511 1 0
-HepMC::Asciiv3-END_EVENT_LISTING
+V -2 0 0 0 0 1 2 3 4 5
+V -1 0 0 0 0 2 1 1 2 3
+P 1 2 4 0 0 40.189500000000002 40.189500000000002 0 0 -1
+P 2 -1 4 0 0 -40.189500000000002 40.189500000000002 0 0 -1
+P 3 24 2 0 0 0 80.379000000000005 80.379000000000005 -1 -2
+P 4 -11 1 37.618769489999998 11.63684907 8.0379000000000005 40.189500000000002 0.00051099999999999995 -2 0
+P 5 12 1 -37.618769489999998 -11.63684907 -8.0379000000000005 40.189500000000002 0 -2 0
+E 2
+V -2 0 0 0 0 1 2 3 4 5
+V -1 0 0 0 0 2 1 1 2 3
+P 1 2 4 0 0 40.189500000000002 40.189500000000002 0 0 -1
+P 2 -1 4 0 0 -40.189500000000002 40.189500000000002 0 0 -1
+P 3 24 2 0 0 0 80.379000000000005 80.379000000000005 -1 -2
+P 4 -11 1 -4.4844491120000001 34.515020630000002 -20.094750000000001 40.189500000000002 0.00051099999999999995 -2 0
+P 5 12 1 4.4844491120000001 -34.515020630000002 20.094750000000001 40.189500000000002 0 -2 0
+E 3
+V -2 0 0 0 0 1 2 3 4 5
+V -1 0 0 0 0 2 1 1 2 3
+P 1 2 4 0 0 40.189500000000002 40.189500000000002 0 0 -1
+P 2 -1 4 0 0 -40.189500000000002 40.189500000000002 0 0 -1
+P 3 24 2 0 0 0 80.379000000000005 80.379000000000005 -1 -2
+P 4 -11 1 -29.65439825 7.3070036829999996 26.123175 40.189500000000002 0.00051099999999999995 -2 0
+P 5 12 1 29.65439825 -7.3070036829999996 -26.123175 40.189500000000002 0 -2 0
 """,
     )
 
@@ -111,10 +154,48 @@ HepMC::Asciiv3-END_EVENT_LISTING
     )
 
 
+@contextmanager
+def _fixture_lock(fixtures: Path):
+    """Serialize fixture generation across pytest-xdist workers."""
+    fixtures.mkdir(parents=True, exist_ok=True)
+    try:
+        from filelock import FileLock
+    except ImportError:
+        FileLock = None
+    if FileLock is not None:
+        with FileLock(str(fixtures / ".lock")):
+            yield
+        return
+    try:  # POSIX fallback; Windows without filelock runs unlocked
+        import fcntl
+    except ImportError:  # pragma: no cover
+        yield
+        return
+    with open(fixtures / ".lock", "w") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
 def pytest_configure(config):  # noqa: D401
-    """Ensure fixtures exist before any tests run."""
+    """Ensure fixtures exist before any tests run.
+
+    A versioned sentinel (hash of this file, which embeds the fixture
+    content) makes repeat runs a single stat; the lock keeps parallel
+    xdist workers from racing on the writes.
+    """
 
     root = Path(__file__).resolve().parent
     fixtures = root / "fixtures"
-    _ensure_standard_fixtures(fixtures)
-    _ensure_edgecase_fixtures(fixtures)
+    version = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()[:12]
+    sentinel = fixtures / f".generated.{version}"
+    if sentinel.exists():
+        return
+    with _fixture_lock(fixtures):
+        if sentinel.exists():  # another worker generated while we waited
+            return
+        _ensure_standard_fixtures(fixtures)
+        _ensure_edgecase_fixtures(fixtures)
+        sentinel.touch()
@@ -78,3 +78,43 @@ def test_cli_info(tmp_path: Path):
     res = subprocess.run(cmd, capture_output=True, text=True)
     assert res.returncode == 0
     assert '"n_events"' in res.stdout
+
+
+def test_passthrough_copy(tmp_path: Path):
+    import gzip
+
+    from hepconduit.io.registry import get_writer
+
+    writer = get_writer("lhe")
+    raw = LHE_FILE.read_bytes()
+
+    # plain -> plain is byte-identical
+    plain = tmp_path / "copy.lhe"
+    writer.passthrough(LHE_FILE, plain)
+    assert plain.read_bytes() == raw
+
+    # gz -> plain decompresses back to the original bytes
+    src_gz = tmp_path / "src.lhe.gz"
+    src_gz.write_bytes(gzip.compress(raw))
+    out = tmp_path / "out.lhe"
+    writer.passthrough(src_gz, out)
+    assert out.read_bytes() == raw
+
+    # gz -> gz copies the compressed bytes verbatim (no recompression)
+    out_gz = tmp_path / "out.lhe.gz"
+    writer.passthrough(src_gz, out_gz)
+    assert out_gz.read_bytes() == src_gz.read_bytes()
+
+    # plain -> gz recompresses to equivalent content
+    round_gz = tmp_path / "round.lhe.gz"
+    writer.passthrough(LHE_FILE, round_gz)
+    assert gzip.decompress(round_gz.read_bytes()) == raw
+
+
+def test_stable_json_dumps_canonical():
+    # Pinned canonical form: downstream hashes depend on the exact
+    # bytes, so the stdlib and orjson encoders must agree on it.
+    from hepconduit.provenance import stable_json_dumps
+
+    obj = {"b": [1, 2.5, None], "a": {"y": True, "x": "s"}, "c": ""}
+    assert stable_json_dumps(obj) == '{"a":{"x":"s","y":true},"b":[1,2.5,null],"c":""}'
@@ -40,3 +40,93 @@ def test_parquet_flat_roundtrip(tmp_path):
     ef2 = read(outp, format="parquet")
     assert len(ef2.events) == len(ef.events)
     assert _fingerprints(ef, include_graph=False, include_weights=False) == _fingerprints(ef2, include_graph=False, include_weights=False)
+
+
+def test_parquet_flat_normalized_roundtrip(tmp_path):
+    import pyarrow.parquet as pq
+
+    inp = "tests/fixtures/pp_to_wpenu.lhe"
+    ef = read(inp, format="lhe")
+
+    outp = tmp_path / "out_flat_norm.parquet"
+    write(outp, ef, format="parquet", columnar=False, normalize_event_columns=True)
+
+    # The layout actually nulls event columns on non-first rows.
+    table = pq.read_table(outp)
+    assert table.column("process_id").null_count > 0
+    assert table.column("weights").null_count > 0
+
+    ef2 = read(outp, format="parquet")
+    assert len(ef2.events) == len(ef.events)
+    assert _fingerprints(ef) == _fingerprints(ef2)
+    for a, b in zip(ef.events, ef2.events):
+        assert b.process_id == a.process_id
+        assert b.scale == pytest.approx(a.scale)
+        assert list(b.weights) == pytest.approx(list(a.weights))
+
+
+def test_parquet_flat_normalized_batch_boundary(tmp_path):
+    # An event whose rows straddle the 8192-row iter_batches boundary:
+    # its metadata lives only on the first row (in the first batch), so
+    # the streaming carry merge must keep it while absorbing the tail.
+    from hepconduit.io.parquet import _ITER_BATCH_ROWS, ParquetReader
+    from hepconduit.models import Event, EventFile, Particle, RunInfo
+
+    half = _ITER_BATCH_ROWS // 2
+    def _mk(evn, n):
+        parts = [
+            Particle(22, 1, 0.0, 0.0, float(i), float(i))
+            for i in range(n)
+        ]
+        return Event(
+            event_number=evn, particles=parts, process_id=evn * 10,
+            scale=float(evn), weights=[1.0 + evn], n_particles=n,
+        )
+
+    # Event 2 spans rows [half, half + _ITER_BATCH_ROWS), crossing the boundary.
+    ef = EventFile(
+        run_info=RunInfo(),
+        events=[_mk(1, half), _mk(2, _ITER_BATCH_ROWS), _mk(3, 7)],
+        format_name="parquet",
+    )
+
+    outp = tmp_path / "boundary_norm.parquet"
+    write(outp, ef, format="parquet", columnar=False, normalize_event_columns=True)
+
+    streamed = list(ParquetReader().iter_events(str(outp)))
+    assert [ev.event_number for ev in streamed] == [1, 2, 3]
+    assert [len(ev.particles) for ev in streamed] == [half, _ITER_BATCH_ROWS, 7]
+    for a, b in zip(ef.events, streamed):
+        assert b.process_id == a.process_id
+        assert b.scale == pytest.approx(a.scale)
+        assert list(b.weights) == pytest.approx(list(a.weights))
+    assert _fingerprints(ef) == _fingerprints(
+        EventFile(run_info=RunInfo(), events=streamed, format_name="parquet")
+    )
+
+
+def test_parquet_columnar_preserves_event_order(tmp_path):
+    # Columnar layout: one row per event, so row order is the event
+    # order -- a non-monotonic input must come back in input order, not
+    # re-sorted by event_number.
+    from hepconduit.models import Event, EventFile, Particle, RunInfo
+
+    def _mk(evn):
+        return Event(
+            event_number=evn,
+            particles=[Particle(22, 1, 0.0, 0.0, 1.0, 1.0)],
+            n_particles=1,
+        )
+
+    ef = EventFile(
+        run_info=RunInfo(),
+        events=[_mk(30), _mk(20), _mk(10)],
+        format_name="parquet",
+    )
+
+    outp = tmp_path / "unordered_columnar.parquet"
+    write(outp, ef, format="parquet", columnar=True)
+
+    ef2 = read(outp, format="parquet")
+    assert [ev.event_number for ev in ef2.events] == [30, 20, 10]
+    assert _fingerprints(ef) == _fingerprints(ef2)